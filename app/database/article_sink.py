@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+🚰 SINK STREAMING MONGODB
+Écriture par lots des articles au fil du scraping
+"""
+
+import logging
+import time
+from typing import List
+
+from app.database.mongo_service import MongoService
+from app.models.article import ArticleLike
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleSink:
+    """Tampon d'articles vidé dans MongoDB tous les N articles ou toutes les T secondes"""
+    
+    def __init__(self, service: MongoService, batch_size: int = 50, flush_interval: float = 5.0):
+        """
+        Args:
+            service: Service MongoDB cible
+            batch_size: Nombre d'articles déclenchant une écriture
+            flush_interval: Délai maximal (s) entre deux écritures, vérifié à chaque ajout
+        """
+        self.service = service
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.saved = 0
+        self.failed_batches = 0
+        self._buffer: List[ArticleLike] = []
+        self._last_flush = time.monotonic()
+    
+    def add(self, article: ArticleLike):
+        self._buffer.append(article)
+        if (len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+    
+    def flush(self) -> bool:
+        """Écrit le tampon courant, retourne False en cas d'échec"""
+        
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return True
+        
+        batch, self._buffer = self._buffer, []
+        if self.service.save_articles(batch):
+            self.saved += len(batch)
+            return True
+        
+        self.failed_batches += 1
+        logger.error(f"❌ Lot de {len(batch)} articles non sauvegardé")
+        return False
+    
+    @property
+    def ok(self) -> bool:
+        return self.failed_batches == 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        # Les articles déjà tamponnés sont écrits même si le scraping a échoué
+        self.flush()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+⚡ SERVICE MONGODB ASYNCHRONE (MOTOR)
+Mêmes opérations que MongoService, sans bloquer la boucle asyncio
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Union
+import logging
+
+from pymongo import TEXT
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from app.database.client_registry import MONGODB_URI, client_options
+from app.database.mongo_service import (
+    BACKFILL_PROJECTION, BACKFILL_QUERY, BULK_CHUNK_SIZE, COLLECTION_NAME, DATABASE_NAME, LIST_PROJECTION,
+    META_COLLECTION_NAME, PAGE_KEY, PAGE_SORT, SAVED_SORT, TEXT_INDEX_WEIGHTS, MongoService, _page_size,
+    backfill_operation, decode_cursor, regex_search_filter, text_search_pipeline, upsert_operation
+)
+from app.models.article import ArticleBatch, ArticleLike, to_documents
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+except ImportError:  # Optionnel : pip install motor
+    AsyncIOMotorClient = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMongoService:
+    """Service MongoDB asynchrone pour les articles (à créer via AsyncMongoService.create)"""
+    
+    def __init__(self, client: Optional["AsyncIOMotorClient"] = None,
+                 database_name: str = DATABASE_NAME, collection_name: str = COLLECTION_NAME):
+        """
+        Args:
+            client: Client Motor existant (par défaut, connexion à MONGODB_URI)
+            database_name: Base utilisée (scraper_db par défaut)
+            collection_name: Collection des articles
+        """
+        if client is None:
+            if AsyncIOMotorClient is None:
+                raise ImportError("AsyncMongoService nécessite motor (pip install motor)")
+            # Mêmes réglages de pool que le client pymongo partagé (motor a sa propre boucle)
+            client = AsyncIOMotorClient(MONGODB_URI, **client_options())
+        
+        self.client = client
+        self.database_name = database_name
+        self.collection_name = collection_name
+        self.db = client[database_name]
+        self.collection = self.db[collection_name]
+        self.meta = self.db[META_COLLECTION_NAME]
+        self.last_write_errors: List[Dict] = []
+        self.text_search = False
+    
+    @classmethod
+    async def create(cls, **kwargs) -> "AsyncMongoService":
+        """Service connecté, index en place"""
+        service = cls(**kwargs)
+        await service.connect()
+        return service
+    
+    async def connect(self):
+        """Test de connexion et création des index (mêmes index que MongoService)"""
+        try:
+            await self.client.admin.command('ping')
+            await self._ensure_indexes()
+            logger.info("✅ MongoDB connecté (motor)")
+        except Exception as e:
+            logger.error(f"❌ Erreur MongoDB: {e}")
+            raise
+    
+    async def _ensure_indexes(self):
+        await self.collection.create_index('id', unique=True, name='id_unique')
+        await self.collection.create_index('url', name='url')
+        await self.collection.create_index(PAGE_SORT, name='published_at_id')
+        await self.collection.create_index(SAVED_SORT, name='saved_at_id')
+        await self._backfill_published_at()
+        
+        try:
+            await self.collection.create_index(
+                [('title', TEXT), ('excerpt', TEXT), ('category', TEXT)],
+                weights=TEXT_INDEX_WEIGHTS,
+                default_language='french',
+                name='articles_text'
+            )
+            self.text_search = True
+        except OperationFailure as e:
+            logger.warning(f"⚠️ Index texte indisponible, recherche par regex: {e}")
+            self.text_search = False
+    
+    async def _backfill_published_at(self):
+        """Voir MongoService._backfill_published_at"""
+        operations = [backfill_operation(document)
+                      async for document in self.collection.find(BACKFILL_QUERY, BACKFILL_PROJECTION)]
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+            logger.info(f"📅 Date de publication ajoutée à {len(operations)} articles existants")
+    
+    async def save_articles(self, articles: Union[ArticleBatch, Sequence[ArticleLike]],
+                            chunk_size: int = BULK_CHUNK_SIZE) -> bool:
+        """Sauvegarde idempotente des articles (voir MongoService.save_articles)"""
+        
+        if not articles:
+            return False
+        
+        documents = to_documents(articles)
+        self.last_write_errors = []
+        now = datetime.now()
+        upserted = modified = 0
+        
+        try:
+            for offset in range(0, len(documents), chunk_size):
+                operations = [upsert_operation(document, now) for document in documents[offset:offset + chunk_size]]
+                
+                try:
+                    result = await self.collection.bulk_write(operations, ordered=False)
+                    upserted += result.upserted_count
+                    modified += result.modified_count
+                except BulkWriteError as e:
+                    details = e.details
+                    upserted += details.get('nUpserted', 0)
+                    modified += details.get('nModified', 0)
+                    for error in details.get('writeErrors', []):
+                        error = dict(error, index=offset + error['index'])
+                        self.last_write_errors.append(error)
+                        logger.error(f"❌ Article {error['index']} non sauvegardé: {error.get('errmsg')}")
+            
+            logger.info(f"💾 {upserted} articles ajoutés, {modified} mis à jour")
+            if upserted or modified:
+                await self._bump_generation()
+            if self.last_write_errors:
+                logger.warning(f"⚠️ {len(self.last_write_errors)} articles en erreur")
+                return False
+            
+            return True
+        
+        except Exception as e:
+            logger.error(f"❌ Erreur sauvegarde: {e}")
+            return False
+    
+    async def _bump_generation(self):
+        try:
+            await self.meta.update_one({'_id': self.collection_name}, {'$inc': {'generation': 1}}, upsert=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Génération non incrémentée: {e}")
+    
+    async def get_generation(self) -> int:
+        document = await self.meta.find_one({'_id': self.collection_name}, {'generation': 1})
+        return document['generation'] if document else 0
+    
+    async def get_known_articles(self, article_ids: List[str]) -> Dict[str, Dict]:
+        """Articles déjà en base pour ces IDs (une seule requête groupée)"""
+        
+        if not article_ids:
+            return {}
+        
+        try:
+            cursor = self.collection.find(
+                {'id': {'$in': list(article_ids)}},
+                {'_id': 0, 'id': 1, 'url': 1, 'title': 1, 'date': 1}
+            )
+            known = {doc['id']: doc async for doc in cursor}
+            logger.info(f"🔎 {len(known)}/{len(article_ids)} articles déjà en base")
+            return known
+        
+        except Exception as e:
+            logger.error(f"❌ Erreur lecture articles connus: {e}")
+            return {}
+    
+    async def get_articles(self, limit: int = 15) -> List[Dict]:
+        """Derniers articles publiés, avec formatage des dates"""
+        return (await self.get_articles_page(limit))['articles']
+    
+    async def get_articles_page(self, limit: int = 15, cursor: Optional[str] = None,
+                                since: Optional[datetime] = None, until: Optional[datetime] = None) -> Dict:
+        """
+        Page d'articles du plus récent au plus ancien (voir MongoService.get_articles_page)
+        
+        Raises:
+            ValueError: Curseur invalide
+        """
+        
+        limit = _page_size(limit)
+        query = MongoService._page_query(cursor, since, until)
+        
+        try:
+            documents = await self.collection.find(query, LIST_PROJECTION).sort(PAGE_SORT).to_list(limit + 1)
+            page = MongoService._paginate(documents, limit, PAGE_KEY)
+            logger.info(f"📄 {len(page['articles'])} articles récupérés")
+            return page
+        
+        except Exception as e:
+            logger.error(f"❌ Erreur récupération: {e}")
+            return {'articles': [], 'next_cursor': None}
+    
+    async def search_articles(self, query: str, limit: int = 15) -> List[Dict]:
+        """Première page de résultats de recherche, triée par pertinence"""
+        return (await self.search_articles_page(query, limit))['articles']
+    
+    async def search_articles_page(self, query: str, limit: int = 15, cursor: Optional[str] = None) -> Dict:
+        """
+        Recherche dans les articles (voir MongoService.search_articles_page)
+        
+        Raises:
+            ValueError: Curseur invalide
+        """
+        
+        if not query:
+            return await self.get_articles_page(limit, cursor)
+        
+        limit = _page_size(limit)
+        position = decode_cursor(cursor) if cursor else None
+        
+        try:
+            page = None
+            
+            if self.text_search and (position is None or 'score' in position):
+                try:
+                    documents = await self.collection.aggregate(
+                        text_search_pipeline(query, limit + 1, position)
+                    ).to_list(None)
+                    page = MongoService._paginate(documents, limit, 'score')
+                except OperationFailure as e:
+                    logger.warning(f"⚠️ Recherche texte impossible, repli sur regex: {e}")
+                    if position is not None:
+                        raise ValueError("Curseur de recherche expiré") from e
+            
+            if page is None:
+                if position is not None and PAGE_KEY not in position:
+                    raise ValueError(f"Curseur invalide: {cursor!r}")
+                documents = await self.collection.find(
+                    regex_search_filter(query, position), LIST_PROJECTION
+                ).sort(PAGE_SORT).to_list(limit + 1)
+                page = MongoService._paginate(documents, limit, PAGE_KEY)
+            
+            logger.info(f"🔍 {len(page['articles'])} articles trouvés pour '{query}'")
+            return page
+        
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Erreur recherche: {e}")
+            return {'articles': [], 'next_cursor': None}
+    
+    async def iter_articles_since(self, since: Optional[datetime] = None,
+                                  projection: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """Articles sauvegardés depuis `since` (voir MongoService.iter_articles_since)"""
+        query = {'saved_at': {'$gte': since}} if since else {}
+        async for article in self.collection.find(query, projection).sort('saved_at', 1):
+            yield MongoService._format_article(article)
+    
+    async def get_stats(self) -> Dict:
+        """Statistiques de la base"""
+        
+        try:
+            total = await self.collection.count_documents({})
+            last_article = await self.collection.find_one({}, {'saved_at': 1}, sort=[('saved_at', -1)])
+            latest = await self.collection.find_one({}, {PAGE_KEY: 1}, sort=PAGE_SORT)
+            return MongoService._format_stats(total, last_article, latest)
+        
+        except Exception as e:
+            logger.error(f"❌ Erreur stats: {e}")
+            return {'total_articles': 0, 'last_update': 'Erreur', 'status': 'Erreur'}
+    
+    def close(self):
+        """Fermeture de la connexion"""
+        if self.client:
+            self.client.close()
+            logger.info("🔒 MongoDB fermé")
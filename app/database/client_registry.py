@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+🔌 REGISTRE DES CLIENTS MONGODB
+Un MongoClient par URI et par processus, créé à la première utilisation et partagé
+par tous les services ; pool configurable et observé par un ConnectionPoolListener
+"""
+
+import atexit
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import MongoClient, monitoring
+
+from app.monitoring.metrics import Gauge
+from app.monitoring.pipeline import COMMAND_MONITOR
+
+logger = logging.getLogger(__name__)
+
+MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27018/')
+ATLAS_CA_FILE = os.path.normpath(os.path.join(os.path.dirname(__file__), '../../atlas-cert.pem'))
+
+# Pool de connexions et délais (valeurs pymongo par défaut : 100 / 0 / 30 s / illimité)
+MAX_POOL_SIZE = int(os.getenv('MONGODB_MAX_POOL_SIZE', 50))
+MIN_POOL_SIZE = int(os.getenv('MONGODB_MIN_POOL_SIZE', 0))
+SERVER_SELECTION_TIMEOUT_MS = int(os.getenv('MONGODB_SERVER_SELECTION_TIMEOUT_MS', 5000))
+CONNECT_TIMEOUT_MS = int(os.getenv('MONGODB_CONNECT_TIMEOUT_MS', 5000))
+MAX_IDLE_TIME_MS = int(os.getenv('MONGODB_MAX_IDLE_TIME_MS', 60000))
+
+# Compression réseau par ordre de préférence ; zstd et snappy exigent leur module
+COMPRESSORS = os.getenv('MONGODB_COMPRESSORS', 'zstd,snappy,zlib')
+COMPRESSOR_MODULES = {'zstd': 'zstandard', 'snappy': 'snappy', 'zlib': 'zlib'}
+
+
+def available_compressors(preferred: str = COMPRESSORS) -> List[str]:
+    """Compresseurs demandés dont le module Python est installé"""
+    available = []
+    for name in (c.strip() for c in preferred.split(',')):
+        module = COMPRESSOR_MODULES.get(name)
+        if not module:
+            continue
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Compteurs du pool de connexions (tous clients du processus confondus)"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.pools_created = 0
+            self.pools_cleared = 0
+            self.connections_created = 0
+            self.connections_closed = 0
+            self.checked_out = 0
+            self.checkout_failures = 0
+            self.in_use = 0
+            self.max_in_use = 0
+            self.checkout_wait_ms = 0.0
+    
+    def pool_created(self, event):
+        with self._lock:
+            self.pools_created += 1
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pools_cleared += 1
+        logger.warning(f"⚠️ Pool MongoDB vidé ({event.address})")
+    
+    def pool_closed(self, event):
+        pass
+    
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_created += 1
+    
+    def connection_ready(self, event):
+        pass
+    
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_closed += 1
+    
+    def connection_check_out_started(self, event):
+        pass
+    
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+    
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checked_out += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            # Temps d'attente d'une connexion libre (pymongo >= 4.7)
+            self.checkout_wait_ms += (getattr(event, 'duration', None) or 0.0) * 1000
+    
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.in_use -= 1
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'pools_created': self.pools_created,
+                'pools_cleared': self.pools_cleared,
+                'connections_open': self.connections_created - self.connections_closed,
+                'connections_created': self.connections_created,
+                'connections_closed': self.connections_closed,
+                'checked_out': self.checked_out,
+                'checkout_failures': self.checkout_failures,
+                'in_use': self.in_use,
+                'max_in_use': self.max_in_use,
+                'avg_checkout_wait_ms': round(self.checkout_wait_ms / self.checked_out, 3) if self.checked_out else 0.0,
+                'max_pool_size': MAX_POOL_SIZE
+            }
+
+
+POOL_MONITOR = PoolMonitor()
+
+Gauge('mongo_pool_connections_open', "Connexions MongoDB ouvertes",
+      lambda: POOL_MONITOR.connections_created - POOL_MONITOR.connections_closed)
+Gauge('mongo_pool_connections_in_use', "Connexions MongoDB empruntées", lambda: POOL_MONITOR.in_use)
+
+
+def client_options(uri: str = MONGODB_URI) -> Dict[str, Any]:
+    """Options communes des clients (pymongo et motor) : TLS Atlas, pool, délais, compression, supervision"""
+    
+    options: Dict[str, Any] = {
+        'maxPoolSize': MAX_POOL_SIZE,
+        'minPoolSize': MIN_POOL_SIZE,
+        'serverSelectionTimeoutMS': SERVER_SELECTION_TIMEOUT_MS,
+        'connectTimeoutMS': CONNECT_TIMEOUT_MS,
+        'maxIdleTimeMS': MAX_IDLE_TIME_MS,
+        'event_listeners': [POOL_MONITOR, COMMAND_MONITOR],
+    }
+    compressors = available_compressors()
+    if compressors:
+        options['compressors'] = ','.join(compressors)
+    if uri.startswith('mongodb+srv'):
+        options['tls'] = True
+        # Certificat Atlas fourni à part (absent du dépôt) : autorités du système sinon
+        if os.path.exists(ATLAS_CA_FILE):
+            options['tlsCAFile'] = ATLAS_CA_FILE
+    return options
+
+
+_clients: Dict[Tuple, MongoClient] = {}
+_clients_pid: Optional[int] = None
+_clients_lock = threading.Lock()
+
+
+def get_client(uri: str = MONGODB_URI, **overrides) -> MongoClient:
+    """
+    Client partagé pour cette URI (et ces options), créé au premier appel.
+    La création ne touche pas le réseau : la connexion s'établit en arrière-plan.
+    Après un fork, le processus enfant crée ses propres clients.
+    """
+    global _clients_pid
+    
+    key = (uri, tuple(sorted(overrides.items())))
+    pid = os.getpid()
+    with _clients_lock:
+        if _clients_pid != pid:
+            # Clients hérités du parent : abandonnés sans être fermés (non fork-safe)
+            _clients.clear()
+            _clients_pid = pid
+        client = _clients.get(key)
+        if client is None:
+            options = {**client_options(uri), **overrides}
+            client = MongoClient(uri, **options)
+            _clients[key] = client
+            logger.info(f"🔌 Client MongoDB créé (pool {options['minPoolSize']}-{options['maxPoolSize']}, "
+                        f"compression: {options.get('compressors', 'aucune')})")
+        return client
+
+
+def is_shared(client) -> bool:
+    """Vrai si le client appartient au registre (ne pas le fermer directement)"""
+    with _clients_lock:
+        return any(shared is client for shared in _clients.values())
+
+
+def close_clients():
+    """Ferme les clients du processus courant"""
+    with _clients_lock:
+        if _clients_pid == os.getpid():
+            for client in _clients.values():
+                client.close()
+        _clients.clear()
+
+
+def pool_stats() -> Dict[str, Any]:
+    return POOL_MONITOR.stats()
+
+
+atexit.register(close_clients)
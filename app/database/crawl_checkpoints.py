@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+💾 POINTS DE REPRISE DU CRAWL (MONGODB)
+Un document par crawl dans la collection crawl_checkpoints
+"""
+
+from typing import Any, Dict, Optional
+
+from pymongo.database import Database
+
+CHECKPOINTS_COLLECTION_NAME = "crawl_checkpoints"
+
+
+def checkpoint_name(base_url: str) -> str:
+    """Identifiant du point de reprise d'un crawl (un par site)"""
+    return f"crawl:{base_url.rstrip('/')}"
+
+
+class MongoCheckpointStore:
+    """
+    Point de reprise stocké dans MongoDB (partagé entre machines). Limité à 16 Mo
+    par document : au-delà de ~1,5M URLs vues, préférer BloomFilter ou un fichier
+    """
+    
+    def __init__(self, db: Database, name: str, collection_name: str = CHECKPOINTS_COLLECTION_NAME):
+        self.collection = db[collection_name]
+        self.name = name
+    
+    def load(self) -> Optional[Dict[str, Any]]:
+        document = self.collection.find_one({'_id': self.name})
+        if document:
+            document.pop('_id')
+        return document
+    
+    def save(self, state: Dict[str, Any]):
+        self.collection.replace_one({'_id': self.name}, state, upsert=True)
+    
+    def clear(self):
+        self.collection.delete_one({'_id': self.name})
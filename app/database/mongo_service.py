@@ -4,69 +4,300 @@
 Gestion MongoDB avec formatage des dates amélioré
 """
 
-from pymongo import MongoClient
-from datetime import datetime
-from typing import List, Dict, Optional
+from bson import json_util
+from bson.errors import BSONError
+from pymongo import MongoClient, DESCENDING, TEXT, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from datetime import datetime, timezone
+from typing import Any, Iterator, List, Dict, Optional, Sequence, Union
+import base64
+import binascii
 import logging
 import os
+import re
+import threading
+import time
+
+from app.database.client_registry import get_client, is_shared
+from app.models.article import ArticleBatch, ArticleLike, to_documents
+from app.utils.dates import as_utc, format_date, parse_date
 
 # Configuration
-MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27018/')
-DATABASE_NAME = "scraper_db"
+DATABASE_NAME = os.getenv('MONGODB_DATABASE', "scraper_db")
 COLLECTION_NAME = "articles"
+# Compteurs de génération : incrémentés à chaque sauvegarde pour invalider les caches
+META_COLLECTION_NAME = "meta"
+BULK_CHUNK_SIZE = int(os.getenv('MONGODB_BULK_CHUNK_SIZE', 500))
+# Secondes avant un nouvel essai de création des index après un échec (MongoDB injoignable)
+INDEX_RETRY_INTERVAL = float(os.getenv('MONGODB_INDEX_RETRY_INTERVAL', 30))
+
+# Pondération de l'index texte : le titre prime sur la catégorie puis l'extrait
+TEXT_INDEX_WEIGHTS = {'title': 10, 'category': 5, 'excerpt': 2}
+
+# Pagination : ordre stable de publication, du plus récent au plus ancien, taille de page bornée
+PAGE_KEY = 'published_at'
+PAGE_SORT = [(PAGE_KEY, DESCENDING), ('_id', DESCENDING)]
+# Ordre de sauvegarde : lecture incrémentale (iter_articles_since) et dernière mise à jour (get_stats)
+SAVED_SORT = [('saved_at', DESCENDING), ('_id', DESCENDING)]
+MAX_PAGE_SIZE = 100
+
+# Champs utiles aux vues en liste (pas de document complet)
+LIST_PROJECTION = {
+    'id': 1, 'title': 1, 'url': 1, 'excerpt': 1, 'category': 1,
+    'date': 1, 'published_at': 1, 'author': 1, 'image_url': 1, 'saved_at': 1
+}
 
 logger = logging.getLogger(__name__)
 
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """Curseur opaque (base64 URL-safe) à partir de la position du dernier élément"""
+    return base64.urlsafe_b64encode(json_util.dumps(position).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Position encodée par encode_cursor ; ValueError si le curseur est invalide"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        position = json_util.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, BSONError) as e:
+        raise ValueError(f"Curseur invalide: {cursor!r}") from e
+    if not isinstance(position, dict):
+        raise ValueError(f"Curseur invalide: {cursor!r}")
+    return position
+
+
+def _after(field: str, value: Any, last_id: Any) -> Dict:
+    """Filtre keyset : éléments situés après (value, last_id) dans l'ordre décroissant"""
+    return {'$or': [{field: {'$lt': value}}, {field: value, '_id': {'$lt': last_id}}]}
+
+
+def _page_size(limit: int) -> int:
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def published_filter(since: Optional[datetime] = None, until: Optional[datetime] = None) -> Dict:
+    """Filtre de plage sur la date de publication (bornes incluses), servi par l'index de pagination"""
+    bounds = {}
+    if since is not None:
+        bounds['$gte'] = since
+    if until is not None:
+        bounds['$lte'] = until
+    return {PAGE_KEY: bounds} if bounds else {}
+
+
+def _and(*filters: Dict) -> Dict:
+    filters = [f for f in filters if f]
+    if len(filters) > 1:
+        return {'$and': filters}
+    return filters[0] if filters else {}
+
+
+def upsert_operation(article: Dict, now: datetime) -> UpdateOne:
+    """
+    Upsert d'un article par ID (first_seen_at fixé à la première insertion)
+    
+    Une date de publication illisible n'écrase pas celle déjà en base ; à
+    l'insertion, l'instant de sauvegarde la remplace pour garder un tri total.
+    """
+    fields = {k: v for k, v in article.items() if k != '_id'}
+    on_insert = {'first_seen_at': now}
+    if fields.get(PAGE_KEY) is None:
+        fields.pop(PAGE_KEY, None)
+        # now est naïf (heure locale) : converti en UTC comme les dates avec fuseau
+        on_insert[PAGE_KEY] = now.astimezone(timezone.utc)
+    return UpdateOne(
+        {'id': article['id']},
+        {'$set': {**fields, 'saved_at': now}, '$setOnInsert': on_insert},
+        upsert=True
+    )
+
+
+def backfill_operation(document: Dict) -> UpdateOne:
+    """published_at d'un document antérieur à la normalisation des dates (texte source, sinon sauvegarde)"""
+    published_at = parse_date(document.get('date'))
+    if published_at is None:
+        saved = document.get('first_seen_at') or document.get('saved_at') or datetime.now()
+        published_at = saved.astimezone(timezone.utc)
+    return UpdateOne({'_id': document['_id']}, {'$set': {PAGE_KEY: published_at}})
+
+
+BACKFILL_QUERY = {PAGE_KEY: {'$exists': False}}
+BACKFILL_PROJECTION = {'date': 1, 'first_seen_at': 1, 'saved_at': 1}
+
+
+def text_search_pipeline(query: str, limit: int, position: Optional[Dict] = None) -> List[Dict]:
+    """Agrégation $text triée par pertinence, reprise après (score, _id)"""
+    pipeline = [
+        {'$match': {'$text': {'$search': query}}},
+        {'$addFields': {'score': {'$meta': 'textScore'}}},
+    ]
+    if position is not None:
+        pipeline.append({'$match': _after('score', position['score'], position['_id'])})
+    pipeline += [
+        {'$sort': {'score': DESCENDING, '_id': DESCENDING}},
+        {'$limit': limit},
+        {'$project': {**LIST_PROJECTION, 'score': 1}},
+    ]
+    return pipeline
+
+
+def regex_search_filter(query: str, position: Optional[Dict] = None) -> Dict:
+    """Filtre de repli par regex insensibles à la casse, reprise après (published_at, _id)"""
+    pattern = re.escape(query)
+    search_filter = {
+        '$or': [
+            {'title': {'$regex': pattern, '$options': 'i'}},
+            {'excerpt': {'$regex': pattern, '$options': 'i'}},
+            {'category': {'$regex': pattern, '$options': 'i'}}
+        ]
+    }
+    if position is not None:
+        search_filter = {'$and': [search_filter, _after(PAGE_KEY, position[PAGE_KEY], position['_id'])]}
+    return search_filter
+
+
 class MongoService:
     """Service MongoDB optimisé pour les articles"""
     
-    def __init__(self):
-        self.client = None
-        self.db = None
-        self.collection = None
-        self._connect()
+    def __init__(self, client: Optional[MongoClient] = None,
+                 database_name: str = DATABASE_NAME, collection_name: str = COLLECTION_NAME):
+        """
+        Aucun accès réseau ici : le client partagé se connecte en arrière-plan et
+        les index sont vérifiés à la première utilisation de la collection.
+        
+        Args:
+            client: Client MongoDB existant (par défaut, client partagé du registre)
+            database_name: Base utilisée (scraper_db par défaut)
+            collection_name: Collection des articles
+        """
+        self.client = client if client is not None else get_client()
+        self.database_name = database_name
+        self.collection_name = collection_name
+        self.db = self.client[database_name]
+        self.meta = self.db[META_COLLECTION_NAME]
+        self.last_write_errors: List[Dict] = []
+        # Supposée disponible ; les index la confirment, sinon repli sur regex
+        self.text_search = True
+        self._collection = self.db[collection_name]
+        self._indexes_ready = False
+        self._indexes_lock = threading.Lock()
+        # Instant (monotonic) du dernier échec : pas de nouvel essai avant INDEX_RETRY_INTERVAL
+        self._indexes_failed_at: Optional[float] = None
+    
+    @property
+    def collection(self):
+        """
+        Collection des articles, index créés au premier accès. Après un échec, pas
+        de nouvel essai avant INDEX_RETRY_INTERVAL secondes : pendant une panne,
+        chaque accès bloquerait sinon jusqu'à serverSelectionTimeoutMS.
+        """
+        if not self._indexes_ready and not self._indexes_backoff():
+            with self._indexes_lock:
+                if not self._indexes_ready and not self._indexes_backoff():
+                    try:
+                        self._ensure_indexes()
+                        self._indexes_ready = True
+                        self._indexes_failed_at = None
+                        logger.info("✅ MongoDB connecté, index en place")
+                    except Exception as e:
+                        self._indexes_failed_at = time.monotonic()
+                        logger.error(f"❌ Erreur MongoDB (index réessayés dans {INDEX_RETRY_INTERVAL:.0f}s): {e}")
+        return self._collection
     
-    def _connect(self):
-        """Connexion à MongoDB avec certificat Atlas"""
+    def _indexes_backoff(self) -> bool:
+        failed_at = self._indexes_failed_at
+        return failed_at is not None and time.monotonic() - failed_at < INDEX_RETRY_INTERVAL
+    
+    def ping(self) -> bool:
+        """Test de connexion explicite (bloque au plus serverSelectionTimeoutMS)"""
         try:
-            # Sélectionne le mode de connexion suivant Atlas ou local
-            if MONGODB_URI.startswith('mongodb+srv'):
-                ca_path = os.path.join(os.path.dirname(__file__), '../../atlas-cert.pem')
-                self.client = MongoClient(
-                    MONGODB_URI,
-                    tls=True,
-                    tlsCAFile=ca_path
-                )
-            else:
-                # Connexion simple pour MongoDB local
-                self.client = MongoClient(MONGODB_URI)
-            # Test de connexion
             self.client.admin.command('ping')
-            self.db = self.client[DATABASE_NAME]
-            self.collection = self.db[COLLECTION_NAME]
-            logger.info("✅ MongoDB connecté (certificat Atlas)")
+            return True
         except Exception as e:
-            logger.error(f"❌ Erreur MongoDB: {e}")
-            raise
+            logger.error(f"❌ MongoDB injoignable: {e}")
+            return False
     
-    def save_articles(self, articles: List[Dict]) -> bool:
-        """Sauvegarde des articles avec mise à jour"""
+    def _ensure_indexes(self):
+        """Index requis : unicité de l'ID d'article (clé des upserts), URL, pagination, ordre de sauvegarde et recherche plein texte"""
+        self._collection.create_index('id', unique=True, name='id_unique')
+        self._collection.create_index('url', name='url')
+        # Pagination keyset et plages de dates : tri et reprise sur (published_at, _id) sans parcours
+        self._collection.create_index(PAGE_SORT, name='published_at_id')
+        # Même clé et même nom que l'index de pagination d'origine : conservé tel quel sur les bases existantes
+        self._collection.create_index(SAVED_SORT, name='saved_at_id')
+        self._backfill_published_at()
+        
+        try:
+            # Index texte v3 : insensible à la casse et aux accents, racinisation française
+            self._collection.create_index(
+                [('title', TEXT), ('excerpt', TEXT), ('category', TEXT)],
+                weights=TEXT_INDEX_WEIGHTS,
+                default_language='french',
+                name='articles_text'
+            )
+            self.text_search = True
+        except OperationFailure as e:
+            logger.warning(f"⚠️ Index texte indisponible, recherche par regex: {e}")
+            self.text_search = False
+    
+    def _backfill_published_at(self):
+        """Date de publication des documents enregistrés avant qu'elle ne soit stockée"""
+        operations = [backfill_operation(document)
+                      for document in self._collection.find(BACKFILL_QUERY, BACKFILL_PROJECTION)]
+        if operations:
+            self._collection.bulk_write(operations, ordered=False)
+            logger.info(f"📅 Date de publication ajoutée à {len(operations)} articles existants")
+    
+    def save_articles(self, articles: Union[ArticleBatch, Sequence[ArticleLike]],
+                      chunk_size: int = BULK_CHUNK_SIZE) -> bool:
+        """
+        Sauvegarde idempotente des articles (upsert par ID, par lots)
+        
+        Les articles existants sont mis à jour sur place : la collection n'est
+        jamais vidée, l'interface ne voit donc jamais de base partiellement vide.
+        
+        Args:
+            articles: Articles à insérer ou mettre à jour (lot colonnaire, Article ou dicts)
+            chunk_size: Nombre d'opérations par appel bulk_write
+            
+        Returns:
+            True si toutes les écritures ont réussi
+        """
         
         if not articles:
             return False
         
+        # Conversion en documents à la frontière MongoDB uniquement
+        documents = to_documents(articles)
+        self.last_write_errors = []
+        now = datetime.now()
+        upserted = modified = 0
+        
         try:
-            # Nettoyage de la collection
-            self.collection.delete_many({})
-            logger.info("🗑️ Anciens articles supprimés")
-            
-            # Insertion des nouveaux articles
-            for article in articles:
-                # Ajout timestamp
-                article['saved_at'] = datetime.now()
+            for offset in range(0, len(documents), chunk_size):
+                operations = [upsert_operation(document, now) for document in documents[offset:offset + chunk_size]]
                 
-            result = self.collection.insert_many(articles)
-            logger.info(f"💾 {len(result.inserted_ids)} articles sauvegardés")
+                try:
+                    result = self.collection.bulk_write(operations, ordered=False)
+                    upserted += result.upserted_count
+                    modified += result.modified_count
+                except BulkWriteError as e:
+                    # Écritures non ordonnées : le reste du lot a été appliqué
+                    details = e.details
+                    upserted += details.get('nUpserted', 0)
+                    modified += details.get('nModified', 0)
+                    for error in details.get('writeErrors', []):
+                        error = dict(error, index=offset + error['index'])
+                        self.last_write_errors.append(error)
+                        logger.error(f"❌ Article {error['index']} non sauvegardé: {error.get('errmsg')}")
+            
+            logger.info(f"💾 {upserted} articles ajoutés, {modified} mis à jour")
+            if upserted or modified:
+                self._bump_generation()
+            if self.last_write_errors:
+                logger.warning(f"⚠️ {len(self.last_write_errors)} articles en erreur")
+                return False
             
             return True
             
@@ -74,72 +305,180 @@ class MongoService:
             logger.error(f"❌ Erreur sauvegarde: {e}")
             return False
     
-    def get_articles(self, limit: int = 15) -> List[Dict]:
-        """Récupération des articles avec formatage des dates"""
+    def _bump_generation(self):
+        """Signale aux lecteurs (caches de l'API) que la collection a changé"""
+        try:
+            self.meta.update_one({'_id': self.collection_name}, {'$inc': {'generation': 1}}, upsert=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Génération non incrémentée: {e}")
+    
+    def get_generation(self) -> int:
+        """Génération courante de la collection (0 avant la première sauvegarde)"""
+        document = self.meta.find_one({'_id': self.collection_name}, {'generation': 1})
+        return document['generation'] if document else 0
+    
+    def get_known_articles(self, article_ids: List[str]) -> Dict[str, Dict]:
+        """Articles déjà en base pour ces IDs (une seule requête groupée)"""
+        
+        if not article_ids:
+            return {}
         
         try:
-            # Récupération depuis MongoDB
-            cursor = self.collection.find().limit(limit)
-            articles = list(cursor)
+            cursor = self.collection.find(
+                {'id': {'$in': list(article_ids)}},
+                {'_id': 0, 'id': 1, 'url': 1, 'title': 1, 'date': 1}
+            )
+            known = {doc['id']: doc for doc in cursor}
+            logger.info(f"🔎 {len(known)}/{len(article_ids)} articles déjà en base")
+            return known
             
-            # Formatage des articles
-            formatted_articles = []
-            for article in articles:
-                # Conversion _id en string
-                article['_id'] = str(article['_id'])
-                
-                # Formatage de la date pour l'affichage
-                if 'saved_at' in article:
-                    saved_at = article['saved_at']
-                    if isinstance(saved_at, datetime):
-                        article['date_formatted'] = saved_at.strftime("%d/%m/%Y à %H:%M")
-                    else:
-                        article['date_formatted'] = str(saved_at)
-                else:
-                    article['date_formatted'] = article.get('date', 'Date inconnue')
-                
-                formatted_articles.append(article)
+        except Exception as e:
+            logger.error(f"❌ Erreur lecture articles connus: {e}")
+            # Sans information, tout est considéré comme nouveau
+            return {}
+    
+    def get_articles(self, limit: int = 15) -> List[Dict]:
+        """Derniers articles publiés, avec formatage des dates"""
+        return self.get_articles_page(limit)['articles']
+    
+    @staticmethod
+    def _page_query(cursor: Optional[str], since: Optional[datetime], until: Optional[datetime]) -> Dict:
+        query = published_filter(since, until)
+        if cursor:
+            position = decode_cursor(cursor)
+            if PAGE_KEY not in position:
+                raise ValueError(f"Curseur invalide: {cursor!r}")
+            query = _and(query, _after(PAGE_KEY, position[PAGE_KEY], position['_id']))
+        return query
+    
+    def get_articles_page(self, limit: int = 15, cursor: Optional[str] = None,
+                          since: Optional[datetime] = None, until: Optional[datetime] = None) -> Dict:
+        """
+        Page d'articles du plus récent au plus ancien par date de publication (pagination keyset)
+        
+        Args:
+            limit: Nombre d'articles par page (borné à MAX_PAGE_SIZE)
+            cursor: 'next_cursor' de la page précédente, None pour la première page
+            since: Publiés à partir de cette date (incluse)
+            until: Publiés jusqu'à cette date (incluse)
             
-            logger.info(f"📄 {len(formatted_articles)} articles récupérés")
-            return formatted_articles
+        Returns:
+            {'articles': [...], 'next_cursor': curseur de la page suivante ou None}
+            
+        Raises:
+            ValueError: Curseur invalide
+        """
+        
+        limit = _page_size(limit)
+        query = self._page_query(cursor, since, until)
+        
+        try:
+            # Un article de plus que demandé pour savoir s'il existe une page suivante
+            cursor = self.collection.find(query, LIST_PROJECTION).sort(PAGE_SORT).limit(limit + 1)
+            page = self._paginate(list(cursor), limit, PAGE_KEY)
+            logger.info(f"📄 {len(page['articles'])} articles récupérés")
+            return page
             
         except Exception as e:
             logger.error(f"❌ Erreur récupération: {e}")
-            return []
+            return {'articles': [], 'next_cursor': None}
     
-    def search_articles(self, query: str) -> List[Dict]:
-        """Recherche dans les articles"""
+    def search_articles(self, query: str, limit: int = 15) -> List[Dict]:
+        """Première page de résultats de recherche, triée par pertinence"""
+        return self.search_articles_page(query, limit)['articles']
+    
+    def search_articles_page(self, query: str, limit: int = 15, cursor: Optional[str] = None) -> Dict:
+        """
+        Recherche dans les articles, même contrat de pagination que get_articles_page
+        
+        Args:
+            query: Mots recherchés (syntaxe $text : "phrase exacte", -exclusion)
+            limit: Nombre d'articles par page (borné à MAX_PAGE_SIZE)
+            cursor: 'next_cursor' de la page précédente
+            
+        Raises:
+            ValueError: Curseur invalide
+        """
         
         if not query:
-            return self.get_articles()
+            return self.get_articles_page(limit, cursor)
+        
+        limit = _page_size(limit)
+        position = decode_cursor(cursor) if cursor else None
         
         try:
-            # Recherche dans titre et contenu
-            search_filter = {
-                '$or': [
-                    {'title': {'$regex': query, '$options': 'i'}},
-                    {'excerpt': {'$regex': query, '$options': 'i'}},
-                    {'category': {'$regex': query, '$options': 'i'}}
-                ]
-            }
+            page = None
             
-            cursor = self.collection.find(search_filter).limit(15)
-            articles = list(cursor)
+            # Le curseur indique le mode de la première page (score ou date)
+            if self.text_search and (position is None or 'score' in position):
+                try:
+                    page = self._paginate(self._text_search(query, limit + 1, position), limit, 'score')
+                except OperationFailure as e:
+                    # Index texte supprimé ou modifié depuis la connexion
+                    logger.warning(f"⚠️ Recherche texte impossible, repli sur regex: {e}")
+                    if position is not None:
+                        raise ValueError("Curseur de recherche expiré") from e
             
-            # Formatage
-            for article in articles:
-                article['_id'] = str(article['_id'])
-                if 'saved_at' in article and isinstance(article['saved_at'], datetime):
-                    article['date_formatted'] = article['saved_at'].strftime("%d/%m/%Y à %H:%M")
-                else:
-                    article['date_formatted'] = article.get('date', 'Date inconnue')
+            if page is None:
+                if position is not None and PAGE_KEY not in position:
+                    raise ValueError(f"Curseur invalide: {cursor!r}")
+                page = self._paginate(self._regex_search(query, limit + 1, position), limit, PAGE_KEY)
             
-            logger.info(f"🔍 {len(articles)} articles trouvés pour '{query}'")
-            return articles
+            logger.info(f"🔍 {len(page['articles'])} articles trouvés pour '{query}'")
+            return page
             
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"❌ Erreur recherche: {e}")
-            return []
+            return {'articles': [], 'next_cursor': None}
+    
+    @staticmethod
+    def _paginate(documents: List[Dict], limit: int, key: str) -> Dict:
+        """Coupe les limit + 1 documents lus en une page et le curseur de la suivante"""
+        
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            last = documents[-1]
+            next_cursor = encode_cursor({key: last.get(key), '_id': last['_id']})
+        return {
+            'articles': [MongoService._format_article(document) for document in documents],
+            'next_cursor': next_cursor
+        }
+    
+    @staticmethod
+    def _format_article(article: Dict) -> Dict:
+        """Conversion pour l'API : _id en texte, date de publication ISO 8601 et lisible"""
+        article['_id'] = str(article['_id'])
+        published_at = article.get(PAGE_KEY)
+        article['date_formatted'] = format_date(published_at, article.get('date'))
+        if isinstance(published_at, datetime):
+            article[PAGE_KEY] = as_utc(published_at).isoformat()
+        return article
+    
+    def iter_articles_since(self, since: Optional[datetime] = None,
+                            projection: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Articles sauvegardés (ou mis à jour) depuis `since`, du plus ancien au plus
+        récent ; tous les articles si since est None. Le saved_at brut est
+        conservé dans 'saved_at' pour reprendre la lecture au bon endroit.
+        
+        La borne est incluse : un lot partagé le même saved_at et peut être lu
+        pendant son écriture, les articles de la borne sont donc relus.
+        """
+        query = {'saved_at': {'$gte': since}} if since else {}
+        for article in self.collection.find(query, projection).sort('saved_at', 1):
+            yield self._format_article(article)
+    
+    def _text_search(self, query: str, limit: int, position: Optional[Dict] = None) -> List[Dict]:
+        """Recherche via l'index texte, score de pertinence dans 'score' (keyset sur score, _id)"""
+        return list(self.collection.aggregate(text_search_pipeline(query, limit, position)))
+    
+    def _regex_search(self, query: str, limit: int, position: Optional[Dict] = None) -> List[Dict]:
+        """Repli : regex insensibles à la casse (parcours complet de la collection)"""
+        cursor = self.collection.find(regex_search_filter(query, position), LIST_PROJECTION)
+        return list(cursor.sort(PAGE_SORT).limit(limit))
     
     def get_stats(self) -> Dict:
         """Statistiques de la base"""
@@ -147,27 +486,32 @@ class MongoService:
         try:
             total = self.collection.count_documents({})
             
-            # Dernier article
-            last_article = self.collection.find_one(sort=[('saved_at', -1)])
-            last_update = "Aucune donnée"
-            
-            if last_article and 'saved_at' in last_article:
-                if isinstance(last_article['saved_at'], datetime):
-                    last_update = last_article['saved_at'].strftime("%d/%m/%Y à %H:%M")
-            
-            return {
-                'total_articles': total,
-                'last_update': last_update,
-                'status': 'Actif' if total > 0 else 'Vide'
-            }
+            # Dernière sauvegarde et dernière publication (dates seulement, index de pagination)
+            last_article = self.collection.find_one({}, {'saved_at': 1}, sort=[('saved_at', -1)])
+            latest = self.collection.find_one({}, {PAGE_KEY: 1}, sort=PAGE_SORT)
+            return self._format_stats(total, last_article, latest)
             
         except Exception as e:
             logger.error(f"❌ Erreur stats: {e}")
             return {'total_articles': 0, 'last_update': 'Erreur', 'status': 'Erreur'}
     
+    @staticmethod
+    def _format_stats(total: int, last_article: Optional[Dict], latest: Optional[Dict] = None) -> Dict:
+        last_update = "Aucune donnée"
+        if last_article and isinstance(last_article.get('saved_at'), datetime):
+            # saved_at : heure locale naïve (datetime.now()), affichée telle quelle
+            last_update = last_article['saved_at'].strftime("%d/%m/%Y à %H:%M")
+        
+        return {
+            'total_articles': total,
+            'last_update': last_update,
+            'last_published': format_date((latest or {}).get(PAGE_KEY), "Aucune donnée"),
+            'status': 'Actif' if total > 0 else 'Vide'
+        }
+    
     def close(self):
-        """Fermeture de la connexion"""
-        if self.client:
+        """Fermeture de la connexion (le client partagé reste ouvert pour les autres services)"""
+        if self.client is not None and not is_shared(self.client):
             self.client.close()
             logger.info("🔒 MongoDB fermé")
 
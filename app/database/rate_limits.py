@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+🚦 LIMITEUR DE DÉBIT PARTAGÉ (MONGODB)
+Même politesse par hôte que HostRateLimiter, mais commune à tous les workers :
+un document par hôte portant son prochain créneau théorique (GCRA)
+"""
+
+import asyncio
+import os
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from pymongo import ReturnDocument
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
+
+from app.scraper.rate_limiter import DEFAULT_BURST, DEFAULT_RATE
+
+RATE_LIMITS_COLLECTION_NAME = "rate_limits"
+
+# Débit global par hôte, tous workers confondus
+SHARED_RATE = float(os.getenv('SHARED_RATE_LIMIT', DEFAULT_RATE))
+SHARED_BURST = int(os.getenv('SHARED_RATE_BURST', DEFAULT_BURST))
+
+
+class MongoRateLimiter:
+    """
+    Generic Cell Rate Algorithm : équivalent à un token bucket, mais l'état tient
+    en un seul nombre (tat, instant théorique d'arrivée) mis à jour atomiquement,
+    sans verrou ni relecture. Les horloges des workers doivent être synchronisées (NTP).
+    """
+    
+    def __init__(self, db: Database, rate: float = SHARED_RATE, burst: int = SHARED_BURST,
+                 overrides: Optional[Dict[str, float]] = None,
+                 collection_name: str = RATE_LIMITS_COLLECTION_NAME):
+        """
+        Args:
+            db: Base MongoDB partagée par les workers
+            rate: Débit par défaut (requêtes/s) pour chaque hôte, tous workers confondus
+            burst: Nombre de requêtes autorisées en rafale
+            overrides: Débits spécifiques par hôte (netloc)
+            collection_name: Collection des créneaux par hôte
+        """
+        if rate <= 0:
+            raise ValueError("rate doit être strictement positif")
+        self.collection = db[collection_name]
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.overrides = dict(overrides or {})
+    
+    def reserve(self, url: str) -> float:
+        """Réserve le prochain créneau de l'hôte, retourne l'attente avant de l'utiliser"""
+        host = urlsplit(url).netloc
+        interval = 1.0 / self.overrides.get(host, self.rate)
+        # Avance tolérée sur le créneau théorique : burst requêtes d'affilée
+        tolerance = (self.burst - 1) * interval
+        now = time.time()
+        # Mise à jour en une instruction (pipeline) : tat = max(tat, now) + interval
+        update = [{'$set': {'tat': {'$add': [{'$max': [{'$ifNull': ['$tat', now]}, now]}, interval]}}}]
+        try:
+            previous = self.collection.find_one_and_update(
+                {'_id': host}, update, upsert=True, return_document=ReturnDocument.BEFORE
+            )
+        except DuplicateKeyError:
+            # Premier créneau de l'hôte créé au même instant par un autre worker
+            previous = self.collection.find_one_and_update(
+                {'_id': host}, update, return_document=ReturnDocument.BEFORE
+            )
+        tat = previous['tat'] if previous else now
+        return max(0.0, tat - tolerance - now)
+    
+    def acquire(self, url: str) -> float:
+        """Attente bloquante (code synchrone), retourne le temps attendu"""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+    
+    async def acquire_async(self, url: str) -> float:
+        """Attente non bloquante (code asynchrone), retourne le temps attendu"""
+        delay = await asyncio.to_thread(self.reserve, url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+    
+    def reset(self):
+        """Oublie les créneaux réservés (nouveau crawl)"""
+        self.collection.delete_many({})
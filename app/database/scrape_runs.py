@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+🗓️ EXÉCUTIONS DE SCRAPING
+Verrou à bail (lease) MongoDB pour que deux exécutions ne se chevauchent jamais,
+et historique des exécutions dans la collection scrape_runs
+"""
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from bson import ObjectId
+from pymongo import DESCENDING
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+LOCKS_COLLECTION_NAME = "locks"
+RUNS_COLLECTION_NAME = "scrape_runs"
+SCRAPE_LEASE_NAME = "scrape"
+
+# Durée d'un bail, renouvelé au tiers de sa durée tant que l'exécution continue :
+# un processus tué libère le verrou au plus tard LEASE_TTL secondes après
+LEASE_TTL = float(os.getenv('SCRAPE_LEASE_TTL', 300))
+# Historique conservé (index TTL sur started_at)
+RUNS_RETENTION_DAYS = int(os.getenv('SCRAPE_RUNS_RETENTION_DAYS', 30))
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def default_owner() -> str:
+    """Identifiant du détenteur : hôte, processus et jeton unique"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class MongoLease:
+    """Verrou exclusif nommé, expirant s'il n'est pas renouvelé"""
+    
+    def __init__(self, db: Database, name: str = SCRAPE_LEASE_NAME, ttl: float = LEASE_TTL,
+                 owner: Optional[str] = None):
+        """
+        Args:
+            db: Base MongoDB hébergeant la collection des verrous
+            name: Nom du verrou (un document par verrou)
+            ttl: Durée de validité (s) d'une acquisition ou d'un renouvellement
+            owner: Identifiant du détenteur (hôte:pid:jeton par défaut)
+        """
+        self.collection = db[LOCKS_COLLECTION_NAME]
+        self.name = name
+        self.ttl = ttl
+        self.owner = owner or default_owner()
+    
+    def acquire(self) -> bool:
+        """Prend le verrou s'il est libre, expiré ou déjà détenu ; False sinon"""
+        now = _now()
+        try:
+            # Verrou tenu par un autre : pas de correspondance, l'upsert heurte l'_id existant
+            self.collection.find_one_and_update(
+                {'_id': self.name, '$or': [{'expires_at': {'$lte': now}}, {'owner': self.owner}]},
+                {'$set': {'owner': self.owner, 'acquired_at': now,
+                          'expires_at': now + timedelta(seconds=self.ttl)}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+    
+    def renew(self) -> bool:
+        """Prolonge le bail ; False s'il a été perdu (expiré puis repris ailleurs)"""
+        result = self.collection.update_one(
+            {'_id': self.name, 'owner': self.owner},
+            {'$set': {'expires_at': _now() + timedelta(seconds=self.ttl)}}
+        )
+        return result.matched_count == 1
+    
+    def release(self):
+        self.collection.delete_one({'_id': self.name, 'owner': self.owner})
+    
+    def holder(self) -> Optional[Dict]:
+        """Document du verrou (owner, expires_at), None s'il n'a jamais été pris"""
+        return self.collection.find_one({'_id': self.name})
+    
+    @contextmanager
+    def hold(self):
+        """
+        Renouvelle le bail en arrière-plan pendant le bloc `with`, puis le libère
+        (le verrou doit avoir été acquis)
+        """
+        stop = threading.Event()
+        
+        def heartbeat():
+            while not stop.wait(self.ttl / 3):
+                try:
+                    if not self.renew():
+                        logger.error(f"❌ Verrou '{self.name}' perdu (bail expiré)")
+                        return
+                except Exception as e:
+                    logger.warning(f"⚠️ Renouvellement du verrou '{self.name}' impossible: {e}")
+        
+        thread = threading.Thread(target=heartbeat, name=f"lease-{self.name}", daemon=True)
+        thread.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            thread.join()
+            try:
+                self.release()
+            except Exception as e:
+                logger.warning(f"⚠️ Verrou '{self.name}' non libéré (expirera seul): {e}")
+
+
+class RunStore:
+    """Historique des exécutions : statut, durées, articles et prochaine échéance"""
+    
+    def __init__(self, db: Database, collection_name: str = RUNS_COLLECTION_NAME):
+        self.collection = db[collection_name]
+        self._indexes_ready = False
+    
+    def _ensure_indexes(self):
+        if self._indexes_ready:
+            return
+        self.collection.create_index([('started_at', DESCENDING)], name='started_at',
+                                     expireAfterSeconds=RUNS_RETENTION_DAYS * 86400)
+        self._indexes_ready = True
+    
+    def start(self, owner: str, **fields: Any) -> ObjectId:
+        """Enregistre une exécution en cours, retourne son identifiant"""
+        self._ensure_indexes()
+        document = {'status': 'running', 'owner': owner, 'started_at': _now(), **fields}
+        return self.collection.insert_one(document).inserted_id
+    
+    def finish(self, run_id: ObjectId, status: str, **fields: Any):
+        """Statut final (success, unchanged, failed) et durée de l'exécution"""
+        finished_at = _now()
+        run = self.collection.find_one({'_id': run_id}, {'started_at': 1})
+        duration = None
+        if run and isinstance(run.get('started_at'), datetime):
+            started_at = run['started_at']
+            if started_at.tzinfo is None:
+                started_at = started_at.replace(tzinfo=timezone.utc)
+            duration = round((finished_at - started_at).total_seconds(), 3)
+        self.collection.update_one(
+            {'_id': run_id},
+            {'$set': {'status': status, 'finished_at': finished_at, 'duration_seconds': duration, **fields}}
+        )
+    
+    def last(self, statuses: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """Exécution la plus récente (parmi ces statuts si précisés)"""
+        query = {'status': {'$in': list(statuses)}} if statuses else {}
+        return self.collection.find_one(query, sort=[('started_at', DESCENDING)])
+    
+    def recent(self, limit: int = 20) -> List[Dict]:
+        return list(self.collection.find({}, sort=[('started_at', DESCENDING)], limit=limit))
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+📬 FILE DE TRAVAIL MONGODB
+URLs à traiter partagées entre workers (processus ou machines) : réservation
+atomique (find_one_and_update) avec délai de visibilité, reprises espacées et
+file des échecs définitifs (dead letter)
+"""
+
+import logging
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ASCENDING, ReturnDocument, UpdateOne
+from pymongo.database import Database
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+QUEUE_COLLECTION_NAME = "crawl_queue"
+DEAD_LETTER_SUFFIX = "_dead"
+
+# Réservation expirée (worker mort ou bloqué) : l'élément redevient disponible
+VISIBILITY_TIMEOUT = float(os.getenv('QUEUE_VISIBILITY_TIMEOUT', 120))
+# Tentatives avant la dead letter, attente exponentielle avec gigue entre deux
+MAX_ATTEMPTS = int(os.getenv('QUEUE_MAX_ATTEMPTS', 5))
+RETRY_BASE_DELAY = float(os.getenv('QUEUE_RETRY_BASE_DELAY', 10))
+
+PENDING, LEASED, DONE = 'pending', 'leased', 'done'
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class WorkQueue:
+    """File d'éléments identifiés par leur URL (ajout idempotent : une URL n'est traitée qu'une fois)"""
+    
+    def __init__(self, db: Database, name: str = QUEUE_COLLECTION_NAME,
+                 visibility_timeout: float = VISIBILITY_TIMEOUT, max_attempts: int = MAX_ATTEMPTS,
+                 retry_base_delay: float = RETRY_BASE_DELAY):
+        """
+        Args:
+            db: Base MongoDB partagée par les workers
+            name: Collection de la file (la dead letter est name + '_dead')
+            visibility_timeout: Durée (s) d'une réservation avant reprise par un autre worker
+            max_attempts: Tentatives avant déplacement dans la dead letter
+            retry_base_delay: Base (s) de l'attente entre deux tentatives
+        """
+        self.collection = db[name]
+        self.dead_letter = db[name + DEAD_LETTER_SUFFIX]
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_delay = retry_base_delay
+    
+    def ensure_indexes(self):
+        # Réservation : éléments disponibles par priorité, réservations expirées
+        self.collection.create_index([('status', ASCENDING), ('priority', ASCENDING), ('available_at', ASCENDING)],
+                                     name='status_priority')
+        self.collection.create_index([('status', ASCENDING), ('lease_expires_at', ASCENDING)],
+                                     name='status_lease')
+    
+    def enqueue(self, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Ajoute des éléments {'url', 'kind', 'priority', 'payload'...} ; les URLs déjà
+        présentes (quel que soit leur état) sont ignorées
+        
+        Returns:
+            Nombre d'éléments réellement ajoutés
+        """
+        now = _now()
+        operations = [
+            UpdateOne(
+                {'_id': item['url']},
+                {'$setOnInsert': {
+                    'status': PENDING, 'attempts': 0, 'priority': 0, 'created_at': now, 'available_at': now,
+                    **item
+                }},
+                upsert=True
+            )
+            for item in items
+        ]
+        if not operations:
+            return 0
+        try:
+            return self.collection.bulk_write(operations, ordered=False).upserted_count
+        except BulkWriteError as e:
+            # Même URL ajoutée au même instant par un autre worker : déjà dans la file
+            if any(error.get('code') != 11000 for error in e.details.get('writeErrors', [])):
+                raise
+            return e.details.get('nUpserted', 0)
+    
+    def claim(self, owner: str) -> Optional[Dict]:
+        """
+        Réserve atomiquement l'élément disponible le plus prioritaire, None si la
+        file n'a rien de prêt (deux workers ne reçoivent jamais le même élément)
+        """
+        now = _now()
+        return self.collection.find_one_and_update(
+            {'$or': [
+                {'status': PENDING, 'available_at': {'$lte': now}},
+                {'status': LEASED, 'lease_expires_at': {'$lte': now}},
+            ]},
+            {
+                '$set': {'status': LEASED, 'owner': owner,
+                         'lease_expires_at': now + timedelta(seconds=self.visibility_timeout)},
+                '$inc': {'attempts': 1}
+            },
+            sort=[('priority', ASCENDING), ('available_at', ASCENDING)],
+            return_document=ReturnDocument.AFTER
+        )
+    
+    def extend(self, item: Dict, owner: str) -> bool:
+        """Prolonge la réservation d'un traitement long ; False si elle a été perdue"""
+        result = self.collection.update_one(
+            {'_id': item['_id'], 'status': LEASED, 'owner': owner},
+            {'$set': {'lease_expires_at': _now() + timedelta(seconds=self.visibility_timeout)}}
+        )
+        return result.matched_count == 1
+    
+    def complete(self, items: List[Dict], owner: str) -> int:
+        """Marque des éléments traités (seulement s'ils sont encore réservés par ce worker)"""
+        if not items:
+            return 0
+        result = self.collection.update_many(
+            {'_id': {'$in': [item['_id'] for item in items]}, 'status': LEASED, 'owner': owner},
+            {'$set': {'status': DONE, 'done_at': _now()}, '$unset': {'lease_expires_at': ''}}
+        )
+        return result.modified_count
+    
+    def fail(self, item: Dict, owner: str, error: str) -> bool:
+        """
+        Échec d'un traitement : nouvelle tentative différée, ou dead letter après
+        max_attempts tentatives
+        
+        Returns:
+            True si l'élément est parti dans la dead letter (False aussi si la
+            réservation a expiré et que l'élément appartient à un autre worker)
+        """
+        if item.get('attempts', 0) >= self.max_attempts:
+            # Retiré de la file seulement s'il est encore réservé par ce worker (même filtre que complete)
+            removed = self.collection.find_one_and_delete({'_id': item['_id'], 'status': LEASED, 'owner': owner})
+            if removed is None:
+                logger.warning(f"⚠️ {item['_id']}: réservation perdue, reprise par un autre worker")
+                return False
+            dead = {**removed, 'last_error': error, 'dead_at': _now()}
+            dead.pop('lease_expires_at', None)
+            # Remplacement plutôt qu'insertion : un élément peut mourir deux fois (retry_dead)
+            self.dead_letter.replace_one({'_id': item['_id']}, dead, upsert=True)
+            logger.error(f"☠️ {item['_id']} abandonné après {item.get('attempts')} tentatives: {error}")
+            return True
+        
+        # Attente exponentielle à gigue complète
+        delay = random.uniform(0, self.retry_base_delay * 2 ** (item.get('attempts', 1) - 1))
+        self.collection.update_one(
+            {'_id': item['_id'], 'status': LEASED, 'owner': owner},
+            {'$set': {'status': PENDING, 'last_error': error, 'available_at': _now() + timedelta(seconds=delay)},
+             '$unset': {'lease_expires_at': '', 'owner': ''}}
+        )
+        return False
+    
+    def retry_dead(self) -> int:
+        """Remet les éléments de la dead letter dans la file (tentatives remises à zéro)"""
+        count = 0
+        for item in self.dead_letter.find():
+            item.update(status=PENDING, attempts=0, available_at=_now())
+            for field in ('dead_at', 'owner'):
+                item.pop(field, None)
+            self.collection.replace_one({'_id': item['_id']}, item, upsert=True)
+            self.dead_letter.delete_one({'_id': item['_id']})
+            count += 1
+        return count
+    
+    def count(self, **query: Any) -> int:
+        return self.collection.count_documents(query)
+    
+    def stats(self) -> Dict[str, int]:
+        """Éléments par état (pending, leased, done) et dans la dead letter"""
+        stats = {PENDING: 0, LEASED: 0, DONE: 0}
+        for group in self.collection.aggregate([{'$group': {'_id': '$status', 'count': {'$sum': 1}}}]):
+            stats[group['_id']] = group['count']
+        stats['dead'] = self.dead_letter.count_documents({})
+        return stats
+    
+    def drained(self) -> bool:
+        """Plus rien à faire : ni élément en attente, ni réservation en cours"""
+        return self.collection.count_documents({'status': {'$in': [PENDING, LEASED]}}, limit=1) == 0
+    
+    def clear(self):
+        """Vide la file et la dead letter (nouveau crawl)"""
+        self.collection.delete_many({})
+        self.dead_letter.delete_many({})
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+📰 MODÈLE ARTICLE
+Article compact (__slots__, champs typés) et lot colonnaire pour les traitements
+en masse ; les dicts n'existent qu'aux frontières (MongoDB, JSON)
+"""
+
+import json
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import bson
+
+from app.utils.dates import UNKNOWN_DATE, as_utc, parse_date
+
+DEFAULT_AUTHOR = "Blog du Modérateur"
+DEFAULT_CATEGORY = "Non classé"
+DEFAULT_DATE = UNKNOWN_DATE
+
+# Instants stockés en microsecondes depuis ces origines (scraped_at en heure locale
+# naïve, published_at en UTC), aller-retour exact
+_EPOCH = datetime(1970, 1, 1)
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# Code des dates de publication absentes dans ArticleBatch
+_NO_DATE = -2 ** 63
+
+# Ancien format de scraped_at (chaîne) encore présent dans les documents existants
+LEGACY_SCRAPED_AT_FORMAT = "%d/%m/%Y à %H:%M"
+
+
+def _parse_scraped_at(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.strptime(value, LEGACY_SCRAPED_AT_FORMAT)
+        except ValueError:
+            pass
+    return datetime.now()
+
+
+def _published_to_int(value: Optional[datetime]) -> int:
+    return _NO_DATE if value is None else (as_utc(value) - _UTC_EPOCH) // _MICROSECOND
+
+
+def _published_from_int(value: int) -> Optional[datetime]:
+    return None if value == _NO_DATE else _UTC_EPOCH + value * _MICROSECOND
+
+
+class Article:
+    """Article scrapé : un objet à slots plutôt qu'un dict de neuf clés"""
+    
+    __slots__ = ('id', 'title', 'url', 'date', 'excerpt', 'category', 'image_url', 'author', 'scraped_at',
+                 'published_at')
+    
+    def __init__(self, id: str, title: str, url: str, date: str = DEFAULT_DATE,
+                 excerpt: Optional[str] = None, category: str = DEFAULT_CATEGORY,
+                 image_url: str = "", author: str = DEFAULT_AUTHOR,
+                 scraped_at: Optional[datetime] = None, published_at: Optional[datetime] = None):
+        """
+        Args:
+            id: Identifiant de l'article sur le blog (post-1234)
+            date: Date de publication telle que publiée sur le blog (texte source)
+            excerpt: Extrait, complété après la page de liste (None tant qu'il manque)
+            category: Catégorie (internée : quelques dizaines de valeurs distinctes)
+            scraped_at: Instant du scraping (maintenant par défaut)
+            published_at: Date de publication avec fuseau (None si date illisible)
+        """
+        self.id = id
+        self.title = title
+        self.url = url
+        self.date = date
+        self.excerpt = excerpt
+        self.category = sys.intern(category)
+        self.image_url = image_url
+        self.author = sys.intern(author)
+        self.scraped_at = scraped_at if scraped_at is not None else datetime.now()
+        self.published_at = published_at
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Article":
+        """Article depuis un dict (document MongoDB, ancien format) ; clés inconnues ignorées"""
+        published_at = data.get('published_at')
+        # Anciens documents : date de publication relue depuis le texte source
+        published_at = as_utc(published_at) if isinstance(published_at, datetime) else parse_date(data.get('date'))
+        return cls(
+            id=data['id'],
+            title=data.get('title', ''),
+            url=data.get('url', ''),
+            date=data.get('date') or DEFAULT_DATE,
+            excerpt=data.get('excerpt'),
+            category=data.get('category') or DEFAULT_CATEGORY,
+            image_url=data.get('image_url') or '',
+            author=data.get('author') or DEFAULT_AUTHOR,
+            scraped_at=_parse_scraped_at(data.get('scraped_at')),
+            published_at=published_at
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Document MongoDB (scraped_at reste un datetime, encodé en date BSON)"""
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    def to_json_dict(self) -> Dict[str, Any]:
+        document = self.to_dict()
+        document['scraped_at'] = self.scraped_at.isoformat()
+        if self.published_at is not None:
+            document['published_at'] = self.published_at.isoformat()
+        return document
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Article):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+    
+    def __reduce__(self):
+        # Pickle compact (pool de parsing) : arguments positionnels dans l'ordre des slots,
+        # catégorie et auteur ré-internés à la reconstruction
+        return Article, tuple(getattr(self, field) for field in self.__slots__)
+    
+    def __repr__(self) -> str:
+        return f"Article(id={self.id!r}, title={self.title[:40]!r})"
+
+
+class ArticleBatch:
+    """
+    Lot d'articles en colonnes : une liste par champ, catégories et auteurs codés
+    par dictionnaire (array d'entiers), instants de scraping et de publication en
+    array d'entiers
+    """
+    
+    __slots__ = ('ids', 'titles', 'urls', 'dates', 'excerpts', 'image_urls',
+                 '_categories', '_authors', '_scraped_at', '_published_at', '_codes', '_values')
+    
+    def __init__(self, articles: Iterable[Article] = ()):
+        self.ids: List[str] = []
+        self.titles: List[str] = []
+        self.urls: List[str] = []
+        self.dates: List[str] = []
+        self.excerpts: List[Optional[str]] = []
+        self.image_urls: List[str] = []
+        self._categories = array('I')
+        self._authors = array('I')
+        self._scraped_at = array('q')
+        self._published_at = array('q')
+        # Dictionnaire commun aux catégories et auteurs : valeur <-> code
+        self._codes: Dict[str, int] = {}
+        self._values: List[str] = []
+        self.extend(articles)
+    
+    @classmethod
+    def from_dicts(cls, documents: Iterable[Dict[str, Any]]) -> "ArticleBatch":
+        return cls(Article.from_dict(document) for document in documents)
+    
+    def _code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(sys.intern(value))
+        return code
+    
+    def append(self, article: Article):
+        self.ids.append(article.id)
+        self.titles.append(article.title)
+        self.urls.append(article.url)
+        self.dates.append(article.date)
+        self.excerpts.append(article.excerpt)
+        self.image_urls.append(article.image_url)
+        self._categories.append(self._code(article.category))
+        self._authors.append(self._code(article.author))
+        self._scraped_at.append((article.scraped_at - _EPOCH) // _MICROSECOND)
+        self._published_at.append(_published_to_int(article.published_at))
+    
+    def extend(self, articles: Iterable[Article]):
+        for article in articles:
+            self.append(article)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __getitem__(self, index: int) -> Article:
+        return Article(
+            self.ids[index], self.titles[index], self.urls[index], self.dates[index],
+            self.excerpts[index], self._values[self._categories[index]], self.image_urls[index],
+            self._values[self._authors[index]], _EPOCH + self._scraped_at[index] * _MICROSECOND,
+            _published_from_int(self._published_at[index])
+        )
+    
+    def __iter__(self) -> Iterator[Article]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    @property
+    def categories(self) -> List[str]:
+        values = self._values
+        return [values[code] for code in self._categories]
+    
+    def category_counts(self) -> Dict[str, int]:
+        """Articles par catégorie, calculé sur les codes sans reconstruire les articles"""
+        counts: Dict[int, int] = {}
+        for code in self._categories:
+            counts[code] = counts.get(code, 0) + 1
+        return {self._values[code]: count for code, count in counts.items()}
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Documents MongoDB, construits colonne par colonne"""
+        values = self._values
+        return [
+            {
+                'id': id, 'title': title, 'url': url, 'date': date, 'excerpt': excerpt,
+                'category': values[category], 'image_url': image_url, 'author': values[author],
+                'scraped_at': _EPOCH + scraped_at * _MICROSECOND,
+                'published_at': _published_from_int(published_at)
+            }
+            for id, title, url, date, excerpt, category, image_url, author, scraped_at, published_at in zip(
+                self.ids, self.titles, self.urls, self.dates, self.excerpts, self._categories,
+                self.image_urls, self._authors, self._scraped_at, self._published_at
+            )
+        ]
+    
+    def to_bson(self) -> bytes:
+        """Documents BSON concaténés (format mongodump, relu par bson.decode_all)"""
+        return b''.join(bson.encode(document) for document in self.to_dicts())
+    
+    def to_json(self) -> str:
+        """Tableau JSON (instants au format ISO 8601)"""
+        documents = self.to_dicts()
+        for document in documents:
+            document['scraped_at'] = document['scraped_at'].isoformat()
+            if document['published_at'] is not None:
+                document['published_at'] = document['published_at'].isoformat()
+        return json.dumps(documents, ensure_ascii=False)
+
+
+ArticleLike = Union[Article, Dict[str, Any]]
+
+
+def to_documents(articles: Union[ArticleBatch, Sequence[ArticleLike]]) -> List[Dict[str, Any]]:
+    """Documents MongoDB pour un lot, une liste d'articles ou de dicts (conversion de frontière)"""
+    if isinstance(articles, ArticleBatch):
+        return articles.to_dicts()
+    return [article.to_dict() if isinstance(article, Article) else article for article in articles]
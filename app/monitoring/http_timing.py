@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+🌐 CHRONOMÉTRAGE DES CONNEXIONS HTTP
+Phases DNS / TCP / TLS des nouvelles connexions : classes de connexion urllib3 pour
+requests, TraceConfig pour aiohttp
+"""
+
+import socket
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from app.monitoring.metrics import enabled
+from app.monitoring.pipeline import HTTP_PHASE_SECONDS
+
+try:
+    import aiohttp
+except ImportError:  # Optionnel : pip install aiohttp
+    aiohttp = None
+
+
+def _timed_new_conn(conn, new_conn):
+    """Résolution DNS chronométrée puis connexion TCP à chaque adresse, comme urllib3"""
+    
+    host = conn._dns_host
+    started = time.perf_counter()
+    try:
+        addresses = socket.getaddrinfo(host, conn.port, 0, socket.SOCK_STREAM)
+    except OSError:
+        # Erreur de résolution remontée par urllib3 (NameResolutionError)
+        return new_conn()
+    dns = time.perf_counter() - started
+    HTTP_PHASE_SECONDS.observe(dns, phase='dns')
+    
+    error = None
+    try:
+        for address in dict.fromkeys(info[4][0] for info in addresses):
+            conn._dns_host = address
+            started = time.perf_counter()
+            try:
+                sock = new_conn()
+            except Exception as e:
+                error = e
+                continue
+            tcp = time.perf_counter() - started
+            HTTP_PHASE_SECONDS.observe(tcp, phase='connect')
+            conn._socket_seconds = dns + tcp
+            return sock
+        raise error
+    finally:
+        # Le nom d'hôte (SNI, en-tête Host) n'est jamais modifié ; seule l'adresse l'était
+        conn._dns_host = host
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self):
+        if not enabled():
+            return super()._new_conn()
+        return _timed_new_conn(self, super()._new_conn)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def _new_conn(self):
+        if not enabled():
+            return super()._new_conn()
+        return _timed_new_conn(self, super()._new_conn)
+    
+    def connect(self):
+        if not enabled():
+            return super().connect()
+        self._socket_seconds = 0.0
+        started = time.perf_counter()
+        super().connect()
+        # Poignée de main TLS : durée totale moins DNS et TCP
+        HTTP_PHASE_SECONDS.observe(max(0.0, time.perf_counter() - started - self._socket_seconds), phase='tls')
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def instrument_adapter(adapter: HTTPAdapter) -> HTTPAdapter:
+    """Les nouvelles connexions de cet adaptateur sont chronométrées (si les métriques sont actives)"""
+    adapter.poolmanager.pool_classes_by_scheme = {
+        'http': TimedHTTPConnectionPool,
+        'https': TimedHTTPSConnectionPool,
+    }
+    return adapter
+
+
+def aiohttp_trace_config():
+    """TraceConfig aiohttp : DNS, connexion (TCP + TLS) et premier octet"""
+    
+    if aiohttp is None:
+        raise ImportError("aiohttp_trace_config nécessite aiohttp (pip install aiohttp)")
+    
+    async def on_request_start(session, context, params):
+        context.request_started = time.perf_counter()
+        context.dns_seconds = 0.0
+    
+    async def on_dns_start(session, context, params):
+        context.dns_started = time.perf_counter()
+    
+    async def on_dns_end(session, context, params):
+        context.dns_seconds = time.perf_counter() - context.dns_started
+        HTTP_PHASE_SECONDS.observe(context.dns_seconds, phase='dns')
+    
+    async def on_connection_start(session, context, params):
+        context.connection_started = time.perf_counter()
+    
+    async def on_connection_end(session, context, params):
+        elapsed = time.perf_counter() - context.connection_started - context.dns_seconds
+        HTTP_PHASE_SECONDS.observe(max(0.0, elapsed), phase='connect')
+    
+    async def on_request_end(session, context, params):
+        # En-têtes reçus : temps jusqu'au premier octet, connexion éventuelle comprise
+        HTTP_PHASE_SECONDS.observe(time.perf_counter() - context.request_started, phase='ttfb')
+    
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_end)
+    trace_config.on_connection_create_start.append(on_connection_start)
+    trace_config.on_connection_create_end.append(on_connection_end)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+📈 MÉTRIQUES (COMPTEURS, HISTOGRAMMES, JAUGES)
+Registre en mémoire exporté au format texte Prometheus ou en résumé JSON ;
+désactivé, chaque mesure se réduit à un test de drapeau
+"""
+
+import bisect
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Désactivées par défaut hors interface web (voir enable)
+_enabled = os.getenv('METRICS_ENABLED', '0') == '1'
+
+# Bornes des histogrammes de durée (s), de 0,5 ms à 10 s
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NULL_TIMER = nullcontext()
+
+
+def enable(flag: bool = True):
+    """Active (ou désactive) l'enregistrement des mesures pour tout le processus"""
+    global _enabled
+    _enabled = flag
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """Base commune : nom, aide, étiquettes et valeurs par combinaison d'étiquettes"""
+    
+    kind = 'untyped'
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 registry: Optional["Registry"] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+    
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+    
+    def _label_text(self, key: Tuple[str, ...]) -> str:
+        return ','.join(f'{name}={value}' for name, value in zip(self.labelnames, key))
+    
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+    
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Lignes d'exposition Prometheus de la métrique"""
+    
+    @abstractmethod
+    def summary(self) -> Dict:
+        """Valeurs agrégées par combinaison d'étiquettes (export JSON)"""
+
+
+class Counter(Metric):
+    """Total croissant (requêtes, erreurs, octets)"""
+    
+    kind = 'counter'
+    
+    def inc(self, amount: float = 1.0, **labels):
+        if not _enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+                for key, value in items]
+    
+    def summary(self) -> Dict:
+        with self._lock:
+            return {self._label_text(key): value for key, value in sorted(self._values.items())}
+
+
+class _Timer:
+    __slots__ = ('histogram', 'labels', 'started')
+    
+    def __init__(self, histogram: "Histogram", labels: Dict):
+        self.histogram = histogram
+        self.labels = labels
+    
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+        return False
+
+
+class Histogram(Metric):
+    """Distribution de durées : compteurs par borne, somme, nombre et maximum"""
+    
+    kind = 'histogram'
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, registry: Optional["Registry"] = None):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+    
+    def observe(self, value: float, **labels):
+        if not _enabled:
+            return
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [compteurs par borne (+ dépassement), somme, nombre, maximum]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0, 0.0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+            if value > state[3]:
+                state[3] = value
+    
+    def time(self, **labels):
+        """Chronomètre un bloc `with` (contexte vide si les métriques sont désactivées)"""
+        if not _enabled:
+            return _NULL_TIMER
+        return _Timer(self, labels)
+    
+    def _quantile(self, counts: List[int], total: int, maximum: float, q: float) -> float:
+        # Interpolation linéaire dans la borne qui contient le quantile
+        rank = q * total
+        cumulative = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets + (maximum,), counts):
+            if count and cumulative + count >= rank:
+                return min(maximum, lower + (upper - lower) * (rank - cumulative) / count)
+            cumulative += count
+            lower = upper
+        return maximum
+    
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, ('le', _format_value(bound)))
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+            lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+    
+    def summary(self) -> Dict:
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1], state[2], state[3])) for key, state in self._values.items())
+        return {
+            self._label_text(key): {
+                'count': count,
+                'sum': round(total, 6),
+                'mean': round(total / count, 6),
+                'p50': round(self._quantile(counts, count, maximum, 0.50), 6),
+                'p95': round(self._quantile(counts, count, maximum, 0.95), 6),
+                'max': round(maximum, 6)
+            }
+            for key, (counts, total, count, maximum) in items
+        }
+
+
+class Gauge(Metric):
+    """Valeur instantanée lue à l'export (ex. connexions du pool MongoDB)"""
+    
+    kind = 'gauge'
+    
+    def __init__(self, name: str, documentation: str, function: Callable[[], float],
+                 registry: Optional["Registry"] = None):
+        self.function = function
+        super().__init__(name, documentation, (), registry)
+    
+    def samples(self) -> List[str]:
+        return [f'{self.name} {_format_value(self.function())}']
+    
+    def summary(self) -> Dict:
+        return {'': self.function()}
+
+
+class Registry:
+    """Ensemble des métriques du processus"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, metric: Metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Métrique déjà enregistrée: {metric.name}")
+            self._metrics[metric.name] = metric
+    
+    def metrics(self) -> List[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+    
+    def reset(self):
+        for metric in self.metrics():
+            metric.reset()
+    
+    def to_prometheus(self) -> str:
+        """Format d'exposition texte Prometheus (version 0.0.4)"""
+        lines = []
+        for metric in self.metrics():
+            samples = metric.samples()
+            if not samples:
+                continue
+            lines.append(f'# HELP {metric.name} {_escape(metric.documentation)}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+    
+    def summary(self) -> Dict[str, Dict]:
+        """Résumé JSON : totaux des compteurs ; nombre, moyenne, max et p50/p95 (estimés par borne) des histogrammes"""
+        result = {}
+        for metric in self.metrics():
+            values = metric.summary()
+            if values:
+                result[metric.name] = values
+        return result
+
+
+REGISTRY = Registry()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+⏱️ MÉTRIQUES DU PIPELINE DE SCRAPING
+Téléchargement (DNS, connexion, TLS, premier octet, corps), parsing, sélecteurs,
+analyse des dates et commandes MongoDB
+"""
+
+from typing import Optional
+
+from pymongo import monitoring
+
+from app.monitoring.metrics import Counter, Histogram, enabled
+
+HTTP_PHASE_SECONDS = Histogram(
+    'scraper_http_phase_seconds',
+    "Durée des phases d'une requête HTTP (dns, connect, tls, ttfb, body)",
+    ['phase']
+)
+HTTP_REQUESTS = Counter('scraper_http_requests_total', "Requêtes HTTP par code de réponse", ['status'])
+HTTP_BYTES = Counter('scraper_http_response_bytes_total', "Octets de corps de réponse reçus")
+
+PARSE_SECONDS = Histogram('scraper_parse_seconds', "Durée du parsing BeautifulSoup", ['page'])
+SELECTOR_SECONDS = Histogram('scraper_selector_seconds', "Durée de l'extraction par groupe de sélecteurs", ['selector'])
+SELECTOR_HITS = Counter('scraper_selector_hits_total', "Sélecteur ayant fourni la valeur retenue", ['selector'])
+SELECTOR_MISSES = Counter('scraper_selector_misses_total', "Sélecteur sans résultat", ['selector'])
+PARSE_DATE_SECONDS = Histogram('scraper_parse_date_seconds', "Durée de l'analyse des dates (cache compris)",
+                               buckets=(0.000001, 0.000005, 0.00001, 0.00005, 0.0001, 0.001))
+
+MONGO_COMMAND_SECONDS = Histogram('mongo_command_seconds', "Durée des commandes MongoDB", ['command'])
+MONGO_COMMAND_FAILURES = Counter('mongo_command_failures_total', "Commandes MongoDB en échec", ['command'])
+
+
+def record_http_response(status, nbytes: int = 0, ttfb: Optional[float] = None, body: Optional[float] = None):
+    """Code de réponse, taille du corps et phases mesurées côté client"""
+    if not enabled():
+        return
+    HTTP_REQUESTS.inc(status=status)
+    if nbytes:
+        HTTP_BYTES.inc(nbytes)
+    if ttfb is not None:
+        HTTP_PHASE_SECONDS.observe(ttfb, phase='ttfb')
+    if body is not None:
+        HTTP_PHASE_SECONDS.observe(body, phase='body')
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """Durée de chaque commande MongoDB (find, update, aggregate...) d'après pymongo"""
+    
+    def started(self, event):
+        pass
+    
+    def succeeded(self, event):
+        if enabled():
+            MONGO_COMMAND_SECONDS.observe(event.duration_micros / 1e6, command=event.command_name)
+    
+    def failed(self, event):
+        if enabled():
+            MONGO_COMMAND_SECONDS.observe(event.duration_micros / 1e6, command=event.command_name)
+            MONGO_COMMAND_FAILURES.inc(command=event.command_name)
+
+
+COMMAND_MONITOR = CommandMonitor()
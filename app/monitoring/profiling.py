@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+🔬 PROFILAGE PAR ÉTAPE
+cProfile (fichiers .pstats + top cumulé) ou tracemalloc (top des allocations et pic
+mémoire) autour de chaque étape du pipeline, avec échantillonnage 1 exécution sur N
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import random
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ('cpu', 'mem')
+PROFILE_DIR = os.getenv('PROFILE_DIR', 'profiles')
+
+# Lignes des rapports texte et profondeur des traces d'allocation
+PROFILE_TOP = 30
+TRACEMALLOC_FRAMES = 10
+
+# Allocations internes exclues des rapports mémoire
+_MEMORY_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+]
+
+
+def should_profile(sample_every: int = 1) -> bool:
+    """Tirage 1 exécution sur N (profilage occasionnel en production)"""
+    return sample_every <= 1 or random.randrange(sample_every) == 0
+
+
+class StageProfiler:
+    """Profil séparé pour chaque étape, rapports écrits dans un répertoire"""
+    
+    def __init__(self, mode: str, directory: str = PROFILE_DIR, top: int = PROFILE_TOP):
+        """
+        Args:
+            mode: 'cpu' (cProfile) ou 'mem' (tracemalloc)
+            directory: Répertoire des rapports (créé au besoin)
+            top: Nombre de fonctions / lignes d'allocation par rapport
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Mode de profilage inconnu: {mode} (disponibles: {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.directory = directory
+        self.top = top
+        self.run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.reports: List[str] = []
+        self.summary: Dict[str, Dict] = {}
+    
+    def _path(self, stage: str, extension: str) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f"{self.run_id}-{self.mode}-{stage}.{extension}")
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Profile le bloc `with` comme étape `name`"""
+        profile = self._profile_cpu if self.mode == 'cpu' else self._profile_memory
+        with profile(name):
+            yield
+    
+    @contextmanager
+    def _profile_cpu(self, name: str):
+        # cProfile ne suit que le thread courant (BlogScraper séquentiel, max_workers=1)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            stats_path = self._path(name, 'pstats')
+            profiler.dump_stats(stats_path)
+            
+            report = io.StringIO()
+            stats = pstats.Stats(profiler, stream=report)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+            report_path = self._path(name, 'txt')
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(report.getvalue())
+            
+            self.reports += [stats_path, report_path]
+            self.summary[name] = {'calls': stats.total_calls, 'seconds': round(stats.total_tt, 6)}
+            logger.info(f"🔬 Profil CPU '{name}': {stats.total_tt:.3f}s, {stats_path}")
+    
+    @contextmanager
+    def _profile_memory(self, name: str):
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+        current_before, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+            if started_here:
+                tracemalloc.stop()
+            
+            lines = [
+                f"Étape: {name}",
+                f"Pic pendant l'étape: {peak / 1024:.1f} Kio (départ {current_before / 1024:.1f} Kio)",
+                f"Mémoire conservée: {(current - current_before) / 1024:+.1f} Kio",
+                "",
+                f"Top {self.top} des allocations (par ligne, écart depuis le début de l'étape):",
+            ]
+            lines += [str(stat) for stat in after.compare_to(before, 'lineno')[:self.top]]
+            lines += ["", "Trace de la plus grosse allocation conservée:"]
+            by_trace = after.compare_to(before, 'traceback')
+            if by_trace:
+                lines += by_trace[0].traceback.format()
+            
+            report_path = self._path(name, 'txt')
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            
+            self.reports.append(report_path)
+            self.summary[name] = {'peak_kib': round(peak / 1024, 1),
+                                  'retained_kib': round((current - current_before) / 1024, 1)}
+            logger.info(f"🔬 Profil mémoire '{name}': pic {peak / 1024:.0f} Kio, {report_path}")
+
+
+@contextmanager
+def maybe_stage(profiler: Optional[StageProfiler], name: str):
+    """Étape profilée si un profileur est actif, bloc exécuté tel quel sinon"""
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
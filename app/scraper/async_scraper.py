@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+⚡ SCRAPER ASYNCHRONE - BLOG DU MODÉRATEUR
+Même extraction que BlogScraper, téléchargements concurrents sur une boucle asyncio (aiohttp)
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup
+
+from app.models.article import Article
+from app.monitoring import metrics
+from app.monitoring.http_timing import aiohttp_trace_config
+from app.monitoring.pipeline import record_http_response
+from app.scraper.main_scraper import BASE_URL, USER_AGENT, ArticleExtractor
+from app.scraper.parsing import ARTICLE_PAGE_STRAINER, LISTING_STRAINER
+from app.scraper.rate_limiter import HostRateLimiter
+
+try:
+    import aiohttp
+except ImportError:  # Optionnel : pip install aiohttp
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Connexions simultanées, tous hôtes confondus
+DEFAULT_CONCURRENCY = 64
+
+KnownLookup = Callable[[List[str]], Union[Dict[str, Dict], Awaitable[Dict[str, Dict]]]]
+
+
+class AsyncBlogScraper(ArticleExtractor):
+    """Variante asyncio de BlogScraper : une tâche par article, sans thread"""
+    
+    def __init__(self, base_url: str = BASE_URL, concurrency: int = DEFAULT_CONCURRENCY,
+                 per_host_limit: int = 4, rate_limiter: Optional[HostRateLimiter] = None,
+                 parser: Optional[str] = None, partial_parsing: bool = True,
+                 session: Optional["aiohttp.ClientSession"] = None):
+        """
+        Args:
+            base_url: URL de la page d'accueil à scraper
+            concurrency: Nombre maximum de connexions ouvertes
+            per_host_limit: Nombre maximum de requêtes simultanées vers un même hôte
+            rate_limiter: Politique de débit par hôte (2 requêtes/s par défaut)
+            parser: Backend BeautifulSoup ('lxml' par défaut, 'html.parser', 'html5lib')
+            partial_parsing: Ne construit que les sous-arbres utiles (SoupStrainer)
+            session: Session aiohttp existante (sinon créée et fermée par le scraper)
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncBlogScraper nécessite aiohttp (pip install aiohttp)")
+        
+        super().__init__(base_url, parser, partial_parsing)
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.concurrency = max(1, concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self._session = session
+        self._owns_session = session is None
+    
+    async def __aenter__(self) -> "AsyncBlogScraper":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def close(self):
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # Créée à la première requête : la session doit appartenir à la boucle en cours
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host_limit)
+            # Phases DNS/connexion/premier octet, seulement si les métriques sont actives
+            trace_configs = [aiohttp_trace_config()] if metrics.enabled() else None
+            self._session = aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT},
+                                                  trace_configs=trace_configs)
+        return self._session
+    
+    async def scrape_articles(self, max_articles: int = 15,
+                              known_lookup: Optional[KnownLookup] = None) -> List[Article]:
+        """
+        Scrape les articles du blog
+        
+        Args:
+            max_articles: Nombre maximum d'articles (15 par défaut)
+            known_lookup: Mode incrémental (fonction ou coroutine, ex.
+                AsyncMongoService.get_known_articles)
+            
+        Returns:
+            Liste des articles scrapés
+        """
+        return [article async for article in self.iter_articles(max_articles, known_lookup)]
+    
+    async def iter_articles(self, max_articles: int = 15,
+                            known_lookup: Optional[KnownLookup] = None) -> AsyncIterator[Article]:
+        """Articles produits dans l'ordre de la page d'accueil, téléchargés en parallèle"""
+        
+        logger.info(f"🚀 Début du scraping asynchrone - Maximum {max_articles} articles")
+        
+        try:
+            soup = await self.fetch_listing(self.base_url)
+            listings = self.extract_listings(soup, max_articles)
+            del soup
+            if not listings:
+                return
+            
+            if known_lookup is not None:
+                known = known_lookup([listing.id for listing in listings])
+                if inspect.isawaitable(known):
+                    known = await known
+                listings = self.skip_unchanged(listings, lambda ids: known)
+            
+        except Exception as e:
+            logger.error(f"❌ Erreur de scraping: {e}")
+            return
+        
+        count = 0
+        async for article in self.iter_completed(listings):
+            count += 1
+            yield article
+        
+        logger.info(f"🎯 Scraping terminé: {count}/{len(listings)} articles récupérés")
+    
+    async def fetch_listing(self, url: str) -> BeautifulSoup:
+        """Télécharge et parse une page de liste (accueil, pagination, catégorie)"""
+        
+        content = await self._get(url, timeout=10)
+        return self._parse(content, LISTING_STRAINER)
+    
+    async def complete_articles(self, listings: List[Article]) -> List[Article]:
+        """Récupère l'extrait de chaque article, toutes les pages en parallèle"""
+        return [article async for article in self.iter_completed(listings)]
+    
+    async def iter_completed(self, listings: List[Article]) -> AsyncIterator[Article]:
+        """Produit chaque article complété, dans l'ordre des listings"""
+        
+        tasks = [asyncio.create_task(self._complete_article(listing)) for listing in listings]
+        try:
+            for i, task in enumerate(tasks, 1):
+                try:
+                    article_data = await task
+                    logger.info(f"✅ Article {i}/{len(tasks)}: {article_data.title[:50]}...")
+                except Exception as e:
+                    logger.error(f"❌ Erreur article {i}: {e}")
+                    continue
+                
+                yield article_data
+        finally:
+            # Consommateur arrêté avant la fin : les téléchargements restants sont annulés
+            for task in tasks:
+                task.cancel()
+    
+    async def _get(self, url: str, timeout: float) -> bytes:
+        """Requête GET respectant le débit par hôte (les connexions sont bornées par le connecteur)"""
+        
+        await self.rate_limiter.acquire_async(url)
+        
+        session = self._get_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            started = time.perf_counter()
+            body = await response.read()
+            record_http_response(response.status, len(body), body=time.perf_counter() - started)
+            return body
+    
+    async def _complete_article(self, listing: Article) -> Article:
+        """Complète un article de la page d'accueil avec l'extrait de sa page"""
+        
+        listing.excerpt = await self._get_excerpt_from_article(listing.url)
+        return listing
+    
+    async def _get_excerpt_from_article(self, url: str) -> str:
+        """Récupère l'extrait depuis la page de l'article"""
+        
+        if not url:
+            return "Pas de description disponible."
+        
+        try:
+            content = await self._get(url, timeout=8)
+            soup = self._parse(content, ARTICLE_PAGE_STRAINER)
+            return self._extract_excerpt(soup)
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Impossible de récupérer l'extrait depuis {url}: {e}")
+            return "Consultez l'article pour plus de détails."
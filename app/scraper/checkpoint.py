@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+💾 POINTS DE REPRISE DU CRAWL
+État du crawl (frontière, URLs déjà vues, compteurs, dernière page de liste)
+enregistré périodiquement dans MongoDB ou un fichier local, pour qu'un crawl
+interrompu reprenne où il s'était arrêté
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from bson import json_util
+
+logger = logging.getLogger(__name__)
+
+# Pages de liste entre deux points de reprise
+CHECKPOINT_EVERY_PAGES = int(os.getenv('CRAWL_CHECKPOINT_EVERY', 5))
+
+
+class FileCheckpointStore:
+    """Point de reprise en JSON étendu (octets, dates) dans un fichier local, remplacé atomiquement"""
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json_util.loads(f.read())
+        except FileNotFoundError:
+            return None
+    
+    def save(self, state: Dict[str, Any]):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write(json_util.dumps(state))
+            f.flush()
+            os.fsync(f.fileno())
+        # Un arrêt pendant l'écriture laisse intact le point de reprise précédent
+        os.replace(temporary, self.path)
+    
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class CrawlCheckpoint:
+    """
+    Cadence et cohérence des points de reprise : un état n'est enregistré
+    qu'après la sauvegarde de tous les articles produits avant lui
+    """
+    
+    def __init__(self, store, every_pages: int = CHECKPOINT_EVERY_PAGES,
+                 persist: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            store: Stockage (FileCheckpointStore, MongoCheckpointStore) : load, save, clear
+            every_pages: Pages de liste entre deux points de reprise
+            persist: Écrit les articles en attente (ex. ArticleSink.flush), False en cas
+                d'échec ; le point de reprise n'est alors pas enregistré
+        """
+        self.store = store
+        self.every_pages = max(1, every_pages)
+        self.persist = persist
+        self.saved = 0
+        self._last_pages = 0
+    
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Dernier point de reprise, None s'il n'y en a pas (ou s'il est illisible)"""
+        try:
+            state = self.store.load()
+        except Exception as e:
+            logger.warning(f"⚠️ Point de reprise illisible, crawl repris depuis le début: {e}")
+            return None
+        if state:
+            self._last_pages = state.get('pages', 0)
+        return state
+    
+    def due(self, pages: int) -> bool:
+        return pages - self._last_pages >= self.every_pages
+    
+    def save(self, state: Dict[str, Any], pages: int) -> bool:
+        """Enregistre l'état si les articles précédents sont bien en base"""
+        self._last_pages = pages
+        if self.persist is not None and not self.persist():
+            logger.warning("⚠️ Articles non sauvegardés, point de reprise précédent conservé")
+            return False
+        try:
+            self.store.save({**state, 'updated_at': datetime.now(timezone.utc)})
+        except Exception as e:
+            # Le crawl continue : seule la reprise en cas d'arrêt est moins précise
+            logger.error(f"❌ Point de reprise non enregistré: {e}")
+            return False
+        self.saved += 1
+        logger.info(f"💾 Point de reprise: {pages} pages, {len(state.get('frontier', []))} en attente")
+        return True
+    
+    def clear(self):
+        try:
+            self.store.clear()
+        except Exception as e:
+            logger.warning(f"⚠️ Point de reprise non supprimé: {e}")
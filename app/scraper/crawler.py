@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+🕸️ CRAWLER MULTI-PAGES
+Parcours des archives (pagination + catégories) autour de BlogScraper
+"""
+
+import hashlib
+import heapq
+import itertools
+import logging
+import math
+import re
+import struct
+from array import array
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+from app.models.article import Article
+from app.scraper.main_scraper import BlogScraper
+
+if TYPE_CHECKING:
+    from app.scraper.checkpoint import CrawlCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# Pages de liste reconnues
+PAGINATION_PATTERN = re.compile(r'/page/(\d+)/?$')
+CATEGORY_PATTERN = re.compile(r'/(category|tag)/[^/]+/?$')
+
+
+def normalize_url(url: str) -> str:
+    """URL canonique pour la déduplication (sans fragment, hôte en minuscules)"""
+    url, _ = urldefrag(url)
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    query = f"?{parts.query}" if parts.query else ''
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}{query}"
+
+
+def _digest(item: str) -> bytes:
+    return hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+
+
+class HashedUrlSet:
+    """Ensemble de condensats 64 bits : exact en pratique, ~2x plus compact qu'un set des URLs (int Python par entrée)"""
+    
+    def __init__(self):
+        self._hashes = set()
+    
+    def add(self, item: str) -> bool:
+        """Ajoute l'élément, retourne False s'il était déjà présent"""
+        h = int.from_bytes(_digest(item)[:8], 'big')
+        if h in self._hashes:
+            return False
+        self._hashes.add(h)
+        return True
+    
+    def __contains__(self, item: str) -> bool:
+        return int.from_bytes(_digest(item)[:8], 'big') in self._hashes
+    
+    def __len__(self) -> int:
+        return len(self._hashes)
+    
+    def dump(self) -> bytes:
+        """État binaire (8 octets par URL) pour les points de reprise"""
+        return array('Q', self._hashes).tobytes()
+    
+    @classmethod
+    def load(cls, data: bytes) -> "HashedUrlSet":
+        hashes = array('Q')
+        hashes.frombytes(data)
+        seen = cls()
+        seen._hashes = set(hashes)
+        return seen
+
+
+class BloomFilter:
+    """Filtre de Bloom : mémoire fixe quelle que soit la taille du crawl (faux positifs possibles)"""
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+    
+    def _positions(self, item: str):
+        # Double hachage (Kirsch-Mitzenmacher) à partir d'un seul condensat
+        digest = _digest(item)
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def add(self, item: str) -> bool:
+        """Ajoute l'élément, retourne False s'il était (probablement) déjà présent"""
+        added = False
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self._count += 1
+        return added
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos // 8] & (1 << (pos % 8)) for pos in self._positions(item))
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    # En-tête de l'état binaire : capacité, taux d'erreur, éléments ajoutés
+    _HEADER = struct.Struct('<QdQ')
+    
+    def dump(self) -> bytes:
+        """État binaire (paramètres + bits) pour les points de reprise"""
+        return self._HEADER.pack(self.capacity, self.error_rate, self._count) + bytes(self._bits)
+    
+    @classmethod
+    def load(cls, data: bytes) -> "BloomFilter":
+        capacity, error_rate, count = cls._HEADER.unpack_from(data)
+        bloom = cls(capacity, error_rate)
+        bloom._bits = bytearray(data[cls._HEADER.size:])
+        bloom._count = count
+        return bloom
+
+
+class Frontier:
+    """File de priorité des pages de liste à visiter, dédupliquée"""
+    
+    def __init__(self, seen=None, max_depth: int = 1):
+        """
+        Args:
+            seen: Ensemble des URLs déjà planifiées (HashedUrlSet par défaut)
+            max_depth: Nombre maximum de sauts de catégorie depuis l'accueil
+        """
+        self.seen = seen if seen is not None else HashedUrlSet()
+        self.max_depth = max_depth
+        self._heap: List[Tuple[Tuple[int, int], int, str, int]] = []
+        self._counter = itertools.count()
+    
+    def push(self, url: str, depth: int, priority: Tuple[int, int]) -> bool:
+        """Planifie une URL (ignorée si trop profonde ou déjà vue)"""
+        if depth > self.max_depth:
+            return False
+        url = normalize_url(url)
+        if not self.seen.add(url):
+            return False
+        heapq.heappush(self._heap, (priority, next(self._counter), url, depth))
+        return True
+    
+    def pop(self) -> Optional[Tuple[str, int, Tuple[int, int]]]:
+        """Prochaine URL la plus prioritaire : (url, profondeur, priorité)"""
+        if not self._heap:
+            return None
+        priority, _, url, depth = heapq.heappop(self._heap)
+        return url, depth, priority
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def snapshot(self) -> List[List[Any]]:
+        """Pages en attente dans l'ordre de visite : [priorité, page, url, profondeur]"""
+        return [[priority[0], priority[1], url, depth] for priority, _, url, depth in sorted(self._heap)]
+    
+    def restore(self, entries: List[List[Any]]):
+        """Replanifie les pages d'un snapshot (déjà présentes dans seen)"""
+        for depth_priority, page, url, depth in entries:
+            heapq.heappush(self._heap, ((depth_priority, page), next(self._counter), url, depth))
+
+
+class BlogCrawler:
+    """Crawl des archives du blog : pagination /page/N/ et pages de catégories"""
+    
+    def __init__(self, scraper: BlogScraper, max_pages: int = 50, max_depth: int = 1,
+                 max_articles: int = 1000, follow_categories: bool = True,
+                 seen_factory: Callable[[], object] = HashedUrlSet):
+        """
+        Args:
+            scraper: Scraper utilisé pour les requêtes et l'extraction
+            max_pages: Nombre maximum de pages de liste visitées
+            max_depth: Profondeur de catégories (la pagination ne compte pas)
+            max_articles: Budget total d'articles
+            follow_categories: Suit les liens de catégories/tags
+            seen_factory: Structure de déduplication (HashedUrlSet ou BloomFilter)
+        """
+        self.scraper = scraper
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.max_articles = max_articles
+        self.follow_categories = follow_categories
+        self.seen_factory = seen_factory
+        self.host = urlsplit(scraper.base_url).netloc.lower()
+    
+    def crawl(self, known_lookup: Optional[Callable[[List[str]], Dict[str, Dict]]] = None) -> List[Article]:
+        """
+        Parcourt les pages de liste par priorité jusqu'à épuisement des budgets
+        
+        Args:
+            known_lookup: Mode incrémental (voir BlogScraper.scrape_articles)
+            
+        Returns:
+            Liste des articles scrapés
+        """
+        return list(self.iter_articles(known_lookup))
+    
+    def iter_articles(self, known_lookup: Optional[Callable[[List[str]], Dict[str, Dict]]] = None,
+                      checkpoint: Optional["CrawlCheckpoint"] = None) -> Iterator[Article]:
+        """
+        Version streaming de crawl : les articles sont produits page après page
+        
+        Args:
+            known_lookup: Mode incrémental (voir BlogScraper.scrape_articles)
+            checkpoint: Points de reprise périodiques ; s'il en existe un, le crawl
+                repart de sa frontière au lieu de la page d'accueil
+        """
+        logger.info(f"🕸️ Début du crawl - {self.max_pages} pages, {self.max_articles} articles maximum")
+        
+        state = checkpoint.load() if checkpoint is not None else None
+        if state and state.get('base_url') != self.scraper.base_url:
+            logger.warning(f"⚠️ Point de reprise d'un autre site ({state.get('base_url')}) ignoré")
+            state = None
+        if state:
+            frontier, articles_seen, pages, count = self._restore(state)
+            logger.info(f"♻️ Reprise du crawl: {pages} pages et {count} articles déjà traités, "
+                        f"{len(frontier)} pages en attente (dernière: {state.get('last_page')})")
+        else:
+            frontier = Frontier(self.seen_factory(), self.max_depth)
+            frontier.push(self.scraper.base_url, 0, (0, 1))
+            articles_seen = self.seen_factory()
+            count = 0
+            pages = 0
+        last_page = state.get('last_page') if state else None
+        # Pages de liste en échec ou coupées par le budget : conservées dans le point de reprise
+        revisit: List[List[Any]] = []
+        
+        while len(frontier) and pages < self.max_pages and count < self.max_articles:
+            if checkpoint is not None and checkpoint.due(pages):
+                # Entre deux pages : tous les articles produits jusqu'ici ont été remis à l'appelant
+                checkpoint.save(self._snapshot(frontier, articles_seen, pages, count, last_page, revisit), pages)
+            
+            url, depth, priority = frontier.pop()
+            
+            try:
+                soup = self.scraper.fetch_listing(url)
+            except Exception as e:
+                logger.error(f"❌ Page {url} en échec, reprise au prochain crawl --resume: {e}")
+                revisit.append([priority[0], priority[1], url, depth])
+                continue
+            
+            pages += 1
+            last_page = url
+            self._discover_links(soup, url, depth, frontier)
+            
+            # Un même article apparaît sur l'accueil et dans sa catégorie. Seuls les articles
+            # gardés dans le budget sont marqués vus : les autres restent à prendre à la reprise
+            listings = []
+            for listing in self.scraper.extract_listings(soup):
+                if len(listings) >= self.max_articles - count:
+                    revisit.append([priority[0], priority[1], url, depth])
+                    break
+                if articles_seen.add(listing.url or listing.id):
+                    listings.append(listing)
+            del soup
+            
+            if known_lookup is not None and listings:
+                listings = self.scraper.skip_unchanged(listings, known_lookup)
+            
+            for article in self.scraper.iter_completed(listings):
+                count += 1
+                yield article
+            
+            logger.info(f"📚 Page {pages}/{self.max_pages} ({url}): {count} articles, "
+                        f"{len(frontier)} pages en attente")
+        
+        if checkpoint is not None:
+            if not len(frontier) and not revisit:
+                # Crawl mené à son terme : la prochaine exécution repart de l'accueil
+                checkpoint.clear()
+            else:
+                # Budget atteint ou pages en échec : la reprise part de cet état
+                checkpoint.save(self._snapshot(frontier, articles_seen, pages, count, last_page, revisit), pages)
+        if revisit:
+            logger.warning(f"⚠️ {len(revisit)} pages de liste à revisiter, conservées dans le point de reprise")
+        logger.info(f"🎯 Crawl terminé: {count} articles sur {pages} pages")
+    
+    def _snapshot(self, frontier: Frontier, articles_seen, pages: int, count: int,
+                  last_page: Optional[str], revisit: List[List[Any]] = ()) -> Dict[str, Any]:
+        """État du crawl entre deux pages (documents BSON / JSON étendu), pages à revisiter replanifiées"""
+        return {
+            'base_url': self.scraper.base_url,
+            'seen_type': type(frontier.seen).__name__,
+            'pages': pages,
+            'count': count,
+            'last_page': last_page,
+            'frontier': sorted(frontier.snapshot() + list(revisit)),
+            'seen': frontier.seen.dump(),
+            'articles_seen': articles_seen.dump()
+        }
+    
+    def _restore(self, state: Dict[str, Any]) -> Tuple[Frontier, Any, int, int]:
+        seen_class = {cls.__name__: cls for cls in (HashedUrlSet, BloomFilter)}[state['seen_type']]
+        frontier = Frontier(seen_class.load(state['seen']), self.max_depth)
+        frontier.restore(state['frontier'])
+        return frontier, seen_class.load(state['articles_seen']), state['pages'], state['count']
+    
+    def _discover_links(self, soup, page_url: str, depth: int, frontier: Frontier):
+        """Planifie les liens de pagination et de catégories de la page"""
+        
+        for url, link_depth, priority in self.discover_links(soup, page_url, depth):
+            frontier.push(url, link_depth, priority)
+    
+    def discover_links(self, soup, page_url: str, depth: int) -> Iterator[Tuple[str, int, Tuple[int, int]]]:
+        """Liens de pagination et de catégories de la page : (url, profondeur, priorité)"""
+        
+        for link in soup.select('a[href]'):
+            url = urljoin(page_url, link['href'])
+            parts = urlsplit(url)
+            if parts.netloc.lower() != self.host:
+                continue
+            
+            page_match = PAGINATION_PATTERN.search(parts.path)
+            if page_match:
+                # La pagination reste au même niveau que sa page d'origine
+                yield url, depth, (depth, int(page_match.group(1)))
+            elif self.follow_categories and CATEGORY_PATTERN.search(parts.path):
+                yield url, depth + 1, (depth + 1, 1)
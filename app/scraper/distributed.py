@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+🐝 CRAWL DISTRIBUÉ
+Workers indépendants (processus ou machines) autour d'une file MongoDB partagée :
+pages de liste et pages d'articles sont des éléments réservés un par un, les
+articles complétés sont sauvegardés par MongoService, la politesse par hôte est
+globale (MongoRateLimiter)
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from app.database.mongo_service import MongoService
+from app.database.scrape_runs import default_owner
+from app.database.work_queue import WorkQueue
+from app.models.article import Article
+from app.scraper.crawler import BlogCrawler, normalize_url
+from app.scraper.main_scraper import BlogScraper
+
+logger = logging.getLogger(__name__)
+
+LISTING, ARTICLE = 'listing', 'article'
+
+# File vide mais réservations en cours ailleurs : nouvelle tentative après cette attente (s)
+POLL_INTERVAL = float(os.getenv('WORKER_POLL_INTERVAL', 0.5))
+# Écart de priorité entre deux niveaux de profondeur (numéros de page au-delà : même niveau)
+DEPTH_PRIORITY_SPAN = 100_000
+
+
+def listing_item(url: str, depth: int, priority: Tuple[int, int]) -> Dict:
+    """Page de liste à visiter ; priorité croissante avec la profondeur puis le numéro de page"""
+    depth_priority, page = priority
+    return {'url': normalize_url(url), 'kind': LISTING, 'depth': depth,
+            'priority': 1 + depth_priority * DEPTH_PRIORITY_SPAN + min(page, DEPTH_PRIORITY_SPAN - 1)}
+
+
+def article_item(listing: Article) -> Dict:
+    """Page d'article à compléter : passe avant les pages de liste (priorité 0)"""
+    return {'url': normalize_url(listing.url), 'kind': ARTICLE, 'priority': 0, 'payload': listing.to_dict()}
+
+
+def seed(queue: WorkQueue, base_url: str, reset: bool = False) -> int:
+    """Amorce le crawl avec la page d'accueil (reset : vide d'abord la file)"""
+    queue.ensure_indexes()
+    if reset:
+        queue.clear()
+    return queue.enqueue([listing_item(base_url, 0, (0, 1))])
+
+
+class CrawlWorker:
+    """
+    Boucle réserver → traiter → valider, jusqu'à ce que la file soit épuisée.
+    Jusqu'à scraper.max_workers éléments sont réservés à la fois : leurs pages
+    d'articles sont téléchargées en parallèle et leurs réservations prolongées
+    tant que le téléchargement dure.
+    """
+    
+    def __init__(self, scraper: BlogScraper, service: MongoService, queue: WorkQueue,
+                 max_pages: int = 50, max_depth: int = 1, follow_categories: bool = True,
+                 incremental: bool = False, batch_size: int = 50, flush_interval: float = 5.0,
+                 poll_interval: float = POLL_INTERVAL, owner: Optional[str] = None):
+        """
+        Args:
+            scraper: Scraper (son rate_limiter devrait être un MongoRateLimiter partagé) ;
+                max_workers fixe le nombre d'éléments réservés et traités à la fois
+            service: Service MongoDB où sont sauvegardés les articles
+            queue: File partagée par tous les workers
+            max_pages: Pages de liste planifiées au total (tous workers, approximatif)
+            max_depth: Profondeur de catégories (la pagination ne compte pas)
+            follow_categories: Suit les liens de catégories/tags
+            incremental: N'ajoute que les articles nouveaux ou modifiés
+            batch_size: Articles par écriture MongoDB
+            flush_interval: Délai maximal (s) entre deux écritures
+            poll_interval: Attente (s) quand rien n'est disponible mais que d'autres travaillent
+            owner: Identifiant du worker (hôte:pid:jeton par défaut)
+        """
+        self.scraper = scraper
+        self.service = service
+        self.queue = queue
+        self.crawler = BlogCrawler(scraper, max_pages=max_pages, max_depth=max_depth,
+                                   follow_categories=follow_categories)
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.incremental = incremental
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.poll_interval = poll_interval
+        self.owner = owner or default_owner()
+        self.threads = scraper.max_workers
+        # Réservations prolongées à chaque tiers du délai de visibilité
+        self.renew_interval = queue.visibility_timeout / 3
+        self.stop_event = threading.Event()
+        
+        # Articles complétés en attente d'écriture, avec leur élément de file
+        self._buffer: List[Tuple[Dict, Article]] = []
+        self._last_flush = time.monotonic()
+        self.stats = {'listings': 0, 'articles': 0, 'saved': 0, 'failed': 0}
+    
+    def stop(self):
+        self.stop_event.set()
+    
+    def run(self, max_items: Optional[int] = None) -> Dict[str, int]:
+        """
+        Traite des éléments jusqu'à épuisement de la file (ou stop(), ou max_items)
+        
+        Returns:
+            Compteurs du worker (listings, articles, saved, failed)
+        """
+        logger.info(f"🐝 Worker {self.owner} démarré ({self.threads} téléchargements simultanés)")
+        processed = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                while not self.stop_event.is_set():
+                    limit = self.threads if max_items is None else min(self.threads, max_items - processed)
+                    if limit <= 0:
+                        break
+                    items = self._claim(limit)
+                    if not items:
+                        # Rien de prêt : valider ce qui attend, puis arrêter si plus personne ne travaille
+                        self._flush()
+                        if self.queue.drained():
+                            break
+                        self.stop_event.wait(self.poll_interval)
+                        continue
+                    
+                    processed += len(items)
+                    self._process(items, executor)
+                    
+                    if (len(self._buffer) >= self.batch_size
+                            or time.monotonic() - self._last_flush >= self.flush_interval):
+                        self._flush()
+        finally:
+            self._flush()
+        logger.info(f"🎯 Worker {self.owner} terminé: {self.stats}")
+        return self.stats
+    
+    def _claim(self, limit: int) -> List[Dict]:
+        """Réserve jusqu'à limit éléments (moins si la file n'a pas assez d'éléments prêts)"""
+        items = []
+        while len(items) < limit:
+            item = self.queue.claim(self.owner)
+            if item is None:
+                break
+            items.append(item)
+        return items
+    
+    def _process(self, items: List[Dict], executor: ThreadPoolExecutor):
+        """Pages d'articles téléchargées en parallèle pendant le traitement des pages de liste"""
+        futures = {executor.submit(self._fetch_article, item): item for item in items if item['kind'] == ARTICLE}
+        
+        for item in items:
+            if item['kind'] == LISTING:
+                try:
+                    self._process_listing(item)
+                    self.queue.complete([item], self.owner)
+                except Exception as e:
+                    self._fail(item, e)
+        
+        pending = set(futures)
+        renewed_at = time.monotonic()
+        while pending:
+            timeout = max(0.0, renewed_at + self.renew_interval - time.monotonic())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = futures[future]
+                try:
+                    article = future.result()
+                except Exception as e:
+                    self._fail(item, e)
+                    continue
+                # Élément validé seulement après la sauvegarde de son article (_flush)
+                self._buffer.append((item, article))
+                self.stats['articles'] += 1
+            if pending and time.monotonic() - renewed_at >= self.renew_interval:
+                self._renew([futures[future] for future in pending])
+                renewed_at = time.monotonic()
+    
+    def _fetch_article(self, item: Dict) -> Article:
+        article = Article.from_dict(item['payload'])
+        article.excerpt = self.scraper.fetch_excerpt(article.url)
+        return article
+    
+    def _renew(self, items: List[Dict]):
+        """Prolonge les réservations des téléchargements encore en cours"""
+        for item in items:
+            if not self.queue.extend(item, self.owner):
+                # Repris par un autre worker : la sauvegarde (upsert) reste sans effet de bord
+                logger.warning(f"⚠️ {item['_id']}: réservation perdue pendant le téléchargement")
+    
+    def _fail(self, item: Dict, error: Exception):
+        self.stats['failed'] += 1
+        logger.warning(f"⚠️ {item['_id']} (tentative {item.get('attempts')}): {error}")
+        self.queue.fail(item, self.owner, str(error))
+    
+    def _process_listing(self, item: Dict):
+        """Planifie les pages de liste liées et les articles de la page"""
+        url, depth = item['url'], item.get('depth', 0)
+        soup = self.scraper.fetch_listing(url)
+        
+        links = [
+            listing_item(link, link_depth, priority)
+            for link, link_depth, priority in self.crawler.discover_links(soup, url, depth)
+            if link_depth <= self.max_depth
+        ]
+        if links:
+            # Budget global de pages : compté dans la file, dépassable de quelques pages en concurrence
+            budget = self.max_pages - self.queue.count(kind=LISTING)
+            links = links[:max(0, budget)]
+        
+        listings = [listing for listing in self.scraper.extract_listings(soup) if listing.url]
+        del soup
+        if self.incremental and listings:
+            listings = self.scraper.skip_unchanged(listings, self.service.get_known_articles)
+        
+        added = self.queue.enqueue(links + [article_item(listing) for listing in listings])
+        self.stats['listings'] += 1
+        logger.info(f"📚 {url}: {len(listings)} articles, {len(links)} liens, {added} nouveaux éléments")
+    
+    def _flush(self):
+        """Sauvegarde les articles en attente puis valide leurs éléments (reprise sinon)"""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, []
+        items = [item for item, _ in buffer]
+        
+        try:
+            saved = self.service.save_articles([article for _, article in buffer])
+        except Exception as e:
+            logger.error(f"❌ Sauvegarde de {len(buffer)} articles impossible: {e}")
+            saved = False
+        
+        if saved:
+            self.queue.complete(items, self.owner)
+            self.stats['saved'] += len(items)
+        else:
+            self.stats['failed'] += len(items)
+            for item in items:
+                self.queue.fail(item, self.owner, "sauvegarde MongoDB en échec")
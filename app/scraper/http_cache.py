@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+🗃️ CACHE HTTP CONDITIONNEL - ETAG / LAST-MODIFIED
+Cache disque LRU branché sous la session requests
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+INDEX_FILE = "index.json"
+# Index réécrit toutes les N réponses stockées ou toutes les N secondes (et à la fermeture)
+FLUSH_EVERY = int(os.getenv('HTTP_CACHE_FLUSH_EVERY', 100))
+FLUSH_INTERVAL = float(os.getenv('HTTP_CACHE_FLUSH_INTERVAL', 30))
+
+# En-têtes conservés avec le corps de la réponse
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+# En-têtes de requête conditionnelle posés par CachingAdapter
+CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+# Caches ouverts, index écrits à la sortie du processus (références faibles : un cache
+# abandonné n'est pas retenu jusqu'à la sortie)
+_open_caches: "weakref.WeakSet[HTTPCache]" = weakref.WeakSet()
+
+
+def _flush_open_caches():
+    for cache in list(_open_caches):
+        cache.flush()
+
+
+atexit.register(_flush_open_caches)
+
+
+class HTTPCache:
+    """Cache disque des réponses GET, borné en taille avec éviction LRU"""
+    
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 flush_every: int = FLUSH_EVERY, flush_interval: float = FLUSH_INTERVAL):
+        """
+        Args:
+            directory: Répertoire des corps de réponse et de l'index
+            max_bytes: Taille maximale des corps en cache (éviction LRU au-delà)
+            flush_every: Réponses stockées entre deux écritures de l'index
+            flush_interval: Secondes maximum entre deux écritures de l'index
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        # Une seule écriture de l'index à la fois, hors du verrou des entrées
+        self._flush_lock = threading.Lock()
+        self._dirty = False
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.total_bytes = 0
+        
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+        _open_caches.add(self)
+    
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, INDEX_FILE)
+    
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+    
+    def _load(self):
+        """Chargement de l'index (ordre LRU : du plus ancien au plus récent)"""
+        entries = []
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Index du cache HTTP illisible, cache réinitialisé: {e}")
+        
+        for url, entry in entries:
+            try:
+                size = os.path.getsize(self._body_path(entry['key']))
+            except OSError:
+                continue
+            if size != entry['size']:
+                # Corps remplacé après la dernière écriture de l'index : validateurs périmés
+                continue
+            self._entries[url] = entry
+            self.total_bytes += entry['size']
+        self._remove_orphans()
+        
+        # La limite a pu être réduite depuis la dernière exécution
+        if self.total_bytes > self.max_bytes:
+            self._evict()
+            self._dirty = True
+    
+    def _remove_orphans(self):
+        """Corps absents de l'index (arrêt brutal entre deux écritures) : hors quota, supprimés"""
+        known = {entry['key'] for entry in self._entries.values()}
+        for name in os.listdir(self.directory):
+            if name.endswith('.tmp') or (len(name) == 64 and name not in known):
+                try:
+                    os.remove(self._body_path(name))
+                except OSError:
+                    pass
+    
+    def flush(self):
+        """
+        Écriture atomique de l'index. Seule la sérialisation se fait sous le
+        verrou des entrées : les téléchargements ne bloquent pas sur le disque.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                index = json.dumps(list(self._entries.items()))
+                self._dirty = False
+                self._pending = 0
+                self._last_flush = time.monotonic()
+            
+            tmp_path = self._index_path() + '.tmp'
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(index)
+                os.replace(tmp_path, self._index_path())
+            except OSError as e:
+                logger.warning(f"⚠️ Index du cache HTTP non écrit: {e}")
+                with self._lock:
+                    self._dirty = True
+    
+    def close(self):
+        """Écrit l'index en attente (fait aussi à la sortie du processus pour les caches non fermés)"""
+        _open_caches.discard(self)
+        self.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Entrée du cache pour une URL (marquée comme récemment utilisée)"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                self._dirty = True
+            return entry
+    
+    def read_body(self, entry: Dict[str, Any]) -> Optional[bytes]:
+        try:
+            with open(self._body_path(entry['key']), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def store(self, url: str, response: Response):
+        """Mémorise une réponse 200 munie d'un validateur (ETag ou Last-Modified)"""
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        # Corps écrit hors verrou dans un fichier propre au thread, mis en place sous le verrou
+        tmp_path = f"{self._body_path(key)}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        
+        with self._lock:
+            os.replace(tmp_path, self._body_path(key))
+            
+            previous = self._entries.pop(url, None)
+            if previous:
+                self.total_bytes -= previous['size']
+            
+            self._entries[url] = {
+                'key': key,
+                'size': len(body),
+                'etag': etag,
+                'last_modified': last_modified,
+                'headers': {h: response.headers[h] for h in STORED_HEADERS if h in response.headers},
+                'annotations': {}
+            }
+            self.total_bytes += len(body)
+            self._evict()
+            self._dirty = True
+            # Index sur disque en retard d'au plus flush_every réponses : après un arrêt
+            # brutal, ces pages sont simplement retéléchargées
+            self._pending += 1
+            due = (self._pending >= self.flush_every
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        
+        if due:
+            self.flush()
+    
+    def discard(self, url: str):
+        """Retire l'entrée d'une URL et son corps (corps illisible, version inconnue)"""
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry is None:
+                return
+            self.total_bytes -= entry['size']
+            self._dirty = True
+            try:
+                os.remove(self._body_path(entry['key']))
+            except OSError:
+                pass
+    
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self._entries:
+            url, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry['size']
+            try:
+                os.remove(self._body_path(entry['key']))
+            except OSError:
+                pass
+            logger.debug(f"🗑️ Cache HTTP: éviction de {url}")
+    
+    def annotate(self, url: str, name: str, value: Any):
+        """
+        Attache une donnée dérivée (ex: extrait) à la version en cache.
+        
+        L'annotation est perdue dès que le corps change, ce qui évite de
+        re-parser une page inchangée sans jamais servir une donnée périmée.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                entry['annotations'][name] = value
+                self._dirty = True
+    
+    def annotation(self, url: str, name: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(url)
+            return entry['annotations'].get(name) if entry else None
+
+
+class CachingAdapter(HTTPAdapter):
+    """Adapter requests ajoutant les requêtes conditionnelles et le service des 304 depuis le cache"""
+    
+    def __init__(self, cache: HTTPCache, **kwargs):
+        self.cache = cache
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+        
+        entry = self.cache.get(request.url)
+        if entry is not None:
+            if entry.get('etag'):
+                request.headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request.headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = super().send(request, **kwargs)
+        
+        if response.status_code == 304 and entry is not None:
+            cached = self._build_cached_response(request, response, entry)
+            if cached is not None:
+                return cached
+            # 304 sans corps en cache : entrée retirée, page redemandée sans condition
+            logger.warning(f"⚠️ Cache HTTP: corps de {request.url} illisible, page redemandée")
+            response.close()
+            self.cache.discard(request.url)
+            for header in CONDITIONAL_HEADERS:
+                request.headers.pop(header, None)
+            response = super().send(request, **kwargs)
+        
+        response.from_cache = False
+        if response.status_code == 200:
+            self.cache.store(request.url, response)
+        return response
+    
+    def _build_cached_response(self, request, not_modified: Response, entry: Dict[str, Any]) -> Optional[Response]:
+        body = self.cache.read_body(entry)
+        if body is None:
+            return None
+        
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        for header in ('Date', 'ETag', 'Last-Modified'):
+            if header in not_modified.headers:
+                response.headers[header] = not_modified.headers[header]
+        response._content = body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        not_modified.close()
+        return response
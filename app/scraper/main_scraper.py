@@ -5,94 +5,147 @@ Scraper optimisé pour 15 articles avec structure HTML actuelle
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from urllib.parse import urlsplit
+import threading
 import time
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Iterator, List, Dict, Optional
 import logging
 
+from app.models.article import DEFAULT_CATEGORY, DEFAULT_DATE, Article
+from app.monitoring import metrics
+from app.monitoring.http_timing import instrument_adapter
+from app.monitoring.pipeline import (
+    PARSE_DATE_SECONDS, PARSE_SECONDS, SELECTOR_HITS, SELECTOR_MISSES, SELECTOR_SECONDS, record_http_response
+)
+from app.scraper.http_cache import CachingAdapter, HTTPCache
+from app.scraper.parsing import ARTICLE_PAGE_STRAINER, LISTING_STRAINER, make_soup, resolve_parser
+from app.scraper.rate_limiter import HostRateLimiter
+from app.scraper.selector_engine import SelectorEngine
+from app.utils.dates import format_date, parse_date
+
+if TYPE_CHECKING:
+    from app.scraper.parse_pool import ParsePool
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class BlogScraper:
-    """Scraper pour blogdumoderateur.com - 15 articles maximum"""
-    
-    def __init__(self):
-        self.base_url = "https://www.blogdumoderateur.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+BASE_URL = "https://www.blogdumoderateur.com"
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Champs de la page d'accueil comparés en mode incrémental
+CHANGE_FIELDS = ('url', 'title', 'date')
+
+# Sélecteurs des champs d'un article de la page d'accueil
+LISTING_SELECTORS = [
+    ('title', '.entry-header a h3.entry-title'),
+    ('url', '.entry-header a'),
+    ('date', 'time.entry-date'),
+    ('category', '.favtag'),
+    ('image', '.post-thumbnail img')
+]
+
+# Sélecteurs de l'extrait, par ordre de priorité
+EXCERPT_SELECTORS = [
+    ('entry_content', '.entry-content p:first-of-type'),
+    ('post_content', '.post-content p:first-of-type'),
+    ('content', '.content p:first-of-type'),
+    ('article', 'article p:first-of-type'),
+    ('entry_excerpt', '.entry-excerpt'),
+    ('meta', 'meta[name="description"]')
+]
+
+class ArticleExtractor:
+    """Extraction des articles à partir des pages parsées (indépendante du transport HTTP)"""
     
-    def scrape_articles(self, max_articles: int = 15) -> List[Dict]:
+    def __init__(self, base_url: str = BASE_URL, parser: Optional[str] = None, partial_parsing: bool = True):
         """
-        Scrape les articles du blog
-        
         Args:
-            max_articles: Nombre maximum d'articles (15 par défaut)
-            
-        Returns:
-            Liste des articles scrapés
+            base_url: URL de la page d'accueil à scraper
+            parser: Backend BeautifulSoup ('lxml' par défaut, 'html.parser', 'html5lib')
+            partial_parsing: Ne construit que les sous-arbres utiles (SoupStrainer)
         """
-        logger.info(f"🚀 Début du scraping - Maximum {max_articles} articles")
+        self.base_url = base_url
+        self.parser = resolve_parser(parser)
+        self.partial_parsing = partial_parsing
         
-        try:
-            # Requête principale
-            response = self.session.get(self.base_url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Sélecteur pour les articles basé sur la structure fournie
+        # Sélecteurs compilés une seule fois, évalués en un parcours
+        self._listing_engine = SelectorEngine(LISTING_SELECTORS)
+        self._excerpt_engine = SelectorEngine(EXCERPT_SELECTORS)
+    
+    def _parse(self, content: bytes, strainer) -> BeautifulSoup:
+        page = 'listing' if strainer is LISTING_STRAINER else 'article'
+        with PARSE_SECONDS.time(page=page):
+            return make_soup(content, self.parser, strainer if self.partial_parsing else None)
+    
+    def extract_listings(self, soup: BeautifulSoup, max_articles: Optional[int] = None) -> List[Article]:
+        """Articles d'une page de liste, sans leur extrait"""
+        
+        # Sélecteur pour les articles basé sur la structure fournie
+        with SELECTOR_SECONDS.time(selector='articles'):
             articles_elements = soup.select('article[id^="post-"]')
-            
-            if not articles_elements:
-                logger.warning("⚠️ Aucun article trouvé avec le sélecteur principal")
-                return []
-            
-            logger.info(f"📄 {len(articles_elements)} articles trouvés")
-            
-            articles = []
-            
-            for i, article_elem in enumerate(articles_elements[:max_articles], 1):
-                try:
-                    article_data = self._extract_article_data(article_elem, i)
-                    if article_data:
-                        articles.append(article_data)
-                        logger.info(f"✅ Article {i}/15: {article_data['title'][:50]}...")
-                    
-                    # Pause courtoise
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"❌ Erreur article {i}: {e}")
-                    continue
-            
-            logger.info(f"🎯 Scraping terminé: {len(articles)}/15 articles récupérés")
-            return articles
-            
-        except Exception as e:
-            logger.error(f"❌ Erreur de scraping: {e}")
+        
+        if not articles_elements:
+            logger.warning("⚠️ Aucun article trouvé avec le sélecteur principal")
             return []
+        
+        logger.info(f"📄 {len(articles_elements)} articles trouvés")
+        
+        # Un seul instant de scraping pour toute la page
+        scraped_at = datetime.now()
+        listings = []
+        for i, article_elem in enumerate(articles_elements[:max_articles], 1):
+            listing = self._extract_listing_data(article_elem, i, scraped_at)
+            if listing:
+                listings.append(listing)
+        return listings
     
-    def _extract_article_data(self, article_elem, index: int) -> Optional[Dict]:
-        """Extraction des données d'un article"""
+    def skip_unchanged(self, listings: List[Article],
+                        known_lookup: Callable[[List[str]], Dict[str, Dict]]) -> List[Article]:
+        """Ne garde que les articles nouveaux ou modifiés depuis le dernier scraping"""
+        
+        known = known_lookup([listing.id for listing in listings])
+        
+        changed = [
+            listing for listing in listings
+            if listing.id not in known
+            or any(known[listing.id].get(field) != getattr(listing, field) for field in CHANGE_FIELDS)
+        ]
+        
+        logger.info(f"♻️ Mode incrémental: {len(listings) - len(changed)} articles inchangés ignorés, "
+                    f"{len(changed)} à récupérer")
+        return changed
+    
+    def _extract_listing_data(self, article_elem, index: int,
+                              scraped_at: Optional[datetime] = None) -> Optional[Article]:
+        """Extraction des données visibles sur la page d'accueil (sans l'extrait)"""
         
         try:
             # ID de l'article
             article_id = article_elem.get('id', f'post-{index}')
             
+            with SELECTOR_SECONDS.time(selector='listing_fields'):
+                fields = self._listing_engine.first_matches(article_elem)
+            if metrics.enabled():
+                for name in self._listing_engine.names:
+                    if name not in fields:
+                        SELECTOR_MISSES.inc(selector=name)
+            
             # Titre dans .entry-header a h3.entry-title
-            title_elem = article_elem.select_one('.entry-header a h3.entry-title')
+            title_elem = fields.get('title')
             title = title_elem.get_text(strip=True) if title_elem else "Titre non trouvé"
             
             # URL dans .entry-header a
-            url_elem = article_elem.select_one('.entry-header a')
+            url_elem = fields.get('url')
             url = url_elem.get('href') if url_elem else ""
             
             # Date dans time.entry-date
-            date_elem = article_elem.select_one('time.entry-date')
+            date_elem = fields.get('date')
             date_str = ""
             if date_elem:
                 # Priorité au datetime
@@ -100,38 +153,259 @@ class BlogScraper:
                 if not date_str:
                     date_str = date_elem.get_text(strip=True)
             
-            # Formatage de la date
-            formatted_date = self._format_date(date_str)
-            
-            # Extraction de l'extrait depuis la page de l'article
-            excerpt = self._get_excerpt_from_article(url)
+            # Date de publication avec fuseau (texte source conservé dans 'date')
+            published_at = self._parse_date(date_str)
             
             # Catégorie dans .favtag
-            category_elem = article_elem.select_one('.favtag')
-            category = category_elem.get_text(strip=True) if category_elem else "Non classé"
+            category_elem = fields.get('category')
+            category = category_elem.get_text(strip=True) if category_elem else DEFAULT_CATEGORY
             
             # Image
-            img_elem = article_elem.select_one('.post-thumbnail img')
+            img_elem = fields.get('image')
             image_url = ""
             if img_elem:
                 image_url = img_elem.get('src') or img_elem.get('data-lazy-src', '')
             
-            return {
-                'id': article_id,
-                'title': title,
-                'url': url,
-                'date': formatted_date,
-                'excerpt': excerpt,
-                'category': category,
-                'image_url': image_url,
-                'author': "Blog du Modérateur",  # Par défaut
-                'scraped_at': datetime.now().strftime("%d/%m/%Y à %H:%M")
-            }
+            # Extrait complété par _complete_article, auteur par défaut
+            return Article(
+                id=article_id,
+                title=title,
+                url=url,
+                date=date_str or DEFAULT_DATE,
+                category=category,
+                image_url=image_url,
+                scraped_at=scraped_at,
+                published_at=published_at
+            )
             
         except Exception as e:
             logger.error(f"❌ Erreur extraction article: {e}")
             return None
     
+    def _extract_excerpt(self, soup) -> str:
+        """Extrait de l'article à partir de la page parsée"""
+        
+        accept = self._excerpt_candidate
+        if metrics.enabled():
+            def accept(name, elem):
+                value = self._excerpt_candidate(name, elem)
+                if value:
+                    SELECTOR_HITS.inc(selector=name)
+                return value
+        
+        # Premier sélecteur (par priorité) donnant un extrait exploitable
+        with SELECTOR_SECONDS.time(selector='excerpt'):
+            excerpt = self._excerpt_engine.first_accepted(soup, accept)
+        if excerpt is None:
+            SELECTOR_MISSES.inc(selector='excerpt')
+        return excerpt or "Description disponible sur la page de l'article."
+    
+    @staticmethod
+    def _excerpt_candidate(name: str, elem) -> Optional[str]:
+        """Extrait tiré d'un élément, None s'il n'est pas exploitable"""
+        
+        if name == 'meta':
+            # Cas spécial pour meta description
+            content = elem.get('content')
+            return content[:250] + "..." if content else None
+        
+        text = elem.get_text(strip=True)
+        if len(text) > 50:  # Assez de contenu
+            return text[:250] + "..." if len(text) > 250 else text
+        return None
+    
+    def _parse_date(self, date_str: str) -> Optional[datetime]:
+        """Date de publication avec fuseau (ISO 8601 ou français), None si illisible"""
+        
+        with PARSE_DATE_SECONDS.time():
+            return parse_date(date_str)
+
+class BlogScraper(ArticleExtractor):
+    """Scraper pour blogdumoderateur.com - 15 articles maximum"""
+    
+    def __init__(self, base_url: str = BASE_URL, max_workers: int = 1, per_host_limit: int = 4,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 http_cache: Optional[HTTPCache] = None,
+                 parser: Optional[str] = None, partial_parsing: bool = True,
+                 parse_pool: Optional["ParsePool"] = None):
+        """
+        Args:
+            base_url: URL de la page d'accueil à scraper
+            max_workers: Nombre de pages d'articles récupérées en parallèle (1 = mode séquentiel)
+            per_host_limit: Nombre maximum de requêtes simultanées vers un même hôte
+            rate_limiter: Politique de débit par hôte (2 requêtes/s par défaut)
+            http_cache: Cache disque conditionnel (ETag/Last-Modified), désactivé par défaut
+            parser: Backend BeautifulSoup ('lxml' par défaut, 'html.parser', 'html5lib')
+            partial_parsing: Ne construit que les sous-arbres utiles (SoupStrainer)
+            parse_pool: Parsing des pages d'articles dans des processus (tous les cœurs) ;
+                à combiner avec max_workers > 1 pour que les téléchargements continuent
+        """
+        super().__init__(base_url, parser, partial_parsing)
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.http_cache = http_cache
+        self.parse_pool = parse_pool
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT
+        })
+        
+        if self.max_workers > 1 or http_cache is not None:
+            # Pool de connexions dimensionné pour les workers
+            pool = {'pool_connections': 4, 'pool_maxsize': self.max_workers}
+            if http_cache is not None:
+                adapter = CachingAdapter(http_cache, **pool)
+            else:
+                adapter = HTTPAdapter(**pool)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+        # Phases DNS/TCP/TLS des nouvelles connexions (mesurées si les métriques sont actives)
+        for adapter in set(self.session.adapters.values()):
+            instrument_adapter(adapter)
+        
+        # Budget de politesse : un sémaphore par hôte
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+    
+    def scrape_articles(self, max_articles: int = 15,
+                        known_lookup: Optional[Callable[[List[str]], Dict[str, Dict]]] = None) -> List[Article]:
+        """
+        Scrape les articles du blog
+        
+        Args:
+            max_articles: Nombre maximum d'articles (15 par défaut)
+            known_lookup: Mode incrémental - reçoit les IDs de la page et retourne
+                les articles déjà connus ({id: article}); ceux qui n'ont pas changé
+                ne sont ni re-téléchargés ni retournés
+            
+        Returns:
+            Liste des articles scrapés
+        """
+        return list(self.iter_articles(max_articles, known_lookup))
+    
+    def iter_articles(self, max_articles: int = 15,
+                      known_lookup: Optional[Callable[[List[str]], Dict[str, Dict]]] = None) -> Iterator[Article]:
+        """
+        Version streaming de scrape_articles : chaque article est produit dès
+        que son extrait est récupéré, dans l'ordre de la page d'accueil
+        """
+        logger.info(f"🚀 Début du scraping - Maximum {max_articles} articles")
+        
+        try:
+            # Requête principale
+            soup = self.fetch_listing(self.base_url)
+            
+            # Données disponibles sur la page d'accueil (sans requête supplémentaire)
+            listings = self.extract_listings(soup, max_articles)
+            del soup
+            if not listings:
+                return
+            
+            if known_lookup is not None:
+                listings = self.skip_unchanged(listings, known_lookup)
+            
+        except Exception as e:
+            logger.error(f"❌ Erreur de scraping: {e}")
+            return
+        
+        count = 0
+        for article in self.iter_completed(listings):
+            count += 1
+            yield article
+        
+        logger.info(f"🎯 Scraping terminé: {count}/{len(listings)} articles récupérés")
+    
+    def fetch_listing(self, url: str) -> BeautifulSoup:
+        """Télécharge et parse une page de liste (accueil, pagination, catégorie)"""
+        
+        response = self._get(url, timeout=10)
+        return self._parse(response.content, LISTING_STRAINER)
+    
+    def complete_articles(self, listings: List[Article]) -> List[Article]:
+        """Récupère l'extrait de chaque article (en parallèle si max_workers > 1)"""
+        return list(self.iter_completed(listings))
+    
+    def iter_completed(self, listings: List[Article]) -> Iterator[Article]:
+        """Produit chaque article complété, dans l'ordre des listings"""
+        
+        if self.max_workers > 1:
+            yield from self._scrape_concurrently(listings)
+            return
+        
+        for i, listing in enumerate(listings, 1):
+            try:
+                article_data = self._complete_article(listing)
+                logger.info(f"✅ Article {i}/{len(listings)}: {article_data.title[:50]}...")
+                
+            except Exception as e:
+                logger.error(f"❌ Erreur article {i}: {e}")
+                continue
+            
+            yield article_data
+    
+    def _scrape_concurrently(self, listings: List[Article]) -> Iterator[Article]:
+        """Extraction parallèle des articles, produits dans l'ordre de la page"""
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._complete_article, listing) for listing in listings]
+            
+            # Parcours dans l'ordre de soumission pour conserver l'ordre du blog
+            for i, future in enumerate(futures, 1):
+                try:
+                    article_data = future.result()
+                    logger.info(f"✅ Article {i}/{len(futures)}: {article_data.title[:50]}...")
+                except Exception as e:
+                    logger.error(f"❌ Erreur article {i}: {e}")
+                    continue
+                
+                yield article_data
+    
+    @contextmanager
+    def _host_slot(self, url: str):
+        """Limite le nombre de requêtes simultanées par hôte"""
+        
+        host = urlsplit(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_slots[host] = slot
+        
+        with slot:
+            yield
+    
+    def _get(self, url: str, timeout: float) -> requests.Response:
+        """Requête GET respectant le budget de politesse par hôte"""
+        
+        # Pause courtoise : débit limité par le token bucket de l'hôte
+        self.rate_limiter.acquire(url)
+        
+        with self._host_slot(url):
+            started = time.perf_counter()
+            response = self.session.get(url, timeout=timeout)
+            total = time.perf_counter() - started
+        
+        # elapsed : envoi -> en-têtes reçus ; le reste est la lecture du corps
+        ttfb = response.elapsed.total_seconds()
+        status = 'cached' if getattr(response, 'from_cache', False) else response.status_code
+        record_http_response(status, len(response.content), ttfb, max(0.0, total - ttfb))
+        response.raise_for_status()
+        return response
+    
+    def _extract_article_data(self, article_elem, index: int) -> Optional[Article]:
+        """Extraction des données d'un article"""
+        
+        listing = self._extract_listing_data(article_elem, index)
+        return self._complete_article(listing) if listing else None
+    
+    def _complete_article(self, listing: Article) -> Article:
+        """Complète un article de la page d'accueil avec l'extrait de sa page"""
+        
+        # Extraction de l'extrait depuis la page de l'article
+        listing.excerpt = self._get_excerpt_from_article(listing.url)
+        return listing
+    
     def _get_excerpt_from_article(self, url: str) -> str:
         """Récupère l'extrait depuis la page de l'article"""
         
@@ -139,62 +413,34 @@ class BlogScraper:
             return "Pas de description disponible."
         
         try:
-            # Requête vers la page de l'article
-            response = self.session.get(url, timeout=8)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Essai de différents sélecteurs pour l'extrait
-            selectors = [
-                '.entry-content p:first-of-type',
-                '.post-content p:first-of-type', 
-                '.content p:first-of-type',
-                'article p:first-of-type',
-                '.entry-excerpt',
-                'meta[name="description"]'
-            ]
-            
-            for selector in selectors:
-                if selector.startswith('meta'):
-                    # Cas spécial pour meta description
-                    meta_elem = soup.select_one(selector)
-                    if meta_elem and meta_elem.get('content'):
-                        return meta_elem.get('content')[:250] + "..."
-                else:
-                    excerpt_elem = soup.select_one(selector)
-                    if excerpt_elem:
-                        text = excerpt_elem.get_text(strip=True)
-                        if len(text) > 50:  # Assez de contenu
-                            return text[:250] + "..." if len(text) > 250 else text
-            
-            return "Description disponible sur la page de l'article."
+            return self.fetch_excerpt(url)
             
         except Exception as e:
             logger.warning(f"⚠️ Impossible de récupérer l'extrait depuis {url}: {e}")
             return "Consultez l'article pour plus de détails."
     
-    def _format_date(self, date_str: str) -> str:
-        """Formatage lisible des dates"""
+    def fetch_excerpt(self, url: str) -> str:
+        """Extrait de la page d'un article (erreurs HTTP propagées, pour les reprises)"""
         
-        if not date_str:
-            return "Date inconnue"
+        # Requête vers la page de l'article
+        response = self._get(url, timeout=8)
         
-        try:
-            # Format ISO avec timezone (2025-07-10T10:58:00+02:00)
-            if 'T' in date_str and '+' in date_str:
-                dt = datetime.fromisoformat(date_str.replace('+02:00', ''))
-                return dt.strftime("%d/%m/%Y à %H:%M")
-            
-            # Format français direct (10 juillet 2025)
-            if 'juillet' in date_str or 'janvier' in date_str:
-                return date_str
-            
-            # Autres formats
-            return date_str
-            
-        except Exception:
-            return date_str
+        # Page inchangée (304) : extrait déjà calculé, pas de parsing
+        if getattr(response, 'from_cache', False):
+            excerpt = self.http_cache.annotation(url, 'excerpt')
+            if excerpt:
+                return excerpt
+        
+        if self.parse_pool is not None:
+            # Parsing hors du GIL : ce thread attend pendant que les autres téléchargent
+            excerpt = self.parse_pool.extract_excerpt(response.content)
+        else:
+            soup = self._parse(response.content, ARTICLE_PAGE_STRAINER)
+            excerpt = self._extract_excerpt(soup)
+        
+        if self.http_cache is not None:
+            self.http_cache.annotate(url, 'excerpt', excerpt)
+        return excerpt
 
 def main():
     """Test du scraper"""
@@ -207,9 +453,9 @@ def main():
     if articles:
         print(f"\n📖 PREMIERS ARTICLES:")
         for i, article in enumerate(articles[:3], 1):
-            print(f"{i}. {article['title']}")
-            print(f"   📅 {article['date']}")
-            print(f"   🏷️ {article['category']}")
+            print(f"{i}. {article.title}")
+            print(f"   📅 {format_date(article.published_at, article.date)}")
+            print(f"   🏷️ {article.category}")
             print()
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+🧮 POOL DE PARSING MULTI-PROCESSUS
+Parsing BeautifulSoup + extraction (liés au GIL) déportés dans des processus :
+le HTML brut transite par des segments de mémoire partagée réutilisés, les
+workers renvoient des enregistrements compacts (Article, extrait)
+"""
+
+import logging
+import os
+import queue
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from app.models.article import Article
+from app.scraper.main_scraper import BASE_URL, ArticleExtractor
+from app.scraper.parsing import ARTICLE_PAGE_STRAINER, LISTING_STRAINER
+
+logger = logging.getLogger(__name__)
+
+# Segments de mémoire partagée : taille de chacun (au-delà, page transmise par pickle)
+SLOT_SIZE = int(os.getenv('PARSE_POOL_SLOT_BYTES', 2 * 1024 * 1024))
+# Pages en vol par processus : une parsée pendant que la suivante est copiée
+IN_FLIGHT_PER_PROCESS = 2
+
+# Page : octets bruts, ou (nom du segment, taille) si elle a été copiée en mémoire partagée
+PageRef = Union[bytes, Tuple[str, int]]
+
+# État propre à chaque processus du pool
+_extractor = None
+_segments: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _init_worker(base_url: str, parser: Optional[str], partial_parsing: bool):
+    global _extractor
+    _extractor = ArticleExtractor(base_url, parser, partial_parsing)
+    logging.getLogger('app').setLevel(logging.WARNING)
+
+
+def _read(page: PageRef) -> bytes:
+    if isinstance(page, bytes):
+        return page
+    name, size = page
+    segment = _segments.get(name)
+    if segment is None:
+        # Rattaché une fois par processus ; le parent reste seul responsable de sa destruction
+        segment = _segments[name] = shared_memory.SharedMemory(name=name)
+    return bytes(segment.buf[:size])
+
+
+def _listings_task(page: PageRef, max_articles: Optional[int]) -> List[Article]:
+    soup = _extractor._parse(_read(page), LISTING_STRAINER)
+    return _extractor.extract_listings(soup, max_articles)
+
+
+def _excerpt_task(page: PageRef) -> str:
+    soup = _extractor._parse(_read(page), ARTICLE_PAGE_STRAINER)
+    return _extractor._extract_excerpt(soup)
+
+
+class ParsePool:
+    """Extraction des pages de liste et d'articles sur plusieurs cœurs"""
+    
+    def __init__(self, processes: Optional[int] = None, base_url: str = BASE_URL,
+                 parser: Optional[str] = None, partial_parsing: bool = True,
+                 use_shared_memory: bool = True, slot_size: int = SLOT_SIZE):
+        """
+        Args:
+            processes: Nombre de processus (un par cœur par défaut)
+            base_url: URL de la page d'accueil (transmise à l'extracteur de chaque worker)
+            parser: Backend BeautifulSoup ('lxml' par défaut, 'html.parser', 'html5lib')
+            partial_parsing: Ne construit que les sous-arbres utiles (SoupStrainer)
+            use_shared_memory: Copie les pages en mémoire partagée plutôt que de les sérialiser
+            slot_size: Taille (octets) d'un segment ; une page plus grande est sérialisée
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes, initializer=_init_worker,
+            initargs=(base_url, parser, partial_parsing)
+        )
+        self.slot_size = slot_size
+        self._segments: List[shared_memory.SharedMemory] = []
+        # Segments libres ; un appelant attend qu'un segment se libère (contre-pression)
+        self._free: "queue.Queue[int]" = queue.Queue()
+        if use_shared_memory:
+            # Un segment de plus par processus : il n'est rendu qu'après la lecture du résultat
+            for index in range(self.processes * (IN_FLIGHT_PER_PROCESS + 1)):
+                self._segments.append(shared_memory.SharedMemory(create=True, size=slot_size))
+                self._free.put(index)
+    
+    def _submit(self, task, content: bytes, *args) -> Future:
+        """Soumet une page ; son segment est rendu dès que le worker a terminé"""
+        if not self._segments or len(content) > self.slot_size:
+            return self._executor.submit(task, bytes(content), *args)
+        
+        index = self._free.get()
+        segment = self._segments[index]
+        try:
+            segment.buf[:len(content)] = content
+            future = self._executor.submit(task, (segment.name, len(content)), *args)
+        except BaseException:
+            self._free.put(index)
+            raise
+        future.add_done_callback(lambda _: self._free.put(index))
+        return future
+    
+    def submit_listings(self, content: bytes, max_articles: Optional[int] = None) -> Future:
+        """Future de la liste d'articles (sans extrait) d'une page de liste"""
+        return self._submit(_listings_task, content, max_articles)
+    
+    def submit_excerpt(self, content: bytes) -> Future:
+        """Future de l'extrait d'une page d'article"""
+        return self._submit(_excerpt_task, content)
+    
+    def extract_listings(self, content: bytes, max_articles: Optional[int] = None) -> List[Article]:
+        return self.submit_listings(content, max_articles).result()
+    
+    def extract_excerpt(self, content: bytes) -> str:
+        return self.submit_excerpt(content).result()
+    
+    def map_listings(self, pages: Iterable[bytes]) -> Iterator[List[Article]]:
+        """Articles de chaque page de liste, dans l'ordre des pages (traitement de masse)"""
+        return self._map(self.submit_listings, pages)
+    
+    def map_excerpts(self, pages: Iterable[bytes]) -> Iterator[str]:
+        """Extrait de chaque page d'article, dans l'ordre des pages (traitement de masse)"""
+        return self._map(self.submit_excerpt, pages)
+    
+    def _map(self, submit, pages: Iterable[bytes]) -> Iterator:
+        # Fenêtre bornée : mémoire constante quel que soit le nombre de pages
+        window = self.processes * IN_FLIGHT_PER_PROCESS
+        pending: deque = deque()
+        for content in pages:
+            if len(pending) == window:
+                yield pending.popleft().result()
+            pending.append(submit(content))
+        while pending:
+            yield pending.popleft().result()
+    
+    def close(self):
+        """Arrête les workers puis détruit les segments de mémoire partagée"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
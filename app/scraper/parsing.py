@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+⚙️ BACKENDS DE PARSING
+Choix du parser BeautifulSoup et parsing partiel (SoupStrainer)
+"""
+
+import logging
+import os
+from typing import Callable, Dict, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+logger = logging.getLogger(__name__)
+
+# Du plus rapide au plus tolérant
+SUPPORTED_PARSERS = ('lxml', 'html.parser', 'html5lib')
+
+# Classes conteneurs d'extrait (voir BlogScraper._extract_excerpt)
+EXCERPT_CLASSES = frozenset({'entry-content', 'post-content', 'content', 'entry-excerpt'})
+
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """Parser demandé (ou SCRAPER_PARSER), avec repli sur html.parser s'il n'est pas installé"""
+    
+    name = name or os.getenv('SCRAPER_PARSER', 'lxml')
+    if name not in SUPPORTED_PARSERS:
+        raise ValueError(f"Parser inconnu: {name} (disponibles: {', '.join(SUPPORTED_PARSERS)})")
+    
+    if builder_registry.lookup(name) is None:
+        logger.warning(f"⚠️ Parser {name} indisponible, utilisation de html.parser")
+        return 'html.parser'
+    return name
+
+
+def _classes(attrs: Dict) -> set:
+    value = attrs.get('class') or ''
+    return set(value.split() if isinstance(value, str) else value)
+
+
+def _is_listing_tag(name: str, attrs: Dict) -> bool:
+    # Articles de la liste + liens (pagination, catégories) pour le crawl
+    return name in ('article', 'a')
+
+
+def _is_article_page_tag(name: str, attrs: Dict) -> bool:
+    if name == 'article':
+        return True
+    if name == 'meta':
+        return attrs.get('name') == 'description'
+    return not EXCERPT_CLASSES.isdisjoint(_classes(attrs))
+
+
+def _strainer(predicate: Callable[[str, Dict], bool]):
+    """Filtre de parsing compatible avec toutes les versions de beautifulsoup4"""
+    
+    try:
+        from bs4.filter import ElementFilter
+    except ImportError:
+        # beautifulsoup4 < 4.13 : le callable reçoit le nom et les attributs
+        return SoupStrainer(lambda name, attrs=None: predicate(name, attrs or {}))
+    
+    class _TagFilter(ElementFilter):
+        # Appelé uniquement hors des sous-arbres déjà conservés
+        def allow_tag_creation(self, nsprefix, name, attrs):
+            return predicate(name, attrs or {})
+        
+        def allow_string_creation(self, string):
+            return False
+    
+    return _TagFilter()
+
+
+LISTING_STRAINER = _strainer(_is_listing_tag)
+ARTICLE_PAGE_STRAINER = _strainer(_is_article_page_tag)
+
+
+def make_soup(content, parser: str, parse_only=None) -> BeautifulSoup:
+    """Parse du HTML, limité aux sous-arbres acceptés par parse_only"""
+    return BeautifulSoup(content, parser, parse_only=parse_only)
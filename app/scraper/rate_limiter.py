@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+🚦 LIMITEUR DE DÉBIT - TOKEN BUCKET PAR HÔTE
+Politesse configurable, partagée entre threads et coroutines
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Politique par défaut : 2 requêtes/s par hôte, rafale de 4
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 4
+
+
+class TokenBucket:
+    """Token bucket thread-safe (débit en jetons/s, capacité = rafale)"""
+    
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        if rate <= 0:
+            raise ValueError("rate doit être strictement positif")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Réserve des jetons et retourne le délai d'attente avant de les utiliser.
+        
+        Le solde peut devenir négatif : chaque appelant réserve son créneau,
+        ce qui garantit l'ordre d'arrivée sans bloquer sous le verrou.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Attente bloquante (code synchrone), retourne le temps attendu"""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+    
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Attente non bloquante (code asynchrone), retourne le temps attendu"""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """Un token bucket par hôte, créé à la demande"""
+    
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 overrides: Optional[Dict[str, TokenBucket]] = None):
+        """
+        Args:
+            rate: Débit par défaut (requêtes/s) pour chaque hôte
+            burst: Nombre de requêtes autorisées en rafale
+            overrides: Buckets spécifiques par hôte (netloc)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = dict(overrides or {})
+        self._lock = threading.Lock()
+    
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+    
+    def acquire(self, url: str) -> float:
+        return self.bucket_for(url).acquire()
+    
+    async def acquire_async(self, url: str) -> float:
+        return await self.bucket_for(url).acquire_async()
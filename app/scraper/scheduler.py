@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+⏰ PLANIFICATEUR DE SCRAPING
+Boucle longue autour de BlogScraper et MongoService : une exécution à la fois
+(verrou à bail MongoDB), intervalle adapté au rythme de publication observé
+(espacé tant que la page d'accueil ne change pas), reprises avec gigue
+"""
+
+import hashlib
+import logging
+import os
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from app.database.article_sink import ArticleSink
+from app.database.mongo_service import MongoService
+from app.database.scrape_runs import MongoLease, RunStore
+from app.models.article import Article
+from app.scraper.main_scraper import BlogScraper
+
+logger = logging.getLogger(__name__)
+
+# Bornes de l'intervalle entre deux exécutions (s)
+MIN_INTERVAL = float(os.getenv('SCHEDULER_MIN_INTERVAL', 300))
+MAX_INTERVAL = float(os.getenv('SCHEDULER_MAX_INTERVAL', 3600))
+# Page d'accueil inchangée : intervalle multiplié par ce facteur
+BACKOFF_FACTOR = 1.5
+# Page modifiée : intervalle = fraction de l'écart moyen entre deux publications
+PUBLISH_GAP_FRACTION = 0.5
+# Poids de la dernière observation dans la moyenne mobile de cet écart
+PUBLISH_GAP_SMOOTHING = 0.3
+# Gigue relative des attentes (évite que plusieurs instances se synchronisent)
+JITTER = 0.1
+
+# Reprises d'une exécution en échec : attente tirée dans [0, RETRY_BASE_DELAY * 2^n]
+MAX_RETRIES = int(os.getenv('SCHEDULER_MAX_RETRIES', 3))
+RETRY_BASE_DELAY = float(os.getenv('SCHEDULER_RETRY_BASE_DELAY', 30))
+
+# Champs de la page d'accueil entrant dans son empreinte
+LISTING_HASH_FIELDS = ('id', 'url', 'title', 'date')
+
+
+def listing_hash(listings: List[Article]) -> str:
+    """Empreinte de la page d'accueil : change dès qu'un article apparaît ou est modifié"""
+    digest = hashlib.sha256()
+    for listing in listings:
+        for field in LISTING_HASH_FIELDS:
+            digest.update((getattr(listing, field) or '').encode())
+            digest.update(b'\x1f')
+        digest.update(b'\x1e')
+    return digest.hexdigest()
+
+
+class ScrapeScheduler:
+    """Exécutions incrémentales répétées, état persisté dans scrape_runs"""
+    
+    def __init__(self, scraper: BlogScraper, service: MongoService, max_articles: int = 15,
+                 min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL,
+                 backoff_factor: float = BACKOFF_FACTOR, jitter: float = JITTER,
+                 max_retries: int = MAX_RETRIES, retry_base_delay: float = RETRY_BASE_DELAY,
+                 lease: Optional[MongoLease] = None, runs: Optional[RunStore] = None):
+        """
+        Args:
+            scraper: Scraper de la page d'accueil et des articles
+            service: Service MongoDB (articles connus, sauvegarde)
+            max_articles: Articles de la page d'accueil suivis
+            min_interval: Intervalle minimal (s) entre deux exécutions
+            max_interval: Intervalle maximal (s), atteint quand rien ne change
+            backoff_factor: Multiplicateur de l'intervalle si la page est inchangée
+            jitter: Gigue relative appliquée à chaque attente
+            max_retries: Nouvelles tentatives d'une exécution en échec
+            retry_base_delay: Base (s) de l'attente exponentielle entre tentatives
+            lease: Verrou partagé entre instances (bail 'scrape' de la base par défaut)
+            runs: Historique des exécutions (collection scrape_runs par défaut)
+        """
+        self.scraper = scraper
+        self.service = service
+        self.max_articles = max_articles
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.lease = lease or MongoLease(service.db)
+        self.runs = runs or RunStore(service.db)
+        self.stop_event = threading.Event()
+        
+        self.interval = min_interval
+        self.listing_hash: Optional[str] = None
+        self.publish_gap: Optional[float] = None
+        self.last_change_at: Optional[datetime] = None
+        self._state_loaded = False
+    
+    def _load_state(self):
+        """Reprend empreinte, intervalle et rythme de publication de la dernière exécution réussie"""
+        self._state_loaded = True
+        try:
+            last = self.runs.last(statuses=('success', 'unchanged'))
+        except Exception as e:
+            logger.warning(f"⚠️ Historique des exécutions illisible: {e}")
+            return
+        if not last:
+            return
+        self.listing_hash = last.get('listing_hash')
+        self.interval = self._clamp(last.get('interval') or self.min_interval)
+        self.publish_gap = last.get('publish_gap')
+        last_change_at = last.get('last_change_at')
+        if isinstance(last_change_at, datetime):
+            self.last_change_at = last_change_at.replace(tzinfo=last_change_at.tzinfo or timezone.utc)
+        logger.info(f"⏰ État repris: intervalle {self.interval:.0f}s")
+    
+    def _clamp(self, interval: float) -> float:
+        return max(self.min_interval, min(self.max_interval, interval))
+    
+    def _jittered(self, delay: float) -> float:
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+    
+    def next_interval(self, changed: bool, now: datetime) -> float:
+        """
+        Intervalle suivant : espacé géométriquement tant que rien ne change, ramené
+        à une fraction de l'écart moyen entre publications quand la page change
+        """
+        if not changed:
+            self.interval = self._clamp(self.interval * self.backoff_factor)
+            return self.interval
+        
+        if self.last_change_at is not None:
+            gap = (now - self.last_change_at).total_seconds()
+            if self.publish_gap is None:
+                self.publish_gap = gap
+            else:
+                self.publish_gap = PUBLISH_GAP_SMOOTHING * gap + (1 - PUBLISH_GAP_SMOOTHING) * self.publish_gap
+        self.last_change_at = now
+        if self.publish_gap is None:
+            self.interval = self.min_interval
+        else:
+            self.interval = self._clamp(self.publish_gap * PUBLISH_GAP_FRACTION)
+        return self.interval
+    
+    @staticmethod
+    def _next_run_at(interval: float) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(seconds=interval)
+    
+    def run_forever(self, max_runs: Optional[int] = None):
+        """Exécutions successives jusqu'à stop() (ou max_runs exécutions)"""
+        
+        runs = 0
+        while not self.stop_event.is_set():
+            try:
+                delay = self.run_once()
+            except Exception as e:
+                # MongoDB injoignable (verrou, historique) : nouvel essai au prochain intervalle
+                logger.error(f"❌ Exécution impossible: {e}")
+                delay = self.min_interval
+            runs += 1
+            if max_runs is not None and runs >= max_runs:
+                break
+            delay = self._jittered(delay)
+            logger.info(f"⏰ Prochaine exécution dans {delay:.0f}s")
+            self.stop_event.wait(delay)
+    
+    def stop(self):
+        self.stop_event.set()
+    
+    def run_once(self) -> float:
+        """
+        Une exécution sous verrou (avec ses reprises)
+        
+        Returns:
+            Attente (s) avant la suivante, sans gigue
+        """
+        if not self.lease.acquire():
+            holder = self.lease.holder() or {}
+            logger.info(f"⏭️ Exécution en cours ailleurs ({holder.get('owner', '?')}), pas de chevauchement")
+            return self.min_interval
+        
+        with self.lease.hold():
+            if not self._state_loaded:
+                self._load_state()
+            run_id = self.runs.start(self.lease.owner, previous_hash=self.listing_hash)
+            
+            for attempt in range(self.max_retries + 1):
+                try:
+                    result = self._scrape()
+                    break
+                except Exception as e:
+                    logger.error(f"❌ Exécution en échec (tentative {attempt + 1}/{self.max_retries + 1}): {e}")
+                    if attempt == self.max_retries:
+                        self.runs.finish(run_id, 'failed', attempts=attempt + 1, error=str(e),
+                                         interval=self.interval, next_run_at=self._next_run_at(self.interval))
+                        return self.interval
+                    # Attente exponentielle à gigue complète, interrompue par stop()
+                    if self.stop_event.wait(random.uniform(0, self.retry_base_delay * 2 ** attempt)):
+                        self.runs.finish(run_id, 'failed', attempts=attempt + 1, error=str(e),
+                                         interval=self.interval)
+                        return 0.0
+            
+            interval = self.next_interval(result['changed'], datetime.now(timezone.utc))
+            self.runs.finish(
+                run_id, 'success' if result['changed'] else 'unchanged',
+                attempts=attempt + 1, interval=interval, next_run_at=self._next_run_at(interval),
+                publish_gap=self.publish_gap, last_change_at=self.last_change_at,
+                listing_hash=self.listing_hash, **result
+            )
+            return interval
+    
+    def _scrape(self) -> Dict:
+        """Empreinte de la page d'accueil puis, si elle a changé, scraping incrémental"""
+        
+        soup = self.scraper.fetch_listing(self.scraper.base_url)
+        listings = self.scraper.extract_listings(soup, self.max_articles)
+        del soup
+        if not listings:
+            raise RuntimeError("Aucun article sur la page d'accueil (structure modifiée ?)")
+        
+        listed = len(listings)
+        current_hash = listing_hash(listings)
+        if current_hash == self.listing_hash:
+            logger.info("💤 Page d'accueil inchangée")
+            return {'changed': False, 'listed': listed, 'scraped': 0, 'saved': 0}
+        
+        listings = self.scraper.skip_unchanged(listings, self.service.get_known_articles)
+        scraped = 0
+        with ArticleSink(self.service) as sink:
+            for article in self.scraper.iter_completed(listings):
+                sink.add(article)
+                scraped += 1
+        if not sink.ok:
+            raise RuntimeError(f"{sink.failed_batches} lots non sauvegardés")
+        
+        # Empreinte retenue seulement après une sauvegarde complète
+        self.listing_hash = current_hash
+        logger.info(f"✅ {scraped} articles nouveaux ou modifiés sauvegardés")
+        return {'changed': True, 'listed': listed, 'scraped': scraped, 'saved': sink.saved}
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🎯 MOTEUR DE SÉLECTEURS COMPILÉS
+Plusieurs sélecteurs CSS évalués en un seul parcours de l'arbre
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import soupsieve
+from bs4 import Tag
+
+_COMBINATORS = re.compile(r'\s*[\s>+~]\s*')
+_BRACKETS = re.compile(r'\[[^\]]*\]|\([^)]*\)')
+_TAG_NAME = re.compile(r'[a-zA-Z][\w-]*')
+
+
+def subject_tag(css: str) -> Optional[str]:
+    """Nom de balise imposé par le dernier composant d'un sélecteur ("article p" -> "p")"""
+    last = _COMBINATORS.split(_BRACKETS.sub('', css).strip())[-1]
+    match = _TAG_NAME.match(last)
+    return match.group(0).lower() if match else None
+
+
+class SelectorEngine:
+    """Liste ordonnée de sélecteurs compilés une fois pour toutes"""
+    
+    def __init__(self, selectors: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            selectors: Couples (nom, sélecteur CSS), par ordre de priorité
+        """
+        self.selectors = list(selectors)
+        self.names = [name for name, _ in self.selectors]
+        
+        # (nom, balise attendue ou None, sélecteur compilé), par priorité
+        self._compiled: List[Tuple[str, Optional[str], soupsieve.SoupSieve]] = []
+        for name, css in self.selectors:
+            self._compiled.append((name, subject_tag(css), soupsieve.compile(css)))
+        
+        # Liste de sélecteurs unique : un seul matcher parcourt l'arbre, les
+        # sélecteurs individuels ne sont testés que sur les rares candidats
+        self._combined = soupsieve.compile(', '.join(css for _, css in self.selectors))
+        self._combined_rest = (
+            soupsieve.compile(', '.join(css for _, css in self.selectors[1:]))
+            if len(self.selectors) > 1 else None
+        )
+    
+    def _matching(self, tag: Tag, pending):
+        """Sélecteurs en attente satisfaits par ce candidat, par priorité"""
+        for item in pending:
+            name, tag_name, pattern = item
+            if tag_name is not None and tag.name != tag_name:
+                continue
+            if pattern.match(tag):
+                yield item
+    
+    def first_matches(self, root: Tag) -> Dict[str, Tag]:
+        """
+        Premier élément (ordre du document) de chaque sélecteur sous root,
+        équivalent à un select_one par sélecteur mais en un seul parcours
+        """
+        found: Dict[str, Tag] = {}
+        pending = self._compiled
+        
+        for tag in self._combined.iselect(root):
+            hits = [item[0] for item in self._matching(tag, pending)]
+            if hits:
+                for name in hits:
+                    found[name] = tag
+                pending = [item for item in pending if item[0] not in found]
+                if not pending:
+                    break
+        
+        return found
+    
+    def first_accepted(self, root: Tag, accept: Callable[[str, Tag], Optional[str]]) -> Optional[str]:
+        """
+        Applique la priorité des sélecteurs : retourne accept(nom, élément) pour
+        le premier sélecteur dont le premier élément est accepté (résultat non
+        vide). Le parcours s'arrête dès que la réponse ne peut plus changer.
+        """
+        # Cas courant : le sélecteur prioritaire suffit, un seul sélecteur évalué
+        name, _, pattern = self._compiled[0]
+        first = pattern.select_one(root)
+        if first is not None:
+            value = accept(name, first)
+            if value:
+                return value
+        if self._combined_rest is None:
+            return None
+        
+        found: Dict[str, Tag] = {}
+        rejected = {name}
+        pending = self._compiled[1:]
+        
+        # Sinon, tous les autres sélecteurs en un seul parcours
+        for tag in self._combined_rest.iselect(root):
+            hit = False
+            for name, _, _ in self._matching(tag, pending):
+                found[name] = tag
+                hit = True
+            if not hit:
+                continue
+            pending = [item for item in pending if item[0] not in found]
+            
+            # Premier sélecteur non rejeté, dans l'ordre de priorité
+            for name in self.names:
+                if name in rejected:
+                    continue
+                if name not in found:
+                    break
+                value = accept(name, found[name])
+                if value:
+                    return value
+                rejected.add(name)
+            else:
+                return None
+        
+        # Fin du document : les sélecteurs sans résultat sont ignorés
+        for name in self.names:
+            if name in found and name not in rejected:
+                value = accept(name, found[name])
+                if value:
+                    return value
+        return None
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+🔎 RECHERCHE D'ARTICLES EN MÉMOIRE
+Index inversé alimenté par MongoService, rafraîchi de façon incrémentale
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.database.mongo_service import LIST_PROJECTION, MAX_PAGE_SIZE, MongoService, decode_cursor, encode_cursor
+from app.search.inverted_index import InvertedIndex
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleSearch:
+    """Recherche /api/search sans aller-retour MongoDB"""
+    
+    def __init__(self, service: MongoService, refresh_interval: float = 30.0):
+        """
+        Args:
+            service: Source des articles
+            refresh_interval: Délai minimal (s) entre deux lectures des nouveaux articles
+        """
+        self.service = service
+        self.refresh_interval = refresh_interval
+        self.index = InvertedIndex()
+        self._last_saved_at: Optional[datetime] = None
+        self._last_refresh = 0.0
+        self._refresh_lock = threading.Lock()
+    
+    def refresh(self, force: bool = False) -> int:
+        """Indexe les articles sauvegardés depuis le dernier rafraîchissement"""
+        
+        if not force and time.monotonic() - self._last_refresh < self.refresh_interval:
+            return 0
+        # Un seul rafraîchissement à la fois, les autres requêtes utilisent l'index courant
+        if not self._refresh_lock.acquire(blocking=force):
+            return 0
+        
+        try:
+            self._last_refresh = time.monotonic()
+            count = 0
+            for article in self.service.iter_articles_since(self._last_saved_at, LIST_PROJECTION):
+                self._index_article(article)
+                count += 1
+            if count:
+                logger.info(f"🔎 {count} articles indexés ({len(self.index)} au total)")
+            return count
+        except Exception as e:
+            logger.error(f"❌ Erreur indexation: {e}")
+            return 0
+        finally:
+            self._refresh_lock.release()
+    
+    async def refresh_async(self, force: bool = False) -> int:
+        """refresh() pour un service asynchrone (AsyncMongoService), sans bloquer la boucle"""
+        
+        if not force and time.monotonic() - self._last_refresh < self.refresh_interval:
+            return 0
+        # Rafraîchissement déjà en cours dans une autre tâche : il couvre cette demande
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0
+        
+        try:
+            self._last_refresh = time.monotonic()
+            count = 0
+            async for article in self.service.iter_articles_since(self._last_saved_at, LIST_PROJECTION):
+                self._index_article(article)
+                count += 1
+            if count:
+                logger.info(f"🔎 {count} articles indexés ({len(self.index)} au total)")
+            return count
+        except Exception as e:
+            logger.error(f"❌ Erreur indexation: {e}")
+            return 0
+        finally:
+            self._refresh_lock.release()
+    
+    def _index_article(self, article: Dict):
+        self.index.add(article['id'], article)
+        saved_at = article.get('saved_at')
+        if isinstance(saved_at, datetime):
+            self._last_saved_at = saved_at
+    
+    def search(self, query: str, limit: int = 15) -> List[Dict]:
+        """Articles classés par pertinence (BM25), le dernier mot étant un préfixe"""
+        return self.search_page(query, limit)['articles']
+    
+    def search_page(self, query: str, limit: int = 15, cursor: Optional[str] = None) -> Dict:
+        """
+        Page de résultats, même contrat que MongoService.search_articles_page
+        
+        Raises:
+            ValueError: Curseur invalide
+        """
+        
+        self.refresh()
+        position = decode_cursor(cursor) if cursor else None
+        if self._use_service(position):
+            # Index vide (base indisponible au démarrage) ou pagination commencée sur MongoDB
+            return self.service.search_articles_page(query, limit=limit, cursor=cursor)
+        return self._index_page(query, limit, position, cursor)
+    
+    async def search_page_async(self, query: str, limit: int = 15, cursor: Optional[str] = None) -> Dict:
+        """search_page() pour un service asynchrone (AsyncMongoService)"""
+        
+        await self.refresh_async()
+        position = decode_cursor(cursor) if cursor else None
+        if self._use_service(position):
+            return await self.service.search_articles_page(query, limit=limit, cursor=cursor)
+        return self._index_page(query, limit, position, cursor)
+    
+    def _use_service(self, position: Optional[Dict]) -> bool:
+        return not len(self.index) or (position is not None and 'offset' not in position)
+    
+    def _index_page(self, query: str, limit: int, position: Optional[Dict], cursor: Optional[str]) -> Dict:
+        """Les résultats d'une recherche en mémoire se paginent par rang"""
+        
+        offset = position['offset'] if position else 0
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError(f"Curseur invalide: {cursor!r}")
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        
+        results = self.index.search(query, limit=limit + 1, offset=offset)
+        next_cursor = encode_cursor({'offset': offset + limit}) if len(results) > limit else None
+        return {
+            'articles': [dict(article, score=round(score, 3)) for score, article in results[:limit]],
+            'next_cursor': next_cursor
+        }
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+🔎 INDEX INVERSÉ EN MÉMOIRE
+Recherche BM25 insensible aux accents, avec préfixe pour la saisie au fil de l'eau
+"""
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Mots trop fréquents pour discriminer (déjà sans accents)
+STOPWORDS = frozenset(
+    "au aux avec ce ces dans de des du elle en et eux il je la le les leur lui ma mais me meme mes moi "
+    "mon ne nos notre nous on ou par pas pour qu que qui sa se ses son sur ta te tes toi ton tu un une "
+    "vos votre vous c d j l m n s t y a est sont".split()
+)
+
+# Pondération des champs dans la fréquence des termes
+FIELD_WEIGHTS = {'title': 3.0, 'category': 2.0, 'excerpt': 1.0}
+
+# Nombre maximum de termes couverts par un préfixe
+MAX_PREFIX_EXPANSIONS = 64
+
+# Listes de scores triées gardées en cache (termes les plus demandés)
+IMPACT_CACHE_SIZE = 2048
+
+
+def _build_fold_table() -> Dict[int, str]:
+    """Table de translittération des lettres latines accentuées (é -> e, Ç -> C)"""
+    table = {}
+    for codepoint in range(0xC0, 0x250):
+        char = chr(codepoint)
+        base = ''.join(c for c in unicodedata.normalize('NFKD', char) if not unicodedata.combining(c))
+        if base and base != char:
+            table[codepoint] = base
+    return table
+
+
+_FOLD_TABLE = _build_fold_table()
+
+
+def fold(text: str) -> str:
+    """Minuscules sans accents ("Éléphant" -> "elephant")"""
+    if not text.isascii():
+        text = text.translate(_FOLD_TABLE)
+    return text.lower()
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN_PATTERN.findall(fold(text)) if t not in STOPWORDS]
+
+
+class InvertedIndex:
+    """Index inversé thread-safe : terme -> {document: fréquence pondérée}"""
+    
+    def __init__(self, fields: Optional[Dict[str, float]] = None, k1: float = 1.2, b: float = 0.75):
+        self.fields = fields or FIELD_WEIGHTS
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._lengths: Dict[int, float] = {}
+        self._docs: Dict[int, Dict] = {}
+        self._slots: Dict[Hashable, int] = {}
+        self._terms_by_slot: Dict[int, Tuple[str, ...]] = {}
+        self._next_slot = 0
+        self._total_length = 0.0
+        self._sorted_terms: Optional[List[str]] = None
+        # terme -> (scores triés décroissants, scores par document), invalidé à chaque écriture
+        self._impacts: "OrderedDict[str, Tuple[List[Tuple[float, int]], Dict[int, float]]]" = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self._docs)
+    
+    def add(self, key: Hashable, doc: Dict):
+        """Indexe (ou ré-indexe) un document"""
+        
+        frequencies: Dict[str, float] = {}
+        for field, weight in self.fields.items():
+            for term in tokenize(str(doc.get(field) or '')):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+        length = sum(frequencies.values())
+        
+        with self._lock:
+            self.remove(key)
+            slot = self._next_slot
+            self._next_slot += 1
+            self._slots[key] = slot
+            self._docs[slot] = doc
+            self._lengths[slot] = length
+            self._terms_by_slot[slot] = tuple(frequencies)
+            self._total_length += length
+            for term, tf in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._sorted_terms = None
+                postings[slot] = tf
+            self._impacts.clear()
+    
+    def remove(self, key: Hashable) -> bool:
+        with self._lock:
+            slot = self._slots.pop(key, None)
+            if slot is None:
+                return False
+            del self._docs[slot]
+            self._total_length -= self._lengths.pop(slot)
+            for term in self._terms_by_slot.pop(slot):
+                postings = self._postings[term]
+                del postings[slot]
+                if not postings:
+                    del self._postings[term]
+                    self._sorted_terms = None
+            self._impacts.clear()
+            return True
+    
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Termes de l'index commençant par le préfixe (ordre alphabétique)"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        start = bisect.bisect_left(terms, prefix)
+        expansions = []
+        for term in terms[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            expansions.append(term)
+        return expansions
+    
+    def _term_impacts(self, term: str) -> Tuple[List[Tuple[float, int]], Dict[int, float]]:
+        """Scores BM25 du terme pour chaque document, calculés une fois par état de l'index"""
+        
+        cached = self._impacts.get(term)
+        if cached is not None:
+            self._impacts.move_to_end(term)
+            return cached
+        
+        postings = self._postings.get(term) or {}
+        total = len(self._docs)
+        avg_length = self._total_length / total or 1.0
+        idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+        k1, b, lengths = self.k1, self.b, self._lengths
+        
+        scores = {
+            slot: idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * lengths[slot] / avg_length))
+            for slot, tf in postings.items()
+        }
+        ranked = sorted(((score, slot) for slot, score in scores.items()), reverse=True)
+        
+        self._impacts[term] = (ranked, scores)
+        if len(self._impacts) > IMPACT_CACHE_SIZE:
+            self._impacts.popitem(last=False)
+        return ranked, scores
+    
+    def search(self, query: str, limit: int = 15, offset: int = 0, prefix: bool = True) -> List[Tuple[float, Dict]]:
+        """
+        Documents contenant tous les termes de la requête, triés par score BM25
+        
+        Args:
+            query: Texte saisi
+            limit: Nombre de résultats
+            offset: Résultats à sauter (pagination)
+            prefix: Le dernier terme est traité comme un préfixe (saisie en cours)
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        
+        with self._lock:
+            if not self._docs:
+                return []
+            
+            # Chaque mot de la requête : termes de l'index acceptés (préfixe pour le dernier)
+            groups = [[term] for term in dict.fromkeys(terms[:-1])]
+            # Tous les mots sont requis : un mot absent de l'index ne renvoie rien
+            if any(term not in self._postings for term, in groups):
+                return []
+            groups.append(self._expand_prefix(terms[-1]) if prefix else [terms[-1]])
+            if not all(groups):
+                return []
+            wanted = offset + limit
+            
+            if len(groups) > 1:
+                return self._search_all(groups, wanted)[offset:]
+            
+            # Un seul mot : les meilleurs documents sont en tête de chaque liste triée
+            scores: Dict[int, float] = {}
+            for term in groups[0]:
+                for score, slot in self._term_impacts(term)[0][:wanted]:
+                    if score > scores.get(slot, 0.0):
+                        scores[slot] = score
+            best = heapq.nlargest(wanted, scores.items(), key=lambda item: item[1])
+            return [(score, self._docs[slot]) for slot, score in best[offset:]]
+    
+    def _search_all(self, groups: List[List[str]], wanted: int) -> List[Tuple[float, Dict]]:
+        """
+        Intersection à arrêt anticipé : on parcourt le mot le plus rare par score
+        décroissant et on s'arrête dès qu'aucun document restant ne peut entrer
+        dans les meilleurs résultats (borne = score courant + maximum des autres mots)
+        """
+        groups = sorted(groups, key=lambda group: sum(len(self._postings[t]) for t in group))
+        lead, others = groups[0], groups[1:]
+        
+        other_maps = [[self._term_impacts(term)[1] for term in group] for group in others]
+        bound_rest = sum(
+            max(self._term_impacts(term)[0][0][0] for term in group)
+            for group in others
+        )
+        lead_ranked = [self._term_impacts(term)[0] for term in lead]
+        candidates = lead_ranked[0] if len(lead_ranked) == 1 else heapq.merge(*lead_ranked, reverse=True)
+        
+        top: List[Tuple[float, int]] = []
+        visited = set()
+        for lead_score, slot in candidates:
+            if len(top) == wanted and lead_score + bound_rest <= top[0][0]:
+                break
+            if slot in visited:
+                continue
+            visited.add(slot)
+            total = lead_score
+            for maps in other_maps:
+                best = max(m.get(slot, 0.0) for m in maps)
+                if best == 0.0:
+                    break
+                total += best
+            else:
+                if len(top) < wanted:
+                    heapq.heappush(top, (total, slot))
+                elif total > top[0][0]:
+                    heapq.heapreplace(top, (total, slot))
+        
+        top.sort(reverse=True)
+        return [(score, self._docs[slot]) for score, slot in top]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+📅 NORMALISATION DES DATES
+Dates du blog (ISO 8601 avec fuseau, "10 juillet 2025", "10/07/2025 à 10:58")
+converties en datetime avec fuseau ; mise en forme uniquement à l'affichage
+"""
+
+import os
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+# Fuseau des dates sans décalage explicite et de l'affichage
+TIMEZONE = ZoneInfo(os.getenv('SCRAPER_TIMEZONE', 'Europe/Paris'))
+DISPLAY_FORMAT = "%d/%m/%Y à %H:%M"
+UNKNOWN_DATE = "Date inconnue"
+
+# Chaînes distinctes gardées en cache (une page de liste répète souvent la même date)
+DATE_CACHE_SIZE = int(os.getenv('DATE_CACHE_SIZE', 4096))
+
+# Les douze mois, avec abréviations et variantes sans accents
+FRENCH_MONTHS = {
+    'janvier': 1, 'janv': 1,
+    'février': 2, 'fevrier': 2, 'févr': 2, 'fevr': 2, 'fév': 2, 'fev': 2,
+    'mars': 3,
+    'avril': 4, 'avr': 4,
+    'mai': 5,
+    'juin': 6,
+    'juillet': 7, 'juil': 7,
+    'août': 8, 'aout': 8,
+    'septembre': 9, 'sept': 9,
+    'octobre': 10, 'oct': 10,
+    'novembre': 11, 'nov': 11,
+    'décembre': 12, 'decembre': 12, 'déc': 12, 'dec': 12,
+}
+
+# "1er juillet 2025", "10 juil. 2025 à 10h58" (noms les plus longs essayés d'abord)
+_FRENCH_DATE = re.compile(
+    r'(\d{1,2})(?:er)?\s+(' + '|'.join(sorted(FRENCH_MONTHS, key=len, reverse=True)) + r')\.?\s+(\d{4})'
+    r'(?:\s*(?:à|,)?\s*(\d{1,2})\s*[h:]\s*(\d{2})?)?',
+    re.IGNORECASE
+)
+# "10/07/2025" ou "10/07/2025 à 10:58" (format d'affichage historique)
+_NUMERIC_DATE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})(?:\s*(?:à\s*)?(\d{1,2})[h:](\d{2}))?')
+
+
+def as_utc(value: datetime) -> datetime:
+    """Datetime avec fuseau en UTC ; un datetime naïf est supposé UTC (lecture MongoDB)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Datetime avec fuseau pour une date du blog, None si le format est inconnu
+    
+    Les décalages explicites (+01:00 l'hiver, +02:00 l'été, Z) sont conservés ;
+    les dates sans décalage sont interprétées dans TIMEZONE.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = None
+    if parsed is not None:
+        return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=TIMEZONE)
+    
+    match = _FRENCH_DATE.search(value)
+    if match:
+        day, month, year, hour, minute = match.groups()
+        month = FRENCH_MONTHS[month.lower()]
+    else:
+        match = _NUMERIC_DATE.search(value)
+        if not match:
+            return None
+        day, month, year, hour, minute = match.groups()
+    
+    try:
+        return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), tzinfo=TIMEZONE)
+    except ValueError:
+        # 31 février, 25h...
+        return None
+
+
+def format_date(value: Optional[datetime], fallback: Optional[str] = None) -> str:
+    """Date lisible dans TIMEZONE (10/07/2025 à 10:58), fallback si absente"""
+    if not isinstance(value, datetime):
+        return fallback or UNKNOWN_DATE
+    return as_utc(value).astimezone(TIMEZONE).strftime(DISPLAY_FORMAT)
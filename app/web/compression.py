@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+🗜️ COMPRESSION DES RÉPONSES
+gzip (ou brotli si le module est installé) selon l'en-tête Accept-Encoding
+"""
+
+import gzip
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # Optionnel : pip install brotli
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# En dessous, l'en-tête gzip coûte plus qu'il ne rapporte
+MIN_SIZE = 500
+
+# Niveaux rapides : les réponses sont petites et calculées à chaque requête
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+COMPRESSIBLE_TYPES = ('text/html', 'text/css', 'text/plain', 'application/json', 'application/javascript')
+
+# Corps déjà compressés, par (ETag, encodage) : une réponse servie depuis le cache
+# de l'API n'est compressée qu'une fois
+COMPRESSED_CACHE_SIZE = 256
+_compressed: "OrderedDict[tuple, bytes]" = OrderedDict()
+_compressed_lock = threading.Lock()
+
+
+def choose_encoding(accept_encoding: str) -> str:
+    """Meilleur encodage accepté d'après l'en-tête Accept-Encoding ('' si aucun)"""
+    
+    accepted = set()
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        # "gzip;q=0" signifie refusé
+        if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            accepted.add(coding.strip().lower())
+    
+    if brotli is not None and ('br' in accepted or '*' in accepted):
+        return 'br'
+    if 'gzip' in accepted or '*' in accepted:
+        return 'gzip'
+    return ''
+
+
+def compress_body(body: bytes, encoding: str, etag: Optional[str] = None) -> bytes:
+    """Corps compressé ; mémorisé par (ETag, encodage) quand l'ETag est connu"""
+    
+    key = (etag, encoding)
+    if etag:
+        with _compressed_lock:
+            compressed = _compressed.get(key)
+            if compressed is not None:
+                _compressed.move_to_end(key)
+                return compressed
+    
+    if encoding == 'br':
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    
+    if etag:
+        with _compressed_lock:
+            _compressed[key] = compressed
+            while len(_compressed) > COMPRESSED_CACHE_SIZE:
+                _compressed.popitem(last=False)
+    return compressed
+
+
+def compress_response(response: Response) -> Response:
+    """Compresse le corps si le client, le type et la taille s'y prêtent"""
+    
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+    
+    encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+    if not encoding:
+        return response
+    
+    body = response.get_data()
+    if len(body) < MIN_SIZE:
+        return response
+    
+    etag, weak = response.get_etag()
+    response.set_data(compress_body(body, encoding, etag))
+    response.headers['Content-Encoding'] = encoding
+    # Représentation différente du même contenu : l'ETag devient faible
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app: Flask):
+    """Branche la compression sur toutes les réponses de l'application"""
+    app.after_request(compress_response)
+    logger.info(f"🗜️ Compression des réponses: {'brotli, ' if brotli else ''}gzip")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+📈 EXPORT DES MÉTRIQUES
+Route /metrics (format texte Prometheus) et durée des requêtes par route
+"""
+
+import logging
+import os
+import time
+
+from flask import Flask, Response, g, request
+
+from app.monitoring import metrics
+from app.monitoring.metrics import REGISTRY, Histogram
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+REQUEST_SECONDS = Histogram('web_request_seconds', "Durée des requêtes HTTP servies", ['endpoint', 'status'])
+
+
+def _start_timer():
+    g.metrics_started = time.perf_counter()
+
+
+def _observe_request(response: Response) -> Response:
+    started = g.pop('metrics_started', None)
+    if started is not None:
+        REQUEST_SECONDS.observe(time.perf_counter() - started,
+                                endpoint=request.endpoint or 'inconnu', status=response.status_code)
+    return response
+
+
+def metrics_view() -> Response:
+    return Response(REGISTRY.to_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def init_metrics(app: Flask):
+    """Active les métriques (sauf METRICS_ENABLED=0) et expose /metrics"""
+    
+    metrics.enable(os.getenv('METRICS_ENABLED', '1') == '1')
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+    if metrics.enabled():
+        app.before_request(_start_timer)
+        app.after_request(_observe_request)
+    logger.info(f"📈 Métriques: {'/metrics' if metrics.enabled() else 'désactivées'}")
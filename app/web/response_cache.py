@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+⚡ CACHE DES RÉPONSES DE L'API
+Cache mémoire TTL + LRU invalidé par la génération de la collection, avec ETag
+"""
+
+import functools
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import Response, make_response, request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL = 60.0
+
+# Délai minimal entre deux lectures de la génération en base
+DEFAULT_GENERATION_POLL = 1.0
+
+
+class ResponseCache:
+    """Réponses JSON sérialisées, indexées par URL et valides pour une génération"""
+    
+    def __init__(self, generation: Callable[[], int], max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: float = DEFAULT_TTL, generation_poll: float = DEFAULT_GENERATION_POLL,
+                 on_change: Optional[Callable[[int], None]] = None):
+        """
+        Args:
+            generation: Lecture de la génération courante (MongoService.get_generation)
+            max_entries: Nombre de réponses gardées (éviction LRU)
+            ttl: Durée de vie maximale d'une réponse (s)
+            generation_poll: Délai minimal entre deux lectures de la génération (s)
+            on_change: Appelé avec la nouvelle génération avant de recalculer les
+                réponses (ex. rafraîchir un index dérivé des articles)
+        """
+        self.generation = generation
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation_poll = generation_poll
+        self.on_change = on_change
+        self._entries: "OrderedDict[str, Tuple[float, bytes, str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self._checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def _sync_generation(self):
+        """Vide le cache si une sauvegarde a eu lieu depuis la dernière vérification"""
+        
+        now = time.monotonic()
+        if now - self._checked_at < self.generation_poll:
+            return
+        self._checked_at = now
+        try:
+            generation = self.generation()
+        except Exception as e:
+            # Base indisponible : on garde les réponses jusqu'à leur TTL
+            logger.warning(f"⚠️ Génération illisible: {e}")
+            return
+        if generation == self._generation:
+            return
+        if self.on_change is not None and self._generation is not None:
+            self.on_change(generation)
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+                logger.info(f"♻️ Cache API invalidé (génération {generation})")
+            self._entries.clear()
+            self._generation = generation
+    
+    @property
+    def current_generation(self) -> Optional[int]:
+        return self._generation
+    
+    def get(self, key: str) -> Optional[Tuple[bytes, str, str]]:
+        """(corps, type MIME, etag) si la réponse est en cache et encore valide"""
+        
+        self._sync_generation()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1:]
+    
+    def put(self, key: str, body: bytes, mimetype: str, generation: Optional[int] = None) -> str:
+        """
+        Met la réponse en cache et renvoie son ETag (empreinte du corps)
+        
+        Args:
+            generation: Génération lue avant le calcul de la réponse ; si une
+                sauvegarde est survenue entre-temps, la réponse n'est pas gardée
+        """
+        
+        etag = hashlib.blake2b(body, digest_size=12).hexdigest()
+        with self._lock:
+            if generation != self._generation:
+                return etag
+            self._entries[key] = (time.monotonic(), body, mimetype, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return etag
+    
+    def clear(self):
+        """Oublie les réponses et la génération (ex. nouveau processus après un fork)"""
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+            self._checked_at = 0.0
+    
+    def stats(self) -> Dict:
+        """Compteurs pour la supervision"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 3) if lookups else 0.0,
+                'not_modified': self.not_modified,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'generation': self._generation
+            }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparaison faible If-None-Match / ETag (RFC 7232), hors Flask"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(','))
+    return any(tag.removeprefix('W/').strip('"') == etag for tag in candidates)
+
+
+def cached_response(cache: ResponseCache):
+    """
+    Décorateur de vue Flask : sert la réponse depuis le cache (clé = chemin + paramètres),
+    ajoute l'ETag et répond 304 si le navigateur a déjà cette version.
+    Seules les réponses 200 sont mises en cache.
+    """
+    
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = request.full_path
+            cached = cache.get(key)
+            generation = cache.current_generation
+            if cached is not None:
+                body, mimetype, etag = cached
+                response = Response(body, mimetype=mimetype)
+            else:
+                response = view(*args, **kwargs)
+                if not isinstance(response, Response):
+                    response = make_response(response)
+                if response.status_code != 200:
+                    return response
+                etag = cache.put(key, response.get_data(), response.mimetype, generation)
+            
+            # Le navigateur revalide à chaque fois : 304 sans corps si rien n'a changé
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            response = response.make_conditional(request)
+            if response.status_code == 304:
+                cache.not_modified += 1
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+🧮 BENCHMARK - MÉMOIRE DES ARTICLES
+N articles synthétiques en dicts (ancien format), en Article (__slots__) et en
+ArticleBatch (colonnes), mémoire conservée et pic mesurés par tracemalloc
+Usage: python -m benchmarks.bench_article_memory [--records 1000000] [--excerpt-length 200]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator
+
+from app.models.article import DEFAULT_AUTHOR, LEGACY_SCRAPED_AT_FORMAT, Article, ArticleBatch
+
+CATEGORIES = ["Intelligence artificielle", "Réseaux sociaux", "Tech", "Marketing", "Emploi",
+              "Outils", "Web", "Cybersécurité", "E-commerce", "Médias"]
+WORDS = "le la de des un une pour avec sur dans nouvelle plateforme données réseau modèle outil".split()
+
+# Une page de liste = un instant de scraping partagé par ses articles
+PAGE_SIZE = 15
+
+
+def fresh(value: str) -> str:
+    """Copie distincte d'une chaîne, comme en produit le parsing HTML"""
+    return (value + ' ')[:-1]
+
+
+def fields(records: int, excerpt_length: int) -> Iterator[tuple]:
+    """Champs réalistes : titres et extraits variés, catégories répétées"""
+    start = datetime(2025, 7, 10, 11, 0)
+    for n in range(records):
+        words = [WORDS[(n * 7 + k * 3) % len(WORDS)] for k in range(12)]
+        title = f"{' '.join(words).capitalize()} n°{n}"
+        yield (
+            f"post-{n}", title, f"https://www.blogdumoderateur.com/{'-'.join(words[:8])}-{n}/",
+            "10/07/2025 à 10:58", (f"{title} — " * (excerpt_length // len(title) + 1))[:excerpt_length],
+            fresh(CATEGORIES[n % len(CATEGORIES)]), f"https://www.blogdumoderateur.com/wp-content/{n}.jpg",
+            start + timedelta(minutes=n // PAGE_SIZE)
+        )
+
+
+def build_dicts(records: int, excerpt_length: int):
+    return [
+        {
+            'id': id, 'title': title, 'url': url, 'date': date, 'excerpt': excerpt, 'category': category,
+            'image_url': image_url, 'author': DEFAULT_AUTHOR,
+            'scraped_at': scraped_at.strftime(LEGACY_SCRAPED_AT_FORMAT)
+        }
+        for id, title, url, date, excerpt, category, image_url, scraped_at in fields(records, excerpt_length)
+    ]
+
+
+def iter_articles(records: int, excerpt_length: int) -> Iterator[Article]:
+    page_at = None
+    for n, (id, title, url, date, excerpt, category, image_url, scraped_at) in enumerate(
+            fields(records, excerpt_length)):
+        if n % PAGE_SIZE == 0:
+            page_at = scraped_at
+        yield Article(id, title, url, date, excerpt, category, image_url, scraped_at=page_at)
+
+
+def build_articles(records: int, excerpt_length: int):
+    return list(iter_articles(records, excerpt_length))
+
+
+def build_batch(records: int, excerpt_length: int):
+    return ArticleBatch(iter_articles(records, excerpt_length))
+
+
+def measure(build: Callable, records: int, excerpt_length: int) -> Dict:
+    gc.collect()
+    tracemalloc.start()
+    data = build(records, excerpt_length)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    assert len(data) == records
+    del data
+    return {
+        'retained_mb': round(current / 1e6, 1),
+        'peak_mb': round(peak / 1e6, 1),
+        'bytes_per_record': round(current / records),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=1_000_000, help="Nombre d'articles")
+    parser.add_argument('--excerpt-length', type=int, default=200, help="Longueur des extraits")
+    parser.add_argument('--json', action='store_true', help="Résultats en JSON")
+    args = parser.parse_args()
+    
+    results = {
+        name: measure(build, args.records, args.excerpt_length)
+        for name, build in (('dict', build_dicts), ('article', build_articles), ('batch', build_batch))
+    }
+    
+    if args.json:
+        print(json.dumps({'records': args.records, 'results': results}, indent=2))
+        return
+    
+    baseline = results['dict']['retained_mb']
+    print(f"🧮 {args.records} articles (extraits de {args.excerpt_length} caractères)")
+    for name, result in results.items():
+        print(f"   {name:8} {result['retained_mb']:>9.1f} Mo ({result['bytes_per_record']} o/article, "
+              f"{result['retained_mb'] / baseline:.0%} des dicts), pic {result['peak_mb']:.1f} Mo")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK - SCRAPING SÉQUENTIEL VS PARALLÈLE
+Usage: python -m benchmarks.bench_concurrency [--latency 0.1] [--workers 1 4 8] [--rate 2]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from app.scraper.main_scraper import BlogScraper
+from app.scraper.rate_limiter import HostRateLimiter
+from benchmarks.stub_server import StubBlogServer
+
+
+def run(workers: int, base_url: str, max_articles: int, rate: float, burst: int, per_host: int = 4) -> float:
+    scraper = BlogScraper(base_url=base_url, max_workers=workers, per_host_limit=per_host,
+                          rate_limiter=HostRateLimiter(rate=rate, burst=burst))
+    start = time.perf_counter()
+    articles = scraper.scrape_articles(max_articles=max_articles)
+    elapsed = time.perf_counter() - start
+    assert len(articles) == max_articles, f"{len(articles)} articles récupérés"
+    return elapsed
+
+
+def run_async(per_host: int, base_url: str, max_articles: int, rate: float, burst: int) -> float:
+    from app.scraper.async_scraper import AsyncBlogScraper
+    
+    async def scrape():
+        async with AsyncBlogScraper(base_url=base_url, per_host_limit=per_host,
+                                    rate_limiter=HostRateLimiter(rate=rate, burst=burst)) as scraper:
+            return await scraper.scrape_articles(max_articles=max_articles)
+    
+    start = time.perf_counter()
+    articles = asyncio.run(scrape())
+    elapsed = time.perf_counter() - start
+    assert len(articles) == max_articles, f"{len(articles)} articles récupérés"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--latency', type=float, default=0.1, help="Latence simulée par requête (s)")
+    parser.add_argument('--articles', type=int, default=15)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--rate', type=float, default=1000.0, help="Requêtes/s autorisées par hôte")
+    parser.add_argument('--burst', type=int, default=16)
+    parser.add_argument('--per-host', type=int, default=4, help="Requêtes simultanées par hôte")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="Ajoute AsyncBlogScraper (aiohttp), sans thread, avec la même limite par hôte")
+    args = parser.parse_args()
+    
+    logging.getLogger('app').setLevel(logging.WARNING)
+    
+    with StubBlogServer(articles=args.articles, latency=args.latency) as stub:
+        print(f"🧪 {args.articles} articles, latence {args.latency}s, {args.rate} req/s par hôte")
+        for workers in args.workers:
+            elapsed = run(workers, stub.base_url, args.articles, args.rate, args.burst, args.per_host)
+            print(f"   workers={workers:<3} {elapsed:6.2f}s  ({args.articles / elapsed:6.1f} articles/s)")
+        if args.use_async:
+            elapsed = run_async(args.per_host, stub.base_url, args.articles, args.rate, args.burst)
+            print(f"   asyncio     {elapsed:6.2f}s  ({args.articles / elapsed:6.1f} articles/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK - POOL DE PARSING MULTI-PROCESSUS
+Pages/s de parsing + extraction sur les fixtures HTML : processus courant vs ParsePool
+(1 à N processus), pages transmises par mémoire partagée ou par pickle
+Usage: python -m benchmarks.bench_parse_pool [--pages 400] [--processes 1 2 4 8] [--pickle]
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from app.scraper.main_scraper import BlogScraper
+from app.scraper.parse_pool import ParsePool
+from app.scraper.parsing import ARTICLE_PAGE_STRAINER, LISTING_STRAINER
+from benchmarks.bench_parsing import load_fixture
+
+
+def comparable(results: list) -> list:
+    """Résultats sans l'instant de scraping (propre à chaque parsing)"""
+    return [
+        [{**article.to_dict(), 'scraped_at': None} for article in result] if isinstance(result, list) else result
+        for result in results
+    ]
+
+
+def run_inline(pages: list, kind: str) -> tuple:
+    scraper = BlogScraper()
+    start = time.perf_counter()
+    if kind == 'article':
+        results = [scraper._extract_excerpt(scraper._parse(page, ARTICLE_PAGE_STRAINER)) for page in pages]
+    else:
+        results = [scraper.extract_listings(scraper._parse(page, LISTING_STRAINER)) for page in pages]
+    return time.perf_counter() - start, results
+
+
+def run_pool(pages: list, kind: str, processes: int, shared: bool) -> tuple:
+    with ParsePool(processes, use_shared_memory=shared) as pool:
+        # Démarrage des processus hors mesure
+        list(pool.map_excerpts(pages[:processes]))
+        start = time.perf_counter()
+        if kind == 'article':
+            results = list(pool.map_excerpts(pages))
+        else:
+            results = list(pool.map_listings(pages))
+        return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=400)
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--kind', choices=('article', 'homepage'), default='article',
+                        help="Fixture parsée : page d'article (extrait) ou page d'accueil (liste)")
+    parser.add_argument('--pickle', action='store_true',
+                        help="Mesure aussi la transmission des pages par pickle (sans mémoire partagée)")
+    args = parser.parse_args()
+    
+    logging.getLogger('app').setLevel(logging.WARNING)
+    fixture = load_fixture(f'{args.kind}.html')
+    pages = [fixture] * args.pages
+    
+    print(f"🧪 {args.pages} pages '{args.kind}' de {len(fixture) // 1024} Ko, {os.cpu_count()} cœurs")
+    baseline, expected = run_inline(pages, args.kind)
+    print(f"   {'processus courant':<24} {baseline:6.2f}s  ({args.pages / baseline:7.1f} pages/s)")
+    
+    modes = [('mémoire partagée', True)] + ([('pickle', False)] if args.pickle else [])
+    for processes in args.processes:
+        for label, shared in modes:
+            elapsed, results = run_pool(pages, args.kind, processes, shared)
+            assert comparable(results) == comparable(expected), "résultats différents du parsing dans le processus courant"
+            print(f"   {f'pool={processes} ({label})':<24} {elapsed:6.2f}s  ({args.pages / elapsed:7.1f} pages/s, "
+                  f"x{baseline / elapsed:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK - BACKENDS DE PARSING
+Temps et mémoire de parsing + extraction par page sur les fixtures HTML
+Usage: python -m benchmarks.bench_parsing [--iterations 50]
+"""
+
+import argparse
+import logging
+import os
+import time
+import tracemalloc
+
+from bs4.builder import builder_registry
+
+from app.scraper.main_scraper import BlogScraper
+from app.scraper.parsing import ARTICLE_PAGE_STRAINER, LISTING_STRAINER, SUPPORTED_PARSERS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def measure(func, iterations: int):
+    """(ms par itération, pic mémoire en Ko d'une itération)"""
+    
+    func()  # Échauffement
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+    
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def bench_parser(parser: str, partial: bool, iterations: int, homepage: bytes, article: bytes):
+    scraper = BlogScraper(parser=parser, partial_parsing=partial)
+    
+    def listing():
+        soup = scraper._parse(homepage, LISTING_STRAINER)
+        return scraper.extract_listings(soup)
+    
+    def excerpt():
+        soup = scraper._parse(article, ARTICLE_PAGE_STRAINER)
+        return scraper._extract_excerpt(soup)
+    
+    return {
+        'homepage': measure(listing, iterations),
+        'article': measure(excerpt, iterations)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=50)
+    args = parser.parse_args()
+    
+    logging.getLogger('app').setLevel(logging.WARNING)
+    homepage = load_fixture('homepage.html')
+    article = load_fixture('article.html')
+    
+    print(f"🧪 Fixtures: accueil {len(homepage) // 1024} Ko, article {len(article) // 1024} Ko")
+    print(f"{'parser':<12} {'partiel':<8} {'accueil ms':>11} {'accueil Ko':>11} {'article ms':>11} {'article Ko':>11}")
+    for name in SUPPORTED_PARSERS:
+        if builder_registry.lookup(name) is None:
+            continue
+        for partial in (False, True):
+            r = bench_parser(name, partial, args.iterations, homepage, article)
+            print(f"{name:<12} {'oui' if partial else 'non':<8} "
+                  f"{r['homepage'][0]:>11.2f} {r['homepage'][1]:>11.0f} "
+                  f"{r['article'][0]:>11.2f} {r['article'][1]:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
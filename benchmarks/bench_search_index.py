@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK - INDEX INVERSÉ EN MÉMOIRE
+Construction, mémoire et latence des requêtes sur un corpus synthétique
+Usage: python -m benchmarks.bench_search_index [--articles 100000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+from app.search.inverted_index import InvertedIndex
+
+VOCABULARY = (
+    "intelligence artificielle réseaux sociaux marketing digital entreprise outil données plateforme "
+    "utilisateurs contenu stratégie google meta linkedin tiktok instagram emploi recrutement tech startup "
+    "fonctionnalité étude chiffres france europe sécurité cybersécurité cloud logiciel application mobile "
+    "publicité audience vidéo créateurs influence commerce ecommerce paiement banque santé éducation "
+    "formation productivité télétravail management innovation robot automatisation chatgpt openai "
+    "mistral gemini claude modèle langage recherche moteur référencement seo site web navigateur chrome"
+).split()
+CATEGORIES = ["Réseaux sociaux", "Tech", "Marketing", "IA", "Emploi", "Web", "Outils", "Médias"]
+SYLLABLES = "ba be bi bo bu ca ce ci co da de di do fa fe fi la le li lo ma me mi mo na ne ni no pa pe pi po ra re ri ro sa se si so ta te ti to va ve vi vo".split()
+
+
+def build_vocabulary(size: int, rng: random.Random):
+    """Vocabulaire métier en tête puis mots synthétiques, fréquences en loi de Zipf"""
+    words = list(dict.fromkeys(VOCABULARY))
+    while len(words) < size:
+        words.append(''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, len(words) + 1):
+        total += 1 / rank
+        cum_weights.append(total)
+    return words, cum_weights
+
+
+def synthetic_corpus(size: int, vocabulary_size: int = 30_000, seed: int = 42):
+    rng = random.Random(seed)
+    words, cum_weights = build_vocabulary(vocabulary_size, rng)
+    for n in range(size):
+        yield f'post-{n}', {
+            'id': f'post-{n}',
+            'title': ' '.join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(6, 12))),
+            'excerpt': ' '.join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(25, 45))),
+            'category': rng.choice(CATEGORIES)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--vocabulary', type=int, default=30_000)
+    args = parser.parse_args()
+    
+    tracemalloc.start()
+    index = InvertedIndex()
+    start = time.perf_counter()
+    for key, doc in synthetic_corpus(args.articles, args.vocabulary):
+        index.add(key, doc)
+    build_s = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"🧪 {len(index)} articles indexés en {build_s:.1f}s "
+          f"({len(index) / build_s:,.0f} articles/s), {current / 1024 / 1024:.0f} Mo")
+    
+    rng = random.Random(7)
+    scenarios = {
+        'un terme': lambda: rng.choice(VOCABULARY),
+        'deux termes': lambda: f"{rng.choice(VOCABULARY)} {rng.choice(VOCABULARY)}",
+        'préfixe (3 lettres)': lambda: rng.choice(VOCABULARY)[:3],
+        'terme + préfixe': lambda: f"{rng.choice(VOCABULARY)} {rng.choice(VOCABULARY)[:4]}"
+    }
+    print("   (froid = premier calcul des scores du terme, chaud = scores en cache)")
+    for name, make_query in scenarios.items():
+        queries = [make_query() for _ in range(args.queries)]
+        for label in ('froid', 'chaud'):
+            samples = []
+            for query in queries:
+                start = time.perf_counter()
+                index.search(query, limit=15)
+                samples.append((time.perf_counter() - start) * 1000)
+            samples.sort()
+            print(f"   {name:<22} {label:<6} médiane {statistics.median(samples):8.3f} ms   "
+                  f"p95 {samples[int(len(samples) * 0.95)]:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK - CRAWL DISTRIBUÉ (1 À N PROCESSUS)
+Débit du crawl selon le nombre de workers partageant la file MongoDB (mongod local requis)
+Usage: python -m benchmarks.bench_workers --mongo-uri mongodb://localhost:27017 [--processes 1 2 4] [--latency 0.1]
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.database.client_registry import get_client
+from app.database.mongo_service import COLLECTION_NAME, MongoService
+from app.database.rate_limits import RATE_LIMITS_COLLECTION_NAME
+from app.database.work_queue import WorkQueue
+from app.scraper.distributed import seed
+from benchmarks.stub_server import StubBlogServer
+from crawl_workers import run_worker
+
+BENCH_DATABASE = "bench_workers"
+
+
+def run(processes: int, options: dict) -> float:
+    service = MongoService(client=get_client(options['mongo_uri']), database_name=options['database'])
+    # Crawl complet à chaque mesure : file, articles et créneaux de débit remis à zéro
+    service.db[COLLECTION_NAME].delete_many({})
+    service.db[RATE_LIMITS_COLLECTION_NAME].delete_many({})
+    seed(WorkQueue(service.db, options['queue']), options['base_url'], reset=True)
+    
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        results = list(pool.map(run_worker, [options] * processes))
+    elapsed = time.perf_counter() - start
+    
+    saved = sum(result['saved'] for result in results)
+    assert saved == options['expected'], f"{saved}/{options['expected']} articles sauvegardés"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mongo-uri', required=True, help="mongod partagé par les processus (pas de mongomock)")
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--latency', type=float, default=0.1, help="Latence simulée par requête (s)")
+    parser.add_argument('--articles', type=int, default=200)
+    parser.add_argument('--per-page', type=int, default=10, help="Articles par page de liste")
+    parser.add_argument('--rate', type=float, default=1000.0, help="Requêtes/s par hôte, tous workers confondus")
+    parser.add_argument('--burst', type=int, default=16)
+    args = parser.parse_args()
+    
+    logging.getLogger('app').setLevel(logging.WARNING)
+    
+    with StubBlogServer(articles=args.articles, latency=args.latency, per_page=args.per_page) as stub:
+        # File et articles dans une base dédiée, jamais dans scraper_db
+        options = {
+            'mongo_uri': args.mongo_uri, 'database': BENCH_DATABASE, 'queue': 'bench_queue',
+            'base_url': stub.base_url, 'threads': 1, 'rate': args.rate, 'burst': args.burst, 'visibility_timeout': 60,
+            'max_attempts': 3, 'max_pages': args.articles // args.per_page + 1, 'max_depth': 0,
+            'follow_categories': False, 'incremental': False, 'batch_size': 20, 'flush_interval': 1.0,
+            'expected': args.articles
+        }
+        print(f"🧪 {args.articles} articles, latence {args.latency}s, {args.rate} req/s par hôte")
+        baseline = None
+        for processes in args.processes:
+            elapsed = run(processes, options)
+            # Efficacité : débit par processus rapporté à celui de la première mesure
+            baseline = baseline or elapsed * processes
+            print(f"   processus={processes:<3} {elapsed:6.2f}s  ({args.articles / elapsed:6.1f} articles/s, "
+                  f"efficacité {baseline / (elapsed * processes):4.0%})")
+
+
+if __name__ == "__main__":
+    main()
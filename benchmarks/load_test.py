@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+🔥 TEST DE CHARGE - INTERFACE WEB
+Débit (req/s) et latences p50/p95/p99 des endpoints /api/* contre un MongoDB local
+
+Usage:
+    # Serveur déjà lancé
+    python -m benchmarks.load_test --url http://localhost:8080 --duration 10 --concurrency 32
+    # Lance gunicorn (ou le serveur de dev) sur une base de test remplie d'articles synthétiques
+    python -m benchmarks.load_test --serve gunicorn --seed 5000 --mongo-uri mongodb://localhost:27018/
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import requests
+
+from benchmarks.bench_search_index import synthetic_corpus
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOAD_TEST_DATABASE = "scraper_loadtest"
+
+DEFAULT_PATHS = [
+    '/api/stats',
+    '/api/articles',
+    '/api/articles?limit=50',
+    '/api/search?q=intelligence',
+    '/api/search?q=res',
+]
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def seed_database(mongo_uri: str, database: str, count: int):
+    """Remplace le contenu de la base de test par `count` articles synthétiques"""
+    from pymongo import MongoClient
+    from app.database.mongo_service import MongoService
+    
+    client = MongoClient(mongo_uri)
+    client.drop_database(database)
+    service = MongoService(client=client, database_name=database)
+    articles = [
+        dict(doc, url=f"https://example.test/{key}/", date="1 janvier 2024")
+        for key, doc in synthetic_corpus(count)
+    ]
+    service.save_articles(articles)
+    client.close()
+    print(f"🌱 {count} articles synthétiques dans {database}")
+
+
+def start_server(kind: str, port: int, mongo_uri: str, database: str, workers: Optional[int]) -> subprocess.Popen:
+    env = dict(os.environ, PORT=str(port), MONGODB_URI=mongo_uri, MONGODB_DATABASE=database)
+    if workers:
+        env['WEB_CONCURRENCY'] = str(workers)
+    if kind == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app']
+    else:
+        command = [sys.executable, 'interface_simple.py']
+    return subprocess.Popen(command, cwd=ROOT_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_ready(url: str, process: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Le serveur s'est arrêté (code {process.returncode})")
+        try:
+            if requests.get(url + '/api/stats', timeout=1).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Serveur indisponible après {timeout}s")
+
+
+def run_load(url: str, paths: List[str], concurrency: int, duration: float, compressed: bool) -> Dict:
+    """Chaque thread enchaîne les requêtes (keep-alive) jusqu'à la fin de la durée"""
+    
+    samples: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    received = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    
+    def worker(offset: int):
+        session = requests.Session()
+        if not compressed:
+            session.headers['Accept-Encoding'] = 'identity'
+        local: Dict[str, List[float]] = defaultdict(list)
+        local_errors: Dict[str, int] = defaultdict(int)
+        local_bytes = 0
+        n = offset
+        while time.perf_counter() < deadline:
+            path = paths[n % len(paths)]
+            n += 1
+            start = time.perf_counter()
+            try:
+                response = session.get(url + path, timeout=10)
+                elapsed = (time.perf_counter() - start) * 1000
+                if response.ok:
+                    local[path].append(elapsed)
+                    local_bytes += int(response.headers.get('Content-Length', len(response.content)))
+                else:
+                    local_errors[path] += 1
+            except requests.RequestException:
+                local_errors[path] += 1
+        with lock:
+            for path, values in local.items():
+                samples[path].extend(values)
+            for path, count in local_errors.items():
+                errors[path] += count
+            received[0] += local_bytes
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    all_samples = sorted(value for values in samples.values() for value in values)
+    return {
+        'elapsed_s': elapsed,
+        'requests': len(all_samples),
+        'errors': sum(errors.values()),
+        'bytes': received[0],
+        'overall': all_samples,
+        'per_path': {path: sorted(values) for path, values in samples.items()},
+        'errors_per_path': dict(errors)
+    }
+
+
+def report(result: Dict):
+    elapsed = result['elapsed_s']
+    overall = result['overall']
+    if not overall:
+        print(f"❌ Aucune requête réussie ({result['errors']} erreurs)")
+        return
+    
+    print(f"🔥 {result['requests']} requêtes en {elapsed:.1f}s : {result['requests'] / elapsed:,.0f} req/s, "
+          f"{result['errors']} erreurs, {result['bytes'] / elapsed / 1024:,.0f} Ko/s reçus")
+    print(f"   {'toutes':<32} p50 {percentile(overall, 0.50):7.2f} ms  "
+          f"p95 {percentile(overall, 0.95):7.2f} ms  p99 {percentile(overall, 0.99):7.2f} ms")
+    for path, values in sorted(result['per_path'].items()):
+        print(f"   {path:<32} p50 {percentile(values, 0.50):7.2f} ms  "
+              f"p95 {percentile(values, 0.95):7.2f} ms  p99 {percentile(values, 0.99):7.2f} ms  "
+              f"({len(values) / elapsed:,.0f} req/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help="Serveur déjà lancé (sinon --serve)")
+    parser.add_argument('--serve', choices=['gunicorn', 'dev'], help="Lance le serveur pour la durée du test")
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--workers', type=int, help="Workers gunicorn (défaut: gunicorn.conf.py)")
+    parser.add_argument('--mongo-uri', default=os.getenv('MONGODB_URI', 'mongodb://localhost:27018/'))
+    parser.add_argument('--database', default=LOAD_TEST_DATABASE, help="Base utilisée avec --serve")
+    parser.add_argument('--seed', type=int, default=0, help="Articles synthétiques insérés dans --database")
+    parser.add_argument('--concurrency', type=int, default=16, help="Clients simultanés")
+    parser.add_argument('--duration', type=float, default=10.0, help="Durée du test (s)")
+    parser.add_argument('--warmup', type=float, default=2.0, help="Préchauffage non mesuré (s)")
+    parser.add_argument('--paths', nargs='+', default=DEFAULT_PATHS)
+    parser.add_argument('--compressed', action='store_true', help="Envoie Accept-Encoding: gzip, br")
+    args = parser.parse_args()
+    
+    if not args.url and not args.serve:
+        parser.error("--url ou --serve requis")
+    
+    process = None
+    url = (args.url or f"http://127.0.0.1:{args.port}").rstrip('/')
+    try:
+        if args.serve:
+            if args.seed:
+                seed_database(args.mongo_uri, args.database, args.seed)
+            process = start_server(args.serve, args.port, args.mongo_uri, args.database, args.workers)
+            wait_ready(url, process)
+        
+        print(f"🧪 {url} ({args.serve or 'externe'}), {args.concurrency} clients, {args.duration:.0f}s")
+        if args.warmup:
+            run_load(url, args.paths, args.concurrency, args.warmup, args.compressed)
+        report(run_load(url, args.paths, args.concurrency, args.duration, args.compressed))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+🔬 PROFILAGE HORS-LIGNE DU PIPELINE
+BlogScraper.scrape_articles puis MongoService.save_articles contre le faux blog local,
+sous cProfile ou tracemalloc (rapports par étape dans --profile-dir)
+Usage: python -m benchmarks.profile_scrape --profile cpu [--articles 200] [--mongo-uri URI]
+"""
+
+import argparse
+import json
+import logging
+
+from app.database.mongo_service import MongoService
+from app.monitoring.profiling import PROFILE_DIR, PROFILE_MODES, StageProfiler
+from app.scraper.main_scraper import BlogScraper
+from app.scraper.rate_limiter import HostRateLimiter
+from benchmarks.stub_server import StubBlogServer
+
+PROFILE_DATABASE = "scraper_profile"
+
+
+def mongo_client(mongo_uri: str):
+    if mongo_uri:
+        from pymongo import MongoClient
+        return MongoClient(mongo_uri, serverSelectionTimeoutMS=3000)
+    try:
+        import mongomock
+    except ImportError:
+        raise SystemExit("mongomock absent : installez-le ou fournissez --mongo-uri")
+    return mongomock.MongoClient()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--profile', choices=PROFILE_MODES, default='cpu')
+    parser.add_argument('--profile-dir', default=PROFILE_DIR, help="Répertoire des rapports")
+    parser.add_argument('--articles', type=int, default=100, help="Articles servis et scrapés")
+    parser.add_argument('--latency', type=float, default=0.0, help="Latence simulée du serveur (s)")
+    parser.add_argument('--mongo-uri', help="mongod local (défaut: mongomock)")
+    args = parser.parse_args()
+    
+    logging.getLogger('app').setLevel(logging.WARNING)
+    
+    profiler = StageProfiler(args.profile, args.profile_dir)
+    client = mongo_client(args.mongo_uri)
+    
+    try:
+        service = MongoService(client=client, database_name=PROFILE_DATABASE)
+        with StubBlogServer(articles=args.articles, latency=args.latency) as server:
+            # Débit non limité : on profile le code, pas la politesse
+            scraper = BlogScraper(base_url=server.base_url,
+                                  rate_limiter=HostRateLimiter(rate=10000, burst=10000))
+            with profiler.stage('scrape'):
+                articles = scraper.scrape_articles(max_articles=args.articles)
+        
+        with profiler.stage('save'):
+            service.save_articles(articles)
+    finally:
+        client.drop_database(PROFILE_DATABASE)
+        client.close()
+    
+    print(f"🔬 {len(articles)} articles, profil {args.profile}: {json.dumps(profiler.summary, ensure_ascii=False)}")
+    for path in profiler.reports:
+        print(f"   📄 {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+🧪 SERVEUR HTTP DE TEST
+Faux Blog du Modérateur local pour mesurer le scraper sans réseau
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+
+ARTICLE_TEMPLATE = """
+<article id="post-{n}" class="post">
+    <div class="post-thumbnail"><img src="{base}/img/{n}.jpg" alt=""></div>
+    <span class="favtag">Catégorie {cat}</span>
+    <div class="entry-header">
+        <a href="{base}/article-{n}/"><h3 class="entry-title">Article de test numéro {n}</h3></a>
+        <time class="entry-date" datetime="2025-07-10T10:58:00+02:00">10 juillet 2025</time>
+    </div>
+</article>
+"""
+
+PAGINATION_PATH = re.compile(r'^/page/\d+/$')
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+RECORDED_BASE_URL = "https://www.blogdumoderateur.com"
+
+LISTING_PATTERN = re.compile(r'^/(?:category/cat-(?P<category>\d+)/)?(?:page/(?P<page>\d+)/)?$')
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="fr">
+<head><meta charset="UTF-8"><meta name="description" content="{description}"><title>Article {n}</title></head>
+<body>
+<article id="post-{n}">
+    <div class="entry-content">
+        <p>{paragraph}</p>
+        <p>Deuxième paragraphe sans intérêt pour l'extrait.</p>
+    </div>
+</article>
+</body>
+</html>
+"""
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    # File d'attente large : les clients asynchrones ouvrent des dizaines de connexions d'un coup
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class StubBlogServer:
+    """Serveur local servant une page d'accueil et des pages d'articles (synthétiques ou enregistrées)"""
+    
+    def __init__(self, articles: int = 15, latency: float = 0.0, port: int = 0,
+                 per_page: int = None, categories: int = 5,
+                 jitter: float = 0.0, fixtures: bool = False, seed: int = 0):
+        """
+        Args:
+            articles: Nombre total d'articles du faux blog
+            latency: Délai ajouté à chaque réponse (s)
+            port: Port d'écoute (0 = port libre)
+            per_page: Articles par page de liste (défaut: tous sur l'accueil)
+            categories: Nombre de catégories (pages /category/cat-K/)
+            jitter: Variation aléatoire uniforme de la latence (± s)
+            fixtures: Sert les pages HTML enregistrées de benchmarks/fixtures
+            seed: Graine du tirage de la latence (mesures reproductibles)
+        """
+        self.articles = articles
+        self.per_page = per_page
+        self.categories = categories
+        self.latency = latency
+        self.jitter = jitter
+        self.fixtures = fixtures
+        self._random = random.Random(seed)
+        self._recorded = {}
+        self.requests_served = 0
+        self.not_modified_served = 0
+        self._lock = threading.Lock()
+        self._server = _StubHTTPServer(('127.0.0.1', port), self._make_handler())
+        self._thread = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def _make_handler(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                delay = server.next_delay()
+                if delay:
+                    time.sleep(delay)
+                
+                body = server.render(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                
+                payload = body.encode('utf-8')
+                etag = '"' + hashlib.md5(payload).hexdigest() + '"'
+                
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    with server._lock:
+                        server.not_modified_served += 1
+                    return
+                
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                
+                with server._lock:
+                    server.requests_served += 1
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
+    
+    def next_delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+    
+    def _recorded_page(self, name: str) -> str:
+        """Page enregistrée, liens réécrits vers ce serveur"""
+        if name not in self._recorded:
+            with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+                self._recorded[name] = f.read().replace(RECORDED_BASE_URL, self.base_url)
+        return self._recorded[name]
+    
+    def render(self, path: str):
+        """Rendu HTML d'une URL du faux blog"""
+        
+        if self.fixtures:
+            if path == '/' or PAGINATION_PATH.match(path):
+                return self._recorded_page('homepage.html')
+            return self._recorded_page('article.html')
+        
+        match = LISTING_PATTERN.match(path)
+        if match:
+            category, page = match.group('category'), int(match.group('page') or 1)
+            numbers = range(1, self.articles + 1)
+            prefix = '/'
+            if category:
+                k = int(category)
+                if k >= self.categories:
+                    return None
+                numbers = [n for n in numbers if n % self.categories == k]
+                prefix = f'/category/cat-{k}/'
+            return self._render_listing(list(numbers), page, prefix)
+        
+        if path.startswith('/article-'):
+            n = path.strip('/').split('-')[-1]
+            paragraph = f"Contenu de l'article {n}. " * 20
+            return PAGE_TEMPLATE.format(n=n, paragraph=paragraph, description=f"Description {n}")
+        
+        return None
+    
+    def _render_listing(self, numbers, page: int, prefix: str):
+        per_page = self.per_page or max(1, len(numbers))
+        pages = max(1, -(-len(numbers) // per_page))
+        if page > pages:
+            return None
+        
+        items = "".join(
+            ARTICLE_TEMPLATE.format(n=n, cat=n % self.categories, base=self.base_url)
+            for n in numbers[(page - 1) * per_page:page * per_page]
+        )
+        nav = "".join(
+            f'<a class="page-numbers" href="{prefix}page/{p}/">{p}</a>'
+            for p in range(max(2, page - 2), min(pages, page + 2) + 1)
+        )
+        menu = "".join(
+            f'<a href="/category/cat-{k}/">Catégorie {k}</a>' for k in range(self.categories)
+        )
+        return f"<!DOCTYPE html><html><body><nav>{menu}</nav><main>{items}</main><div class=\"nav-links\">{nav}</div></body></html>"
+    
+    def start(self) -> "StubBlogServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    with StubBlogServer(latency=0.05, port=8765) as stub:
+        print(f"🧪 Serveur de test: {stub.base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+📈 SUITE DE BENCHMARKS HORS-LIGNE
+Débit de scraping, parsing, extraction et sauvegarde MongoDB, résultats en JSON
+Usage: python -m benchmarks.suite [--compare benchmarks/results/<fichier>.json] [--mongo-uri URI]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from bs4.builder import builder_registry
+
+from app.scraper.main_scraper import BlogScraper
+from app.scraper.parsing import ARTICLE_PAGE_STRAINER, LISTING_STRAINER, SUPPORTED_PARSERS
+from app.scraper.rate_limiter import HostRateLimiter
+from app.utils.dates import parse_date
+from benchmarks.stub_server import FIXTURES_DIR, StubBlogServer
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+BENCH_DATABASE = "scraper_bench"
+
+
+def summarize(samples_ms: List[float]) -> Dict:
+    ordered = sorted(samples_ms)
+    return {
+        'n': len(ordered),
+        'mean_ms': statistics.fmean(ordered),
+        'median_ms': statistics.median(ordered),
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'min_ms': ordered[0]
+    }
+
+
+def time_calls(func: Callable, repeat: int, warmup: int = 1) -> Dict:
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def available_parsers() -> List[str]:
+    return [name for name in SUPPORTED_PARSERS if builder_registry.lookup(name) is not None]
+
+
+def bench_scrape(args) -> Dict:
+    """scrape_articles de bout en bout contre le serveur local (pages enregistrées)"""
+    
+    results = {}
+    with StubBlogServer(latency=args.latency, jitter=args.jitter, fixtures=True) as stub:
+        for workers in sorted({1, args.workers}):
+            def run():
+                scraper = BlogScraper(base_url=stub.base_url, max_workers=workers,
+                                      rate_limiter=HostRateLimiter(rate=10_000, burst=1_000))
+                articles = scraper.scrape_articles(max_articles=15)
+                assert len(articles) == 15, f"{len(articles)} articles récupérés"
+            
+            timing = time_calls(run, args.scrape_repeat)
+            timing['articles_per_s'] = 15 / (timing['median_ms'] / 1000)
+            results[f'workers_{workers}'] = timing
+    return results
+
+
+def bench_parse(args) -> Dict:
+    """Parsing seul, par backend, avec et sans parsing partiel"""
+    
+    pages = {
+        'homepage': (load_fixture('homepage.html'), LISTING_STRAINER),
+        'article': (load_fixture('article.html'), ARTICLE_PAGE_STRAINER)
+    }
+    results = {}
+    for parser in available_parsers():
+        for partial in (False, True):
+            scraper = BlogScraper(parser=parser, partial_parsing=partial)
+            for page, (content, strainer) in pages.items():
+                key = f"{page}.{parser}.{'partial' if partial else 'full'}"
+                results[key] = time_calls(lambda: scraper._parse(content, strainer), args.repeat)
+    return results
+
+
+def bench_extraction(args) -> Dict:
+    """Extraction seule sur des pages déjà parsées"""
+    
+    scraper = BlogScraper()
+    homepage = scraper._parse(load_fixture('homepage.html'), LISTING_STRAINER)
+    article = scraper._parse(load_fixture('article.html'), ARTICLE_PAGE_STRAINER)
+    return {
+        'listing': time_calls(lambda: scraper.extract_listings(homepage), args.repeat),
+        'excerpt': time_calls(lambda: scraper._extract_excerpt(article), args.repeat),
+        # Dates répétées servies par le cache, puis analyse complète (ISO puis français)
+        'parse_date': time_calls(lambda: scraper._parse_date('2025-07-10T10:58:00+02:00'), args.repeat),
+        'parse_date_uncached': time_calls(lambda: (parse_date.__wrapped__('2025-07-10T10:58:00+02:00'),
+                                                   parse_date.__wrapped__('10 juillet 2025')), args.repeat)
+    }
+
+
+def bench_mongo_save(args) -> Dict:
+    """save_articles (insertion puis mise à jour) sur mongod local ou mongomock"""
+    
+    from app.database.mongo_service import MongoService
+    
+    if args.mongo_uri:
+        from pymongo import MongoClient
+        client, backend = MongoClient(args.mongo_uri, serverSelectionTimeoutMS=3000), 'mongod'
+    else:
+        try:
+            import mongomock
+        except ImportError:
+            return {'skipped': "mongomock absent et --mongo-uri non fourni"}
+        client, backend = mongomock.MongoClient(), 'mongomock'
+    
+    articles = [
+        {
+            'id': f'post-{n}', 'title': f'Article {n}', 'url': f'https://example.test/article-{n}/',
+            'date': '10/07/2025 à 10:58', 'excerpt': 'x' * 250, 'category': 'Tech',
+            'image_url': '', 'author': 'Blog du Modérateur', 'scraped_at': '10/07/2025 à 11:00'
+        }
+        for n in range(args.mongo_articles)
+    ]
+    
+    try:
+        service = MongoService(client=client, database_name=BENCH_DATABASE)
+        results = {'backend': backend, 'articles': len(articles)}
+        
+        def insert():
+            service.collection.delete_many({})
+            service.save_articles(articles)
+        
+        results['insert'] = time_calls(insert, args.mongo_repeat)
+        results['upsert_unchanged'] = time_calls(lambda: service.save_articles(articles), args.mongo_repeat)
+        return results
+    except Exception as e:
+        return {'skipped': f"{backend}: {e}"}
+    finally:
+        client.drop_database(BENCH_DATABASE)
+        client.close()
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(current: Dict, baseline: Dict, prefix: str = ''):
+    """Affiche l'évolution des médianes par rapport à un fichier de référence"""
+    
+    for key, value in current.items():
+        path = f"{prefix}.{key}" if prefix else key
+        base = baseline.get(key) if isinstance(baseline, dict) else None
+        if isinstance(value, dict) and isinstance(base, dict):
+            if 'median_ms' in value and 'median_ms' in base:
+                delta = (value['median_ms'] - base['median_ms']) / base['median_ms'] * 100
+                flag = '🔴' if delta > 10 else '🟢' if delta < -10 else '⚪'
+                print(f"   {flag} {path:<45} {base['median_ms']:9.3f} -> {value['median_ms']:9.3f} ms ({delta:+.1f}%)")
+            else:
+                compare(value, base, path)
+
+
+BENCHMARKS = {
+    'scrape': bench_scrape,
+    'parse': bench_parse,
+    'extraction': bench_extraction,
+    'mongo_save': bench_mongo_save
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="Benchmarks à exécuter")
+    parser.add_argument('--repeat', type=int, default=30, help="Répétitions des micro-benchmarks")
+    parser.add_argument('--latency', type=float, default=0.05, help="Latence simulée du serveur (s)")
+    parser.add_argument('--jitter', type=float, default=0.02, help="Variation de la latence (± s)")
+    parser.add_argument('--workers', type=int, default=8, help="Workers du scénario parallèle")
+    parser.add_argument('--scrape-repeat', type=int, default=3)
+    parser.add_argument('--mongo-uri', help="mongod local (défaut: mongomock)")
+    parser.add_argument('--mongo-articles', type=int, default=1000)
+    parser.add_argument('--mongo-repeat', type=int, default=5)
+    parser.add_argument('--output', default=RESULTS_DIR, help="Répertoire des résultats JSON")
+    parser.add_argument('--compare', help="Fichier JSON de référence")
+    args = parser.parse_args()
+    
+    logging.getLogger('app').setLevel(logging.WARNING)
+    
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform()
+        },
+        'benchmarks': {}
+    }
+    
+    for name in args.only or BENCHMARKS:
+        print(f"⏱️ {name}...")
+        report['benchmarks'][name] = BENCHMARKS[name](args)
+    
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f"{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['revision']}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Résultats: {path}")
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"📊 Comparaison avec {baseline['meta']['revision']}:")
+        compare(report['benchmarks'], baseline['benchmarks'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+🐝 CRAWL DISTRIBUÉ
+File de travail MongoDB partagée par plusieurs processus (ou machines) :
+    python crawl_workers.py seed --reset          # amorce avec la page d'accueil
+    python crawl_workers.py work --processes 4    # à lancer sur autant de machines que voulu
+    python crawl_workers.py stats                 # état de la file
+    python crawl_workers.py retry-dead            # relance les éléments abandonnés
+"""
+
+import argparse
+import json
+import logging
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+from app.database.client_registry import MONGODB_URI, get_client
+from app.database.mongo_service import DATABASE_NAME, MongoService
+from app.database.rate_limits import SHARED_BURST, SHARED_RATE, MongoRateLimiter
+from app.database.work_queue import MAX_ATTEMPTS, VISIBILITY_TIMEOUT, WorkQueue
+from app.scraper.distributed import CrawlWorker, seed
+from app.scraper.main_scraper import BASE_URL, BlogScraper
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(process)d - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Crawl distribué du Blog du Modérateur (file MongoDB partagée)")
+    parser.add_argument('--mongo-uri', default=MONGODB_URI, help="MongoDB partagé par tous les workers")
+    parser.add_argument('--database', default=DATABASE_NAME, help="Base des articles et de la file")
+    parser.add_argument('--queue', default='crawl_queue', help="Collection de la file de travail")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    seed_parser = commands.add_parser('seed', help="Amorce la file avec la page d'accueil")
+    seed_parser.add_argument('--base-url', default=BASE_URL, help="Page d'accueil du crawl")
+    seed_parser.add_argument('--reset', action='store_true',
+                             help="Vide la file, la dead letter et les créneaux de débit (nouveau crawl)")
+    
+    work_parser = commands.add_parser('work', help="Traite la file jusqu'à épuisement")
+    work_parser.add_argument('--processes', type=int, default=1, help="Workers lancés sur cette machine")
+    work_parser.add_argument('--base-url', default=BASE_URL,
+                             help="Site crawlé (les liens vers d'autres hôtes sont ignorés)")
+    work_parser.add_argument('--max-pages', type=int, default=50, help="Pages de liste au total (tous workers)")
+    work_parser.add_argument('--max-depth', type=int, default=1, help="Profondeur de catégories")
+    work_parser.add_argument('--no-categories', dest='follow_categories', action='store_false',
+                             help="Ne suit que la pagination")
+    work_parser.add_argument('--incremental', action='store_true',
+                             help="N'ajoute que les articles nouveaux ou modifiés")
+    work_parser.add_argument('--batch-size', type=int, default=50, help="Articles par écriture MongoDB")
+    work_parser.add_argument('--flush-interval', type=float, default=5.0,
+                             help="Délai maximal (s) entre deux écritures MongoDB")
+    work_parser.add_argument('--rate', type=float, default=SHARED_RATE,
+                             help="Requêtes/s par hôte, tous workers confondus")
+    work_parser.add_argument('--burst', type=int, default=SHARED_BURST, help="Rafale autorisée par hôte")
+    work_parser.add_argument('--visibility-timeout', type=float, default=VISIBILITY_TIMEOUT,
+                             help="Durée (s) d'une réservation avant reprise par un autre worker")
+    work_parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS,
+                             help="Tentatives avant la dead letter")
+    work_parser.add_argument('--threads', type=int, default=1,
+                             help="Éléments réservés et pages d'articles téléchargées en parallèle par worker")
+    
+    commands.add_parser('stats', help="Éléments par état")
+    commands.add_parser('retry-dead', help="Remet la dead letter dans la file")
+    return parser.parse_args(argv)
+
+def open_queue(args, **options) -> WorkQueue:
+    service = MongoService(client=get_client(args.mongo_uri), database_name=args.database)
+    return WorkQueue(service.db, args.queue, **options)
+
+def run_worker(options: Dict) -> Dict[str, int]:
+    """Un worker dans son propre processus (client MongoDB propre au processus)"""
+    
+    service = MongoService(client=get_client(options['mongo_uri']), database_name=options['database'])
+    queue = WorkQueue(service.db, options['queue'], visibility_timeout=options['visibility_timeout'],
+                      max_attempts=options['max_attempts'])
+    limiter = MongoRateLimiter(service.db, rate=options['rate'], burst=options['burst'])
+    scraper = BlogScraper(options['base_url'], max_workers=options['threads'],
+                          rate_limiter=limiter)
+    worker = CrawlWorker(scraper, service, queue, max_pages=options['max_pages'],
+                         max_depth=options['max_depth'], follow_categories=options['follow_categories'],
+                         incremental=options['incremental'], batch_size=options['batch_size'],
+                         flush_interval=options['flush_interval'])
+    
+    def stop(signum, frame):
+        logger.info("🛑 Arrêt demandé, fin après l'élément en cours")
+        worker.stop()
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    
+    return worker.run()
+
+def work(args) -> Dict[str, int]:
+    """Lance --processes workers et agrège leurs compteurs"""
+    
+    options = {key: value for key, value in vars(args).items() if key != 'command'}
+    print(f"🐝 CRAWL DISTRIBUÉ - {args.processes} workers sur cette machine")
+    print("=" * 40)
+    
+    started = time.perf_counter()
+    if args.processes <= 1:
+        results = [run_worker(options)]
+    else:
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            futures = [pool.submit(run_worker, options) for _ in range(args.processes)]
+            results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+    
+    totals = {key: sum(result[key] for result in results) for key in results[0]}
+    totals['seconds'] = round(elapsed, 2)
+    totals['articles_per_second'] = round(totals['saved'] / elapsed, 2) if elapsed else 0.0
+    print(f"\n🎯 {json.dumps(totals, ensure_ascii=False)}")
+    return totals
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    if args.command == 'seed':
+        queue = open_queue(args)
+        if args.reset:
+            MongoRateLimiter(queue.collection.database).reset()
+        added = seed(queue, args.base_url, reset=args.reset)
+        print(f"🌱 {added} élément ajouté ({queue.stats()})")
+    elif args.command == 'work':
+        # Les workers s'arrêtent d'eux-mêmes sur SIGINT : le parent attend leurs compteurs
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        work(args)
+    elif args.command == 'stats':
+        print(json.dumps(open_queue(args).stats(), ensure_ascii=False))
+    elif args.command == 'retry-dead':
+        print(f"♻️ {open_queue(args).retry_dead()} éléments remis dans la file")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+⚙️ CONFIGURATION GUNICORN
+Lancement : gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 8080)}"
+
+# Processus x threads : les requêtes attendent surtout MongoDB (E/S)
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('WEB_THREADS', 4))
+
+# Application importée une fois dans le maître puis partagée (copy-on-write) ;
+# la connexion MongoDB est ouverte par chaque worker après le fork
+preload_app = True
+
+# Recyclage périodique des workers (limite la dérive mémoire)
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = os.getenv('WEB_ACCESS_LOG') or None
+errorlog = '-'
+loglevel = os.getenv('WEB_LOG_LEVEL', 'info')
+
+
+def post_fork(server, worker):
+    """Connexion MongoDB et index de recherche propres au worker, avant la première requête"""
+    from interface_simple import get_services
+    get_services()
+    server.log.info(f"🔌 Worker {worker.pid} connecté à MongoDB")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+⚡ INTERFACE WEB ASYNCHRONE
+Même API que interface_simple.py, servie par aiohttp + motor : une boucle asyncio
+par processus, sans thread par requête
+
+Usage:
+    python interface_async.py
+    gunicorn interface_async:create_app --worker-class aiohttp.GunicornWebWorker --workers 4 --bind 0.0.0.0:8080
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+from datetime import date, datetime
+
+from aiohttp import web
+from werkzeug.http import http_date
+
+from app.database.async_mongo_service import AsyncMongoService
+from app.monitoring import metrics
+from app.monitoring.metrics import REGISTRY
+from app.search.article_search import ArticleSearch
+from app.web.compression import COMPRESSIBLE_TYPES, MIN_SIZE, choose_encoding, compress_body
+from app.web.response_cache import ResponseCache, etag_matches
+from interface_simple import HTML_TEMPLATE, SEARCH_REFRESH_INTERVAL, date_range_args
+
+logger = logging.getLogger(__name__)
+
+# Délai entre deux lectures de la génération (invalidation du cache et de l'index)
+GENERATION_POLL = float(os.getenv('API_GENERATION_POLL', 1))
+
+MONGO = web.AppKey('mongo', AsyncMongoService)
+SEARCH = web.AppKey('search', ArticleSearch)
+CACHE = web.AppKey('cache', ResponseCache)
+
+
+def _json_default(value):
+    # Mêmes conversions que le JSON de Flask (dates au format HTTP)
+    if isinstance(value, (datetime, date)):
+        return http_date(value)
+    return str(value)
+
+
+def json_response(data, status: int = 200) -> web.Response:
+    body = json.dumps(data, default=_json_default, ensure_ascii=False).encode()
+    return web.Response(body=body, status=status, content_type='application/json')
+
+
+def cached(handler):
+    """Réponse servie depuis le cache (clé = chemin + paramètres), ETag, 304 et compression"""
+    
+    @functools.wraps(handler)
+    async def wrapper(request: web.Request) -> web.Response:
+        cache = request.app[CACHE]
+        key = request.path_qs
+        entry = cache.get(key)
+        generation = cache.current_generation
+        if entry is not None:
+            body, mimetype, etag = entry
+        else:
+            response = await handler(request)
+            if response.status != 200:
+                return response
+            body, mimetype = response.body, response.content_type
+            etag = cache.put(key, body, mimetype, generation)
+        
+        headers = {'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        encoding = ''
+        if mimetype in COMPRESSIBLE_TYPES and len(body) >= MIN_SIZE:
+            encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+        # Représentation compressée : ETag faible, comme côté Flask
+        headers['ETag'] = f'W/"{etag}"' if encoding else f'"{etag}"'
+        
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            cache.not_modified += 1
+            return web.Response(status=304, headers=headers)
+        
+        if encoding:
+            headers['Content-Encoding'] = encoding
+            body = compress_body(body, encoding, etag)
+        return web.Response(body=body, content_type=mimetype, headers=headers)
+    return wrapper
+
+
+def _page_args(request: web.Request):
+    try:
+        limit = int(request.query.get('limit', 15))
+    except ValueError:
+        limit = 15
+    return limit, request.query.get('cursor') or None
+
+
+async def index(request: web.Request) -> web.Response:
+    return web.Response(text=HTML_TEMPLATE, content_type='text/html')
+
+
+@cached
+async def api_stats(request: web.Request) -> web.Response:
+    return json_response(await request.app[MONGO].get_stats())
+
+
+@cached
+async def api_articles(request: web.Request) -> web.Response:
+    limit, cursor = _page_args(request)
+    try:
+        since, until = date_range_args(request.query)
+        return json_response(await request.app[MONGO].get_articles_page(limit, cursor, since, until))
+    except ValueError as e:
+        return json_response({'error': str(e)}, status=400)
+
+
+@cached
+async def api_search(request: web.Request) -> web.Response:
+    query = request.query.get('q', '')
+    limit, cursor = _page_args(request)
+    try:
+        if not query:
+            return json_response(await request.app[MONGO].get_articles_page(limit, cursor))
+        return json_response(await request.app[SEARCH].search_page_async(query, limit, cursor))
+    except ValueError as e:
+        return json_response({'error': str(e)}, status=400)
+
+
+async def api_cache_stats(request: web.Request) -> web.Response:
+    return json_response(request.app[CACHE].stats())
+
+
+async def api_metrics(request: web.Request) -> web.Response:
+    return web.Response(text=REGISTRY.to_prometheus(), content_type='text/plain', charset='utf-8',
+                        headers={'Cache-Control': 'no-cache'})
+
+
+async def _watch_generation(app: web.Application, state: dict):
+    """Suit la génération en base : index de recherche rafraîchi puis cache invalidé"""
+    while True:
+        try:
+            generation = await app[MONGO].get_generation()
+            if generation != state['generation']:
+                if state['generation'] is not None:
+                    await app[SEARCH].refresh_async(force=True)
+                state['generation'] = generation
+        except Exception as e:
+            logger.warning(f"⚠️ Génération illisible: {e}")
+        await asyncio.sleep(GENERATION_POLL)
+
+
+async def _services(app: web.Application):
+    """Connexion motor, index de recherche et cache, créés dans la boucle du worker"""
+    
+    service = await AsyncMongoService.create()
+    engine = ArticleSearch(service, refresh_interval=SEARCH_REFRESH_INTERVAL)
+    await engine.refresh_async(force=True)
+    
+    state = {'generation': await service.get_generation()}
+    app[MONGO] = service
+    app[SEARCH] = engine
+    app[CACHE] = ResponseCache(
+        lambda: state['generation'],
+        max_entries=int(os.getenv('API_CACHE_MAX_ENTRIES', 256)),
+        ttl=float(os.getenv('API_CACHE_TTL', 60)),
+        generation_poll=0
+    )
+    watcher = asyncio.create_task(_watch_generation(app, state))
+    
+    yield
+    
+    watcher.cancel()
+    service.close()
+
+
+async def create_app() -> web.Application:
+    """Fabrique d'application (aussi utilisée par aiohttp.GunicornWebWorker)"""
+    metrics.enable(os.getenv('METRICS_ENABLED', '1') == '1')
+    app = web.Application()
+    app.cleanup_ctx.append(_services)
+    app.router.add_get('/', index)
+    app.router.add_get('/api/stats', api_stats)
+    app.router.add_get('/api/articles', api_articles)
+    app.router.add_get('/api/search', api_search)
+    app.router.add_get('/api/cache/stats', api_cache_stats)
+    app.router.add_get('/metrics', api_metrics)
+    return app
+
+
+if __name__ == '__main__':
+    port = int(os.getenv('PORT', 8080))
+    print(f"⚡ Interface Web asynchrone")
+    print(f"📱 URL: http://localhost:{port}")
+    print("-" * 40)
+    web.run_app(create_app(), host='0.0.0.0', port=port, access_log=None)
@@ -7,12 +7,24 @@ Interface Flask optimisée - 15 articles avec dates lisibles
 from flask import Flask, render_template_string, request, jsonify
 from flask_cors import CORS
 import os
+import threading
+from typing import Dict, Tuple
 
 # Import du service MongoDB depuis le nouveau chemin
+from app.database.client_registry import pool_stats
 from app.database.mongo_service import MongoService
+from app.search.article_search import ArticleSearch
+from app.utils.dates import parse_date
+from app.web.compression import init_compression
+from app.web.metrics import init_metrics
+from app.web.response_cache import ResponseCache, cached_response
 
 app = Flask(__name__)
 CORS(app)
+# Compression gzip/brotli des réponses
+init_compression(app)
+# Métriques Prometheus sur /metrics (METRICS_ENABLED=0 pour désactiver)
+init_metrics(app)
 
 # Template HTML compact
 HTML_TEMPLATE = """
@@ -41,6 +53,8 @@ HTML_TEMPLATE = """
         .article-category { background: #667eea; color: white; padding: 4px 8px; border-radius: 3px; font-size: 12px; display: inline-block; margin-bottom: 10px; }
         .loading { text-align: center; color: #667eea; font-size: 18px; padding: 40px; }
         .no-results { text-align: center; color: #666; padding: 40px; }
+        .more { text-align: center; margin: 20px 0; }
+        .more button { padding: 10px 24px; border: none; border-radius: 25px; background: #667eea; color: white; font-size: 15px; cursor: pointer; }
         @media (max-width: 768px) { 
             .articles { grid-template-columns: 1fr; }
             .stats { flex-direction: column; }
@@ -65,10 +79,19 @@ HTML_TEMPLATE = """
         <div id="articles-container" class="articles">
             <div class="loading">⏳ Chargement des articles...</div>
         </div>
+        
+        <div class="more">
+            <button id="load-more" style="display: none">⬇️ Charger plus</button>
+        </div>
     </div>
     
     <script>
         let allArticles = [];
+        let firstCursor = null;
+        let searchTimer = null;
+        let searchSeq = 0;
+        // Liste affichée : requête courante ('' = derniers articles) et curseur de la page suivante
+        let current = { query: '', articles: [], cursor: null };
         
         // Chargement initial
         document.addEventListener('DOMContentLoaded', function() {
@@ -77,9 +100,12 @@ HTML_TEMPLATE = """
             
             // Recherche
             document.getElementById('search-input').addEventListener('input', function() {
-                const query = this.value.toLowerCase();
-                filterArticles(query);
+                const query = this.value.trim();
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(() => filterArticles(query), 150);
             });
+            
+            document.getElementById('load-more').addEventListener('click', loadMore);
         });
         
         async function loadStats() {
@@ -93,11 +119,29 @@ HTML_TEMPLATE = """
             }
         }
         
+        function pageUrl(query, cursor) {
+            const params = new URLSearchParams({ limit: 15 });
+            if (query) params.set('q', query);
+            if (cursor) params.set('cursor', cursor);
+            return (query ? '/api/search?' : '/api/articles?') + params;
+        }
+        
+        function showPage(query, articles, cursor) {
+            current = { query: query, articles: articles, cursor: cursor };
+            if (!query) {
+                // Liste non filtrée gardée pour revenir instantanément d'une recherche
+                allArticles = articles;
+                firstCursor = cursor;
+            }
+            displayArticles(articles);
+            document.getElementById('load-more').style.display = cursor ? 'inline-block' : 'none';
+        }
+        
         async function loadArticles() {
             try {
-                const response = await fetch('/api/articles');
-                allArticles = await response.json();
-                displayArticles(allArticles);
+                const response = await fetch(pageUrl('', null));
+                const page = await response.json();
+                showPage('', page.articles, page.next_cursor);
             } catch (error) {
                 console.error('Erreur articles:', error);
                 document.getElementById('articles-container').innerHTML = 
@@ -105,19 +149,37 @@ HTML_TEMPLATE = """
             }
         }
         
-        function filterArticles(query) {
+        async function loadMore() {
+            const seq = searchSeq;
+            try {
+                const response = await fetch(pageUrl(current.query, current.cursor));
+                const page = await response.json();
+                if (seq === searchSeq) {
+                    showPage(current.query, current.articles.concat(page.articles), page.next_cursor);
+                }
+            } catch (error) {
+                console.error('Erreur pagination:', error);
+            }
+        }
+        
+        async function filterArticles(query) {
             if (!query) {
-                displayArticles(allArticles);
+                searchSeq++;
+                showPage('', allArticles, firstCursor);
                 return;
             }
             
-            const filtered = allArticles.filter(article => 
-                article.title.toLowerCase().includes(query) ||
-                article.excerpt.toLowerCase().includes(query) ||
-                article.category.toLowerCase().includes(query)
-            );
-            
-            displayArticles(filtered);
+            // Recherche serveur (index en mémoire), réponses obsolètes ignorées
+            const seq = ++searchSeq;
+            try {
+                const response = await fetch(pageUrl(query, null));
+                const page = await response.json();
+                if (seq === searchSeq) {
+                    showPage(query, page.articles, page.next_cursor);
+                }
+            } catch (error) {
+                console.error('Erreur recherche:', error);
+            }
         }
         
         function displayArticles(articles) {
@@ -149,34 +211,100 @@ HTML_TEMPLATE = """
 </html>
 """
 
-# Service MongoDB
-mongo_service = MongoService()
+# Index de recherche en mémoire, rafraîchi avec les nouveaux articles
+SEARCH_REFRESH_INTERVAL = float(os.getenv('SEARCH_REFRESH_INTERVAL', 30))
+
+# Services du processus courant : MongoClient n'est pas fork-safe, chaque worker
+# (gunicorn) obtient donc son propre client partagé (registre) après le fork
+_services: Dict = {}
+_services_lock = threading.Lock()
+
+def get_services() -> Tuple[MongoService, ArticleSearch]:
+    """(MongoService, ArticleSearch) du processus courant, créés à la demande"""
+    pid = os.getpid()
+    if _services.get('pid') != pid:
+        with _services_lock:
+            if _services.get('pid') != pid:
+                # Sans accès réseau : le client se connecte en arrière-plan, l'index de
+                # recherche se construit dans un thread (MongoDB répond en attendant)
+                service = MongoService()
+                engine = ArticleSearch(service, refresh_interval=SEARCH_REFRESH_INTERVAL)
+                threading.Thread(target=engine.refresh, kwargs={'force': True}, daemon=True).start()
+                api_cache.clear()
+                _services.update(pid=pid, mongo=service, search=engine)
+    return _services['mongo'], _services['search']
+
+# Cache des réponses de l'API, vidé dès qu'une sauvegarde incrémente la génération
+api_cache = ResponseCache(
+    lambda: get_services()[0].get_generation(),
+    max_entries=int(os.getenv('API_CACHE_MAX_ENTRIES', 256)),
+    ttl=float(os.getenv('API_CACHE_TTL', 60)),
+    on_change=lambda generation: get_services()[1].refresh(force=True)
+)
 
 @app.route('/')
 def index():
     return render_template_string(HTML_TEMPLATE)
 
 @app.route('/api/stats')
+@cached_response(api_cache)
 def api_stats():
+    mongo_service, _ = get_services()
     stats = mongo_service.get_stats()
     return jsonify(stats)
 
+def _page_args():
+    """Paramètres de pagination communs : limit et cursor (opaque)"""
+    return request.args.get('limit', 15, type=int), request.args.get('cursor') or None
+
+def date_range_args(args) -> Tuple:
+    """Plage de publication (since, until) : ISO 8601 ou date française ; ValueError si illisible"""
+    bounds = []
+    for name in ('since', 'until'):
+        value = args.get(name) or None
+        parsed = parse_date(value)
+        if value and parsed is None:
+            raise ValueError(f"Date invalide pour {name}: {value!r}")
+        bounds.append(parsed)
+    return tuple(bounds)
+
 @app.route('/api/articles')
+@cached_response(api_cache)
 def api_articles():
-    articles = mongo_service.get_articles(15)
-    return jsonify(articles)
+    limit, cursor = _page_args()
+    mongo_service, _ = get_services()
+    try:
+        return jsonify(mongo_service.get_articles_page(limit, cursor, *date_range_args(request.args)))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
 @app.route('/api/search')
+@cached_response(api_cache)
 def api_search():
     query = request.args.get('q', '')
-    articles = mongo_service.search_articles(query)
-    return jsonify(articles)
+    limit, cursor = _page_args()
+    mongo_service, search_engine = get_services()
+    try:
+        if not query:
+            return jsonify(mongo_service.get_articles_page(limit, cursor))
+        return jsonify(search_engine.search_page(query, limit, cursor))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/cache/stats')
+def api_cache_stats():
+    return jsonify(api_cache.stats())
+
+@app.route('/api/pool/stats')
+def api_pool_stats():
+    return jsonify(pool_stats())
 
 if __name__ == '__main__':
-    # Port sûr pour éviter ERR_UNSAFE_PORT
-    port = 8080
+    # Serveur de développement ; en production : gunicorn -c gunicorn.conf.py wsgi:app
+    port = int(os.getenv('PORT', 8080))
     print(f"🚀 Interface Web - Articles Réorganisés")
     print(f"📱 URL: http://localhost:{port}")
     print("📊 15 articles avec dates lisibles")
     print("-" * 40)
-    app.run(host='0.0.0.0', port=port, debug=True)
+    get_services()
+    app.run(host='0.0.0.0', port=port, debug=os.getenv('FLASK_DEBUG') == '1')
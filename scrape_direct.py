@@ -1,74 +1,328 @@
 #!/usr/bin/env python3
 """
-🎯 SCRAPER DIRECT - SANS BOUCLE
-Exécution directe du scraping + MongoDB
+🎯 SCRAPER DIRECT
+Exécution directe du scraping + MongoDB, ou en continu avec --schedule
 """
 
+import argparse
+import asyncio
+import json
+import signal
 import sys
 import os
 from datetime import datetime
 import logging
+from typing import Optional
 
 # Configuration des imports
-from app.scraper.main_scraper import BlogScraper
+from app.scraper.main_scraper import BASE_URL, BlogScraper
+from app.scraper.crawler import BlogCrawler
+from app.scraper.http_cache import HTTPCache
+from app.scraper.parse_pool import ParsePool
+from app.scraper.checkpoint import CHECKPOINT_EVERY_PAGES, CrawlCheckpoint, FileCheckpointStore
+from app.scraper.scheduler import MAX_INTERVAL, MIN_INTERVAL, ScrapeScheduler
+from app.database.client_registry import pool_stats
 from app.database.mongo_service import MongoService
+from app.database.article_sink import ArticleSink
+from app.database.crawl_checkpoints import MongoCheckpointStore, checkpoint_name
+from app.database.scrape_runs import MongoLease
+from app.monitoring import metrics
+from app.monitoring.metrics import REGISTRY
+from app.monitoring.profiling import PROFILE_DIR, PROFILE_MODES, StageProfiler, maybe_stage, should_profile
+from app.utils.dates import format_date
+
+# Cache HTTP conditionnel partagé entre les exécutions
+HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', '.http_cache')
+HTTP_CACHE_MAX_BYTES = int(os.getenv('HTTP_CACHE_MAX_BYTES', 50 * 1024 * 1024))
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scraping direct du Blog du Modérateur vers MongoDB")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Ne récupère et ne sauvegarde que les articles nouveaux ou modifiés")
+    parser.add_argument('--crawl', action='store_true',
+                        help="Parcourt les archives (pagination + catégories) au lieu de la seule page d'accueil")
+    parser.add_argument('--max-pages', type=int, default=50, help="Pages de liste visitées en mode crawl")
+    parser.add_argument('--max-depth', type=int, default=1, help="Profondeur de catégories en mode crawl")
+    parser.add_argument('--max-articles', type=int, default=15, help="Budget total d'articles")
+    parser.add_argument('--resume', action='store_true',
+                        help="Reprend le dernier crawl interrompu ; aucun article déjà en base n'est re-téléchargé")
+    parser.add_argument('--checkpoint-file', metavar='FICHIER',
+                        help="Points de reprise du crawl dans ce fichier (collection crawl_checkpoints sinon)")
+    parser.add_argument('--checkpoint-every', type=int, default=CHECKPOINT_EVERY_PAGES, metavar='N',
+                        help="Point de reprise toutes les N pages de liste en mode crawl")
+    parser.add_argument('--batch-size', type=int, default=50, help="Articles par écriture MongoDB")
+    parser.add_argument('--flush-interval', type=float, default=5.0,
+                        help="Délai maximal (s) entre deux écritures MongoDB")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="Scraper aiohttp + MongoDB motor (page d'accueil uniquement)")
+    parser.add_argument('--metrics', action='store_true',
+                        help="Mesure chaque étape (HTTP, parsing, extraction, MongoDB) et affiche un résumé JSON")
+    parser.add_argument('--metrics-output', metavar='FICHIER',
+                        help="Écrit aussi le résumé JSON des métriques dans ce fichier")
+    parser.add_argument('--profile', choices=PROFILE_MODES, default=os.getenv('SCRAPER_PROFILE') or None,
+                        help="Profile le scraping puis la sauvegarde : cpu (cProfile) ou mem (tracemalloc)")
+    parser.add_argument('--profile-dir', default=PROFILE_DIR, help="Répertoire des rapports de profilage")
+    parser.add_argument('--profile-sample', type=int, default=int(os.getenv('SCRAPER_PROFILE_SAMPLE', 1)),
+                        metavar='N', help="Ne profile qu'une exécution sur N (tirage aléatoire)")
+    parser.add_argument('--parse-processes', type=int, default=int(os.getenv('SCRAPER_PARSE_PROCESSES', 0)),
+                        metavar='N', help="Parse les pages d'articles dans N processus (0 : processus courant)")
+    parser.add_argument('--base-url', default=BASE_URL,
+                        help="Page d'accueil à scraper (ex. serveur de test des benchmarks)")
+    parser.add_argument('--schedule', action='store_true',
+                        help="Mode continu : exécutions incrémentales répétées, intervalle adaptatif")
+    parser.add_argument('--min-interval', type=float, default=MIN_INTERVAL,
+                        help="Intervalle minimal (s) entre deux exécutions en mode --schedule")
+    parser.add_argument('--max-interval', type=float, default=MAX_INTERVAL,
+                        help="Intervalle maximal (s), atteint tant que la page d'accueil ne change pas")
+    parser.add_argument('--max-runs', type=int, help="Arrête le mode --schedule après N exécutions")
+    args = parser.parse_args(argv)
+    if args.use_async and args.crawl:
+        parser.error("--async ne prend pas en charge --crawl")
+    if args.use_async and args.parse_processes:
+        parser.error("--async ne prend pas en charge --parse-processes")
+    if args.schedule and (args.use_async or args.crawl):
+        parser.error("--schedule suit la page d'accueil en mode synchrone (sans --async ni --crawl)")
+    return args
+
+async def scrape_async(args) -> bool:
+    """Variante asyncio : téléchargements concurrents, écritures motor par lots"""
+    
+    from app.database.async_mongo_service import AsyncMongoService
+    from app.scraper.async_scraper import AsyncBlogScraper
+    
+    mongo_service = await AsyncMongoService.create()
+    known_lookup = mongo_service.get_known_articles if args.incremental else None
+    scraped = 0
+    ok = True
+    batch = []
+    
+    try:
+        async with AsyncBlogScraper(args.base_url) as scraper:
+            async for article in scraper.iter_articles(args.max_articles, known_lookup):
+                batch.append(article)
+                scraped += 1
+                if len(batch) >= args.batch_size:
+                    ok = await mongo_service.save_articles(batch) and ok
+                    batch = []
+        if batch:
+            ok = await mongo_service.save_articles(batch) and ok
+    finally:
+        mongo_service.close()
+    
+    if not scraped:
+        print("✅ Aucun article nouveau ou modifié" if args.incremental else "❌ Aucun article récupéré")
+        return ok
+    print(f"✅ {scraped} articles scrapés")
+    print("✅ Sauvegarde réussie" if ok else "❌ Erreur de sauvegarde")
+    return ok
+
+def report_metrics(output=None):
+    """Résumé JSON des métriques de l'exécution (durées en secondes)"""
+    
+    summary = json.dumps(REGISTRY.summary(), indent=2, ensure_ascii=False)
+    print("\n📈 MÉTRIQUES:")
+    print(summary)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(summary + '\n')
+        print(f"💾 Métriques écrites dans {output}")
+
+def main(argv=None):
     """Exécution directe du scraping"""
     
-    print("🚀 SCRAPING DIRECT - 15 ARTICLES")
+    args = parse_args(argv)
+    if args.metrics or args.metrics_output:
+        metrics.enable()
+    profiler = None
+    if args.profile and args.use_async:
+        logger.warning("⚠️ Profilage non disponible en mode --async, ignoré")
+    elif args.profile and should_profile(args.profile_sample):
+        profiler = StageProfiler(args.profile, args.profile_dir)
+    
+    try:
+        if args.schedule:
+            schedule(args)
+        else:
+            run(args, profiler)
+    finally:
+        if metrics.enabled():
+            report_metrics(args.metrics_output)
+        if profiler is not None and profiler.reports:
+            print(f"\n🔬 PROFIL ({args.profile}): {json.dumps(profiler.summary, ensure_ascii=False)}")
+            for path in profiler.reports:
+                print(f"   📄 {path}")
+
+def schedule(args):
+    """Mode continu : une exécution à la fois, jusqu'à SIGINT/SIGTERM"""
+    
+    print(f"⏰ SCRAPING PLANIFIÉ - intervalle {args.min_interval:.0f}s à {args.max_interval:.0f}s")
+    print("=" * 40)
+    
+    mongo_service = MongoService()
+    if not mongo_service.ping():
+        print("❌ MongoDB injoignable")
+        return
+    scraper = build_scraper(args)
+    scheduler = ScrapeScheduler(scraper, mongo_service, max_articles=args.max_articles,
+                                min_interval=args.min_interval, max_interval=args.max_interval)
+    
+    def stop(signum, frame):
+        logger.info("🛑 Arrêt demandé, fin après l'exécution en cours")
+        scheduler.stop()
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    
+    try:
+        scheduler.run_forever(max_runs=args.max_runs)
+    finally:
+        close_scraper(scraper)
+        mongo_service.close()
+
+def build_scraper(args) -> BlogScraper:
+    """Scraper avec cache HTTP et, si demandé, pool de parsing multi-processus"""
+    
+    http_cache = HTTPCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES)
+    if args.parse_processes <= 0:
+        return BlogScraper(args.base_url, http_cache=http_cache)
+    # Deux téléchargements par processus de parsing : tous les cœurs restent occupés
+    return BlogScraper(args.base_url, max_workers=args.parse_processes * 2, http_cache=http_cache,
+                       parse_pool=ParsePool(args.parse_processes, base_url=args.base_url))
+
+def close_scraper(scraper: Optional[BlogScraper]):
+    if scraper is None:
+        return
+    if scraper.http_cache is not None:
+        scraper.http_cache.close()
+    if scraper.parse_pool is not None:
+        scraper.parse_pool.close()
+
+def run(args, profiler: Optional[StageProfiler] = None):
+    """Scraping puis sauvegarde (synchrone ou asyncio selon --async)"""
+    
+    print(f"🚀 SCRAPING DIRECT - {args.max_articles} ARTICLES")
     print("=" * 40)
     
+    if args.use_async:
+        try:
+            asyncio.run(scrape_async(args))
+        except Exception as e:
+            print(f"❌ Erreur: {e}")
+            logger.error(f"Erreur critique: {e}")
+        return
+    
+    scraper = None
     try:
         # 1. Initialisation
         print("📡 Initialisation du scraper...")
-        scraper = BlogScraper()
+        scraper = build_scraper(args)
         mongo_service = MongoService()
-        
-        # 2. Scraping
-        print("🔍 Scraping en cours...")
-        articles = scraper.scrape_articles(max_articles=15)
-        
-        if not articles:
-            print("❌ Aucun article récupéré")
+        # Client partagé créé sans attendre le réseau : on vérifie avant de scraper
+        if not mongo_service.ping():
+            print("❌ MongoDB injoignable")
             return
-        
-        print(f"✅ {len(articles)} articles scrapés")
-        
-        # 3. Sauvegarde MongoDB
-        print("💾 Sauvegarde dans MongoDB...")
-        success = mongo_service.save_articles(articles)
-        
-        if success:
-            print("✅ Sauvegarde réussie")
-        else:
-            print("❌ Erreur de sauvegarde")
+        # Même verrou que le mode --schedule : deux exécutions (cron, planificateur) ne se chevauchent pas
+        lease = MongoLease(mongo_service.db)
+        if not lease.acquire():
+            print(f"⏭️ Exécution déjà en cours ({(lease.holder() or {}).get('owner', '?')})")
             return
-        
-        # 4. Vérification
-        print("🔍 Vérification...")
-        saved_articles = mongo_service.get_articles(15)
-        print(f"📊 Articles en base: {len(saved_articles)}")
-        
-        # 5. Aperçu
-        print("\n📖 PREMIERS ARTICLES:")
-        for i, article in enumerate(articles[:3], 1):
-            print(f"{i}. {article['title'][:50]}...")
-            print(f"   📅 {article['date']}")
-            print(f"   🏷️ {article['category']}")
-        
-        print("\n🎯 SCRAPING TERMINÉ AVEC SUCCÈS!")
-        print("💡 Utilisez 'python src/web/interface.py' pour l'interface")
-        
-        mongo_service.close()
+        with lease.hold():
+            scrape_and_save(args, scraper, mongo_service, profiler)
         
     except Exception as e:
         print(f"❌ Erreur: {e}")
         logger.error(f"Erreur critique: {e}")
+    finally:
+        close_scraper(scraper)
+
+def crawl_checkpoint(args, mongo_service: MongoService, sink: ArticleSink,
+                     profiler: Optional[StageProfiler] = None) -> Optional[CrawlCheckpoint]:
+    """Points de reprise du crawl ; un crawl sans --resume repart de l'accueil"""
+    
+    if profiler is not None:
+        # Scraping entièrement en mémoire avant la sauvegarde : un point de reprise mentirait
+        logger.warning("⚠️ Points de reprise désactivés pendant le profilage")
+        return None
+    if args.checkpoint_file:
+        store = FileCheckpointStore(args.checkpoint_file)
+    else:
+        store = MongoCheckpointStore(mongo_service.db, checkpoint_name(args.base_url))
+    # Articles produits avant un point de reprise : écrits en base avant lui
+    checkpoint = CrawlCheckpoint(store, every_pages=args.checkpoint_every,
+                                 persist=lambda: sink.flush() and sink.ok)
+    if not args.resume:
+        checkpoint.clear()
+    return checkpoint
+
+def scrape_and_save(args, scraper: BlogScraper, mongo_service: MongoService,
+                    profiler: Optional[StageProfiler] = None):
+    """Scraping, sauvegarde par lots, vérification et aperçu"""
+    
+    # 2. Scraping + 3. Sauvegarde MongoDB au fil de l'eau
+    print("🔍 Scraping en cours (sauvegarde par lots)...")
+    # Reprise : les articles déjà en base (donc inchangés) ne sont pas re-téléchargés
+    known_lookup = mongo_service.get_known_articles if args.incremental or args.resume else None
+    sink = ArticleSink(mongo_service, batch_size=args.batch_size, flush_interval=args.flush_interval)
+    if args.crawl:
+        crawler = BlogCrawler(scraper, max_pages=args.max_pages, max_depth=args.max_depth,
+                              max_articles=args.max_articles)
+        source = crawler.iter_articles(known_lookup=known_lookup,
+                                       checkpoint=crawl_checkpoint(args, mongo_service, sink, profiler))
+    else:
+        source = scraper.iter_articles(max_articles=args.max_articles, known_lookup=known_lookup)
+    
+    if profiler is not None:
+        # Profils distincts : tout le scraping d'abord, puis la sauvegarde par lots
+        with profiler.stage('scrape'):
+            source = list(source)
+    
+    preview = []
+    scraped = 0
+    with maybe_stage(profiler, 'save'), sink:
+        for article in source:
+            sink.add(article)
+            scraped += 1
+            if len(preview) < 3:
+                preview.append(article)
+    
+    if not scraped:
+        if args.incremental or args.resume:
+            print("✅ Aucun article nouveau ou modifié")
+        else:
+            print("❌ Aucun article récupéré")
+        mongo_service.close()
+        return
+    
+    print(f"✅ {scraped} articles scrapés")
+    
+    if sink.ok:
+        print(f"✅ Sauvegarde réussie ({sink.saved} articles)")
+    else:
+        print(f"❌ Erreur de sauvegarde ({sink.failed_batches} lots en échec)")
+        return
+    
+    # 4. Vérification
+    print("🔍 Vérification...")
+    saved_articles = mongo_service.get_articles(15)
+    print(f"📊 Articles en base: {len(saved_articles)}")
+    pool = pool_stats()
+    print(f"🔌 Pool MongoDB: {pool['connections_created']} connexions, {pool['checked_out']} emprunts, "
+          f"attente moyenne {pool['avg_checkout_wait_ms']} ms")
+    
+    # 5. Aperçu
+    print("\n📖 PREMIERS ARTICLES:")
+    for i, article in enumerate(preview, 1):
+        print(f"{i}. {article.title[:50]}...")
+        print(f"   📅 {format_date(article.published_at, article.date)}")
+        print(f"   🏷️ {article.category}")
+    
+    print("\n🎯 SCRAPING TERMINÉ AVEC SUCCÈS!")
+    print("💡 Utilisez 'python src/web/interface.py' pour l'interface")
+    
+    mongo_service.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,16 @@
+"""Fixtures communes : MongoDB simulé (mongomock), aucun serveur requis"""
+
+import mongomock
+import pytest
+
+from app.database.mongo_service import MongoService
+
+
+@pytest.fixture
+def mongo_client():
+    return mongomock.MongoClient()
+
+
+@pytest.fixture
+def service(mongo_client):
+    return MongoService(client=mongo_client, database_name="test_db")
@@ -0,0 +1,122 @@
+"""Points de reprise du crawl : enregistrement périodique puis reprise après un arrêt brutal"""
+
+import pytest
+
+from app.database.article_sink import ArticleSink
+from app.database.crawl_checkpoints import MongoCheckpointStore, checkpoint_name
+from app.scraper.checkpoint import CrawlCheckpoint, FileCheckpointStore
+from app.scraper.crawler import BlogCrawler
+from app.scraper.main_scraper import BlogScraper
+from app.scraper.rate_limiter import HostRateLimiter
+from benchmarks.stub_server import StubBlogServer
+
+ARTICLES = 40
+
+
+@pytest.fixture
+def stub():
+    with StubBlogServer(articles=ARTICLES, per_page=5) as server:
+        yield server
+
+
+@pytest.fixture(params=['file', 'mongo'])
+def store(request, tmp_path, service, stub):
+    if request.param == 'file':
+        return FileCheckpointStore(str(tmp_path / "checkpoint.json"))
+    return MongoCheckpointStore(service.db, checkpoint_name(stub.base_url))
+
+
+def crawl(stub, service, store, fetched, stop_after=None, failing=(), max_articles=ARTICLES):
+    """
+    Un crawl pagination seule ; stop_after simule un arrêt brutal après N articles,
+    failing liste les pages de liste (chemins) dont le téléchargement échoue
+    """
+    # Serveur local : pas de politesse à respecter
+    scraper = BlogScraper(stub.base_url, rate_limiter=HostRateLimiter(rate=10_000, burst=100))
+    fetch_excerpt = scraper.fetch_excerpt
+    
+    def counting_fetch(url):
+        fetched.append(url)
+        return fetch_excerpt(url)
+    
+    fetch_listing = scraper.fetch_listing
+    
+    def flaky_listing(url):
+        if any(url.endswith(path) for path in failing):
+            raise ConnectionError(f"{url} injoignable")
+        return fetch_listing(url)
+    
+    scraper.fetch_excerpt = counting_fetch
+    scraper.fetch_listing = flaky_listing
+    crawler = BlogCrawler(scraper, max_pages=20, max_depth=0, max_articles=max_articles)
+    sink = ArticleSink(service, batch_size=1000, flush_interval=3600)
+    checkpoint = CrawlCheckpoint(store, every_pages=2, persist=lambda: sink.flush() and sink.ok)
+    articles = crawler.iter_articles(known_lookup=service.get_known_articles, checkpoint=checkpoint)
+    
+    for count, article in enumerate(articles, 1):
+        sink.add(article)
+        if count == stop_after:
+            # Arrêt sans sauvegarde finale : les articles en attente sont perdus
+            articles.close()
+            return checkpoint
+    sink.flush()
+    return checkpoint
+
+
+def test_interrupted_crawl_resumes_from_checkpoint(stub, service, store):
+    first, second = [], []
+    checkpoint = crawl(stub, service, store, first, stop_after=23)
+    
+    assert checkpoint.saved > 0
+    state = store.load()
+    saved_before = service.collection.count_documents({})
+    assert saved_before == state['count'] < 23
+    
+    crawl(stub, service, store, second)
+    
+    assert service.collection.count_documents({}) == ARTICLES
+    # Seuls les articles absents de la base sont re-téléchargés
+    assert len(second) == ARTICLES - saved_before
+    assert not set(second) & set(first[:saved_before])
+    # Crawl terminé : le point de reprise est effacé
+    assert store.load() is None
+
+
+def test_checkpoint_of_another_site_is_ignored(stub, service, store):
+    store.save({'base_url': "https://ailleurs.example/", 'pages': 3, 'count': 15})
+    fetched = []
+    
+    crawl(stub, service, store, fetched)
+    
+    assert len(fetched) == ARTICLES
+
+
+def test_failed_listing_page_is_kept_for_resume(stub, service, store):
+    first, second = [], []
+    crawl(stub, service, store, first, failing=("/page/3/",))
+    
+    # Page en échec : point de reprise conservé, avec la page à revisiter
+    state = store.load()
+    assert state is not None
+    assert [entry[2] for entry in state['frontier']] == [f"{stub.base_url}/page/3/"]
+    assert service.collection.count_documents({}) < ARTICLES
+    
+    crawl(stub, service, store, second)
+    
+    assert service.collection.count_documents({}) == ARTICLES
+    assert len(first) + len(second) == ARTICLES
+    assert store.load() is None
+
+
+
+def test_crawl_stopped_by_budget_keeps_checkpoint(stub, service, store):
+    first, second = [], []
+    crawl(stub, service, store, first, max_articles=12)
+    
+    assert service.collection.count_documents({}) == 12
+    assert store.load()['count'] == 12
+    
+    crawl(stub, service, store, second)
+    
+    assert service.collection.count_documents({}) == ARTICLES
+    assert len(second) == ARTICLES - 12
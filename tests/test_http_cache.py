@@ -0,0 +1,150 @@
+"""Cache HTTP conditionnel : revalidation (304), changement de version, écriture de l'index"""
+
+import gc
+import os
+import weakref
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from app.scraper import http_cache
+from app.scraper.http_cache import INDEX_FILE, CachingAdapter, HTTPCache
+
+
+class FakeSite:
+    """Serveur simulé sous l'adapter : une version (ETag, corps) par URL"""
+    
+    def __init__(self):
+        self.pages = {}
+        self.requests = []
+    
+    def send(self, adapter, request, **kwargs):
+        self.requests.append(request)
+        etag, body = self.pages[request.url]
+        response = Response()
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict({'ETag': etag, 'Content-Type': 'text/html; charset=utf-8'})
+        if request.headers.get('If-None-Match') == etag:
+            response.status_code = 304
+            response._content = b''
+        else:
+            response.status_code = 200
+            response._content = body
+        return response
+
+
+@pytest.fixture
+def site(monkeypatch):
+    site = FakeSite()
+    monkeypatch.setattr(HTTPAdapter, 'send', lambda adapter, request, **kwargs: site.send(adapter, request, **kwargs))
+    return site
+
+
+def make_session(cache: HTTPCache) -> requests.Session:
+    session = requests.Session()
+    session.mount('https://', CachingAdapter(cache))
+    return session
+
+
+def test_unchanged_page_is_revalidated_and_served_from_cache(site, tmp_path):
+    url = "https://example.com/article/"
+    site.pages[url] = ('"v1"', b"<p>v1</p>")
+    session = make_session(HTTPCache(str(tmp_path)))
+    
+    first = session.get(url)
+    second = session.get(url)
+    
+    assert first.from_cache is False
+    assert site.requests[1].headers['If-None-Match'] == '"v1"'
+    assert second.status_code == 200
+    assert second.from_cache is True
+    assert second.content == b"<p>v1</p>"
+
+
+def test_changed_page_replaces_entry_and_drops_annotations(site, tmp_path):
+    url = "https://example.com/article/"
+    cache = HTTPCache(str(tmp_path))
+    session = make_session(cache)
+    site.pages[url] = ('"v1"', b"<p>v1</p>")
+    session.get(url)
+    cache.annotate(url, 'excerpt', "extrait v1")
+    
+    site.pages[url] = ('"v2"', b"<p>v2</p>")
+    response = session.get(url)
+    
+    assert response.from_cache is False
+    assert response.content == b"<p>v2</p>"
+    assert cache.get(url)['etag'] == '"v2"'
+    assert cache.annotation(url, 'excerpt') is None
+
+
+def test_index_written_in_batches_and_on_close(site, tmp_path):
+    cache = HTTPCache(str(tmp_path), flush_every=3, flush_interval=3600)
+    session = make_session(cache)
+    index_path = tmp_path / INDEX_FILE
+    for number in range(4):
+        site.pages[f"https://example.com/{number}/"] = (f'"{number}"', b"x" * 10)
+    
+    for number in range(2):
+        session.get(f"https://example.com/{number}/")
+    assert not index_path.exists()
+    
+    session.get("https://example.com/2/")
+    assert index_path.exists()
+    
+    session.get("https://example.com/3/")
+    cache.close()
+    reloaded = HTTPCache(str(tmp_path))
+    assert len(reloaded._entries) == 4
+    assert reloaded.total_bytes == 40
+
+
+def test_bodies_missing_from_index_are_removed_on_load(site, tmp_path):
+    cache = HTTPCache(str(tmp_path), flush_every=100, flush_interval=3600)
+    session = make_session(cache)
+    site.pages["https://example.com/1/"] = ('"1"', b"x" * 10)
+    session.get("https://example.com/1/")
+    
+    # Arrêt brutal : l'index n'a jamais été écrit
+    reloaded = HTTPCache(str(tmp_path))
+    
+    assert reloaded.total_bytes == 0
+    assert [name for name in os.listdir(tmp_path) if name != INDEX_FILE] == []
+
+
+def test_not_modified_without_cached_body_is_refetched(site, tmp_path):
+    url = "https://example.com/article/"
+    site.pages[url] = ('"v1"', b"<p>v1</p>")
+    cache = HTTPCache(str(tmp_path))
+    session = make_session(cache)
+    session.get(url)
+    os.remove(tmp_path / cache.get(url)['key'])
+    
+    response = session.get(url)
+    
+    # 304 reçu pour un corps disparu : requête renvoyée sans condition
+    assert response.status_code == 200
+    assert response.content == b"<p>v1</p>"
+    assert 'If-None-Match' not in site.requests[-1].headers
+    assert cache.get(url) is not None
+
+
+def test_open_caches_are_flushed_at_exit_without_being_kept_alive(site, tmp_path):
+    kept = HTTPCache(str(tmp_path / "kept"), flush_every=100, flush_interval=3600)
+    site.pages["https://example.com/1/"] = ('"1"', b"x")
+    make_session(kept).get("https://example.com/1/")
+    dropped = weakref.ref(HTTPCache(str(tmp_path / "dropped")))
+    closed = HTTPCache(str(tmp_path / "closed"))
+    closed.close()
+    
+    gc.collect()
+    http_cache._flush_open_caches()
+    
+    assert dropped() is None
+    assert closed not in http_cache._open_caches
+    assert (tmp_path / "kept" / INDEX_FILE).exists()
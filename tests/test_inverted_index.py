@@ -0,0 +1,23 @@
+"""Index inversé BM25 : requêtes à plusieurs mots"""
+
+from app.search.inverted_index import InvertedIndex
+
+
+def make_index() -> InvertedIndex:
+    index = InvertedIndex()
+    index.add("post-1", {'title': "Python pour les débutants", 'excerpt': "Apprendre Python", 'category': "Tech"})
+    index.add("post-2", {'title': "Marketing digital", 'excerpt': "Réseaux sociaux", 'category': "Marketing"})
+    return index
+
+
+def test_multi_word_query_matches_all_words():
+    results = make_index().search("python debutants")
+    
+    assert [doc['title'] for _, doc in results] == ["Python pour les débutants"]
+
+
+def test_multi_word_query_with_unknown_word_returns_nothing():
+    index = make_index()
+    
+    assert index.search("inconnu python") == []
+    assert index.search("python inconnu") == []
@@ -0,0 +1,17 @@
+"""Métriques : une sous-classe incomplète échoue à la création, pas à l'export"""
+
+import pytest
+
+from app.monitoring.metrics import Metric, Registry
+
+
+def test_incomplete_metric_cannot_be_instantiated():
+    class NoSummary(Metric):
+        def samples(self):
+            return []
+    
+    registry = Registry()
+    with pytest.raises(TypeError):
+        NoSummary("incomplete_total", "Sans résumé", registry=registry)
+    # Rien n'est enregistré : l'export du registre reste possible
+    assert registry.summary() == {}
@@ -0,0 +1,84 @@
+"""Vues en liste de MongoService : champs renvoyés et pagination keyset"""
+
+from datetime import datetime, timezone
+
+from app.database.mongo_service import INDEX_RETRY_INTERVAL
+from app.models.article import Article
+
+# Champs lus par l'interface (interface_simple.py) et les clients de l'API
+LIST_KEYS = {'_id', 'id', 'title', 'url', 'excerpt', 'category', 'date', 'date_formatted',
+             'published_at', 'author', 'image_url'}
+
+
+def make_article(number: int, published_at: datetime) -> Article:
+    return Article(
+        id=f"post-{number}", title=f"Article {number}", url=f"https://example.com/{number}/",
+        date="1 janvier 2024", excerpt=f"Extrait {number}", category="Tech",
+        image_url=f"https://example.com/{number}.jpg", author="Auteur", published_at=published_at
+    )
+
+
+def test_list_payload_keys(service):
+    service.save_articles([make_article(1, datetime(2024, 1, 1, tzinfo=timezone.utc))])
+    
+    article, = service.get_articles(10)
+    
+    assert LIST_KEYS <= set(article)
+    assert article['image_url'] == "https://example.com/1.jpg"
+
+
+def test_search_payload_keys(service):
+    service.save_articles([make_article(1, datetime(2024, 1, 1, tzinfo=timezone.utc))])
+    # Recherche par regex : mongomock n'implémente pas $text
+    service.text_search = False
+    
+    article, = service.search_articles("Article")
+    
+    assert LIST_KEYS <= set(article)
+
+
+def test_keyset_paging_across_equal_published_at(service):
+    same_day = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    articles = [make_article(number, same_day) for number in range(7)]
+    articles.append(make_article(7, datetime(2023, 12, 31, tzinfo=timezone.utc)))
+    service.save_articles(articles)
+    
+    seen, cursor = [], None
+    while True:
+        page = service.get_articles_page(limit=3, cursor=cursor)
+        seen += [article['id'] for article in page['articles']]
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+    
+    # Ni doublon ni oubli à la frontière entre pages de même date, le plus ancien en dernier
+    assert len(seen) == len(set(seen)) == 8
+    assert seen[-1] == "post-7"
+
+
+def test_indexes_cover_publication_and_save_order(service):
+    indexes = service.collection.index_information()
+    
+    assert indexes['published_at_id']['key'] == [('published_at', -1), ('_id', -1)]
+    # iter_articles_since et get_stats trient sur saved_at
+    assert indexes['saved_at_id']['key'] == [('saved_at', -1), ('_id', -1)]
+
+
+def test_index_creation_backs_off_while_mongo_is_unreachable(service, monkeypatch):
+    attempts = []
+    
+    def unreachable():
+        attempts.append(1)
+        raise ConnectionError("serveur injoignable")
+    
+    monkeypatch.setattr(service, '_ensure_indexes', unreachable)
+    service.get_stats()
+    service.get_stats()
+    assert len(attempts) == 1
+    
+    # Intervalle écoulé : nouvel essai, puis plus aucun une fois les index en place
+    monkeypatch.setattr(service, '_indexes_failed_at', service._indexes_failed_at - INDEX_RETRY_INTERVAL)
+    monkeypatch.setattr(service, '_ensure_indexes', lambda: attempts.append(2))
+    service.get_stats()
+    service.get_stats()
+    assert attempts == [1, 2]
@@ -0,0 +1,115 @@
+"""File de travail partagée : réservations, expiration, reprise et dead letter"""
+
+import threading
+import time
+
+import pytest
+
+from app.database.work_queue import DONE, LEASED, PENDING, WorkQueue
+from app.models.article import Article
+from app.scraper.distributed import CrawlWorker, article_item
+from app.scraper.main_scraper import BlogScraper
+
+
+@pytest.fixture
+def db(mongo_client):
+    return mongo_client["test_db"]
+
+
+def make_item(number: int) -> dict:
+    listing = Article(id=f"post-{number}", title=f"Article {number}", url=f"https://example.com/{number}/")
+    return article_item(listing)
+
+
+def test_claimed_item_is_invisible_to_other_workers(db):
+    queue = WorkQueue(db, visibility_timeout=60)
+    queue.enqueue([make_item(1)])
+    
+    assert queue.claim("a")['owner'] == "a"
+    assert queue.claim("b") is None
+
+
+def test_expired_lease_is_reclaimed_and_old_owner_cannot_complete(db):
+    queue = WorkQueue(db, visibility_timeout=0)
+    queue.enqueue([make_item(1)])
+    first = queue.claim("a")
+    
+    second = queue.claim("b")
+    
+    assert second['_id'] == first['_id']
+    assert second['attempts'] == 2
+    assert queue.complete([first], "a") == 0
+    assert queue.complete([second], "b") == 1
+    assert queue.stats()[DONE] == 1
+
+
+def test_extend_keeps_lease_until_it_is_lost(db):
+    queue = WorkQueue(db, visibility_timeout=60)
+    queue.enqueue([make_item(1)])
+    item = queue.claim("a")
+    
+    assert queue.extend(item, "a")
+    assert not queue.extend(item, "b")
+
+
+def test_failed_item_is_retried_then_dead_lettered(db):
+    queue = WorkQueue(db, visibility_timeout=60, max_attempts=2, retry_base_delay=0)
+    queue.enqueue([make_item(1)])
+    
+    assert queue.fail(queue.claim("a"), "a", "HTTP 500") is False
+    assert queue.stats()[PENDING] == 1
+    assert queue.fail(queue.claim("a"), "a", "HTTP 500") is True
+    assert queue.stats() == {PENDING: 0, LEASED: 0, DONE: 0, 'dead': 1}
+    
+    assert queue.retry_dead() == 1
+    assert queue.claim("a")['attempts'] == 1
+
+
+def test_dead_letter_requires_owning_the_lease(db):
+    queue = WorkQueue(db, visibility_timeout=0, max_attempts=1)
+    queue.enqueue([make_item(1)])
+    stale = queue.claim("a")
+    queue.claim("b")
+    
+    # La réservation de a a expiré et b traite l'élément : a ne peut pas l'abandonner
+    assert queue.fail(stale, "a", "timeout") is False
+    assert queue.stats()['dead'] == 0
+    assert queue.stats()[LEASED] == 1
+
+
+def test_worker_fetches_claimed_articles_in_parallel(service, monkeypatch):
+    queue = WorkQueue(service.db, visibility_timeout=60, max_attempts=1)
+    queue.enqueue([make_item(number) for number in range(4)])
+    scraper = BlogScraper("https://example.com/", max_workers=4)
+    barrier = threading.Barrier(4, timeout=2)
+    
+    def fetch_excerpt(url):
+        # Ne passe que si les quatre téléchargements sont en cours en même temps
+        barrier.wait()
+        return f"Extrait de {url}"
+    
+    monkeypatch.setattr(scraper, 'fetch_excerpt', fetch_excerpt)
+    stats = CrawlWorker(scraper, service, queue, owner="a").run(max_items=4)
+    
+    assert stats['saved'] == 4
+    assert queue.drained()
+    assert service.collection.count_documents({'excerpt': {'$regex': '^Extrait'}}) == 4
+
+
+def test_worker_renews_lease_during_slow_fetch(service, monkeypatch):
+    queue = WorkQueue(service.db, visibility_timeout=0.3)
+    queue.enqueue([make_item(1)])
+    scraper = BlogScraper("https://example.com/")
+    stolen = []
+    
+    def slow_fetch(url):
+        time.sleep(0.5)
+        # Délai de visibilité dépassé, mais réservation prolongée : personne d'autre ne la prend
+        stolen.append(queue.claim("b"))
+        return "Extrait"
+    
+    monkeypatch.setattr(scraper, 'fetch_excerpt', slow_fetch)
+    stats = CrawlWorker(scraper, service, queue, owner="a").run(max_items=1)
+    
+    assert stolen == [None]
+    assert stats['saved'] == 1
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+🚀 POINT D'ENTRÉE WSGI
+Service de production de l'interface web : gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from interface_simple import app
+
+# Nom attendu par la plupart des serveurs WSGI
+application = app